@@ -140,9 +140,14 @@ def _import_entrypoint_from_github( project_location, git_ref = None ):
             return _import_entrypoint_from_zipfile(
                 project_location, archive_location )
     archive_location.parent.mkdir( parents = True, exist_ok = True )
+    # Retrieval is conditional and replaces archive only if it changed.
+    inode = (
+        archive_location.stat( ).st_ino if archive_location.is_file( )
+        else None )
     github_retrieve_zipball( 'emcd/python-devshim', git_ref, archive_location )
     return _import_entrypoint_from_zipfile(
-        project_location, archive_location, force = True )
+        project_location, archive_location,
+        force = inode != archive_location.stat( ).st_ino )
 
 # Note: Cannot use 'importlib' machinery with Zip archives for several reasons:
 #       * 'zipimport' on Python 3.7 has broken support for the Zip format. For
@@ -229,18 +234,34 @@ def github_retrieve_zipball( repository_qname, git_ref, destination ):
 def http_retrieve_url( url, destination, headers = None ):
     ''' Retrieves URL into destination via Hypertext Transfer Protocol.
 
-        The destination must be a :py:class:`pathlib.Path` object. '''
+        The destination must be a :py:class:`pathlib.Path` object. If it was
+        retrieved before, then the request is conditioned upon validators
+        from the previous response and only the modification time of the
+        destination is updated, if the server reports it as not modified.
+        Otherwise, the response is streamed into a partial file, from the end
+        of which a later attempt resumes, if the connection drops. '''
+    from http.client import HTTPException as HttpException
     from random import random
+    from socket import timeout as SocketTimeout
     from time import sleep
     from urllib.error import HTTPError as HttpError
     from urllib.request import Request as HttpRequest
     headers = headers or { }
     request = HttpRequest( url, headers = headers )
+    _http_condition_request( request, destination )
     scribe = _acquire_scribe( )
     attempts_count_max = 2
     for attempts_count in range( attempts_count_max + 1 ):
         try: return _http_retrieve_url( request, destination )
+        except ( ConnectionError, HttpException, SocketTimeout ):
+            scribe.error( f"Connection failed during retrieval from {url!r}." )
+            if attempts_count_max == attempts_count: raise
+            sleep( 2 ** attempts_count + 2 * random( ) ) # nosec: B311
+            continue
         except HttpError as exc:
+            if 304 == exc.code:                     # Not Modified
+                destination.touch( )
+                return destination
             scribe.error( f"Failed to retrieve data from {url!r}." )
             # Exponential backoff with collision-breaking jitter.
             backoff_time = 2 ** attempts_count + 2 * random( ) # nosec: B311
@@ -251,6 +272,10 @@ def http_retrieve_url( url, destination, headers = None ):
                     return http_retrieve_url( url, destination, headers )
                 raise
             if 404 == exc.code: raise               # Not Found
+            if 416 == exc.code:                     # Range Not Satisfiable
+                _http_discard_partial_file( destination )
+                if attempts_count_max == attempts_count: raise
+                continue
             if 429 == exc.code:                     # Too Many Requests
                 backoff_time = float(
                     exc.headers.get( 'Retry-After', backoff_time ) )
@@ -263,15 +288,86 @@ def http_retrieve_url( url, destination, headers = None ):
     raise RuntimeError(
         'Wut? Unexpectedly fell out of HTTP retrieval retry loop.' )
 
+def _http_condition_range( request, destination ):
+    from json import loads
+    for header_name in ( 'Range', 'If-range' ):
+        request.remove_header( header_name )
+    location = destination.with_name( f"{destination.name}.partial" )
+    try: offset = location.stat( ).st_size
+    except OSError: return 0
+    validators_location = location.with_name( f"{location.name}.validators" )
+    try:
+        validators = loads(
+            validators_location.read_text( encoding = 'utf-8' ) )
+    except ( OSError, ValueError ): validators = { }
+    validator = validators.get( 'etag', '' )
+    if validator.startswith( 'W/' ): validator = ''
+    validator = validator or validators.get( 'last-modified' )
+    if not offset or not validator:
+        _http_discard_partial_file( destination )
+        return 0
+    request.add_header( 'Range', f"bytes={offset}-" )
+    request.add_header( 'If-Range', validator )
+    return offset
+
+def _http_condition_request( request, destination ):
+    from json import loads
+    if not destination.is_file( ): return
+    location = destination.with_name( f"{destination.name}.validators" )
+    try: validators = loads( location.read_text( encoding = 'utf-8' ) )
+    except ( OSError, ValueError ): return
+    for name, header_name in (
+        ( 'etag', 'If-None-Match' ),
+        ( 'last-modified', 'If-Modified-Since' ),
+    ):
+        if name in validators:
+            request.add_header( header_name, validators[ name ] )
+
+def _http_record_validators( destination, headers ):
+    from json import dumps
+    location = destination.with_name( f"{destination.name}.validators" )
+    validators = {
+        name: headers[ name ] for name in ( 'etag', 'last-modified' )
+        if name in headers }
+    try:
+        if validators:
+            location.write_text( dumps( validators ), encoding = 'utf-8' )
+        elif location.exists( ): location.unlink( )
+    except OSError: pass # Validators are only an optimization.
+
+def _http_discard_partial_file( destination ):
+    location = destination.with_name( f"{destination.name}.partial" )
+    for location_ in (
+        location, location.with_name( f"{location.name}.validators" )
+    ):
+        try: location_.unlink( )
+        except FileNotFoundError: pass
+
 def _http_retrieve_url( request, destination ):
     from contextlib import ExitStack as ContextStack
+    from http.client import IncompleteRead
+    from os import replace
     from urllib.request import urlopen as access_url
+    partial_location = destination.with_name( f"{destination.name}.partial" )
+    offset = _http_condition_range( request, destination )
     contexts = ContextStack( )
     with contexts:
         # nosemgrep: python.lang.security.audit.dynamic-urllib-use-detected
         http_reader = contexts.enter_context( access_url( request ) )
-        file = contexts.enter_context( destination.open( 'wb' ) )
-        file.write( http_reader.read( ) )
+        if 206 != getattr( http_reader, 'status', None ): offset = 0
+        if not offset:
+            _http_record_validators( partial_location, http_reader.headers )
+        size = 0
+        with partial_location.open( 'ab' if offset else 'wb' ) as file:
+            for chunk in iter( lambda: http_reader.read( 1 << 16 ), b'' ):
+                file.write( chunk )
+                size += len( chunk )
+        expected_size = http_reader.headers.get( 'Content-Length' )
+        if expected_size and int( expected_size ) > size:
+            raise IncompleteRead( b'', int( expected_size ) - size )
+        replace( partial_location, destination )
+        _http_record_validators( destination, http_reader.headers )
+        _http_discard_partial_file( destination )
         return destination
 
 
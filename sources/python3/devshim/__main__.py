@@ -59,6 +59,33 @@ def add_environment_entry( parts, value ):
     return name
 
 
+def answer_from_tasks_manifest( project_location ):
+    ''' Answers task listing or completion request from tasks manifest.
+
+        Only bare listing requests and completion requests are answered.
+        The manifest must be current with respect to the task sources.
+
+        Returns exit code or ``None``, if the request should be handled by
+        the full command-line interface instead. '''
+    from sys import argv
+    arguments = argv[ 1 : ]
+    if arguments in ( [ '--list' ], [ '-l' ] ): words = None
+    elif arguments[ : 2 ] == [ '--complete', '--' ]: words = arguments[ 2 : ]
+    else: return None
+    from json import load
+    # NOTE: Similar derivation exists in 'locations.py'.
+    location = project_location.joinpath(
+        '.local', 'caches', __package__, 'tasks.json' )
+    try:
+        with location.open( encoding = 'utf-8' ) as file:
+            manifest = load( file )
+    except ( OSError, ValueError ): return None
+    if calculate_tasks_digest( ) != manifest.get( 'digest' ): return None
+    if None is words: render_tasks_listing( manifest[ 'listing' ] )
+    else: render_completion_candidates( manifest, words )
+    return 0
+
+
 def ascertain_package_discovery_location( ):
     ''' Ascertains location from which our package is discoverable. '''
     # TODO: Consider cases where '__file__' may not be set.
@@ -66,6 +93,97 @@ def ascertain_package_discovery_location( ):
     return Path( __file__ ).parent.parent
 
 
+def calculate_tasks_digest( ):
+    ''' Calculates digest of sources of tasks package.
+
+        Also covers package version and Python version. '''
+    from hashlib import sha256
+    from pathlib import Path
+    from sys import version_info
+    package_location = Path( __file__ ).parent
+    hasher = sha256( )
+    hasher.update( repr( tuple( version_info[ : 2 ] ) ).encode( ) )
+    locations = (
+        package_location / '__init__.py',
+        *sorted( ( package_location / 'tasks' ).rglob( '*.py' ) ) )
+    for location in locations:
+        hasher.update( b'\0' )
+        hasher.update(
+            str( location.relative_to( package_location ) ).encode( ) )
+        hasher.update( b'\0' )
+        hasher.update( location.read_bytes( ) )
+    return hasher.hexdigest( )
+
+
+def dispatch_to_daemon( project_location ):
+    ''' Dispatches command to daemon for project, if enabled.
+
+        The daemon is enabled by setting the package-specific 'DAEMON'
+        environment variable to 'on'. Setting it to 'stop' stops the daemon.
+        Only supported on POSIX platforms.
+
+        Returns exit code of command or ``None``, if the command should be
+        executed in the current process instead. '''
+    from os import environ as current_process_environment, name as os_class
+    if 'posix' != os_class: return None
+    mode = current_process_environment.get(
+        '_'.join( map( str.upper, ( __package__, 'daemon' ) ) ), '' )
+    if mode not in ( 'on', 'stop' ): return None
+    from socket import AF_UNIX, SOCK_STREAM, socket as Socket
+    # NOTE: Similar derivation exists in 'daemon.py'.
+    location = project_location.joinpath(
+        '.local', 'state', __package__, 'daemon.socket' )
+    with Socket( AF_UNIX, SOCK_STREAM ) as connection:
+        try: connection.connect( str( location ) )
+        except OSError: return 0 if 'stop' == mode else None
+        if 'stop' == mode:
+            _send_daemon_message( connection, dict( command = 'stop' ) )
+            return 0
+        from os import getcwd
+        from sys import argv, stderr, stdout
+        stdout.flush( ); stderr.flush( )
+        _send_daemon_message(
+            connection,
+            dict(
+                argv = argv, command = 'run', cwd = getcwd( ),
+                environment = dict( current_process_environment ) ),
+            descriptors = ( 0, 1, 2 ) )
+        reader = connection.makefile( 'r', encoding = 'utf-8' )
+        return _await_daemon_reply( reader )
+
+
+def _await_daemon_reply( reader ):
+    ''' Awaits exit code from daemon, forwarding keyboard interrupts. '''
+    from json import loads
+    from os import kill
+    from signal import SIGINT
+    pid = None
+    while True:
+        try: line = reader.readline( )
+        except KeyboardInterrupt:
+            if None is not pid: kill( pid, SIGINT )
+            continue
+        if not line: return 1 if pid else None # Unexpected hangup.
+        reply = loads( line )
+        status = reply[ 'status' ]
+        if 'started' == status: pid = reply[ 'pid' ]
+        elif 'exited' == status: return reply[ 'code' ]
+        else: return None # Declined or stale.
+
+
+def _send_daemon_message( connection, message, descriptors = ( ) ):
+    ''' Sends message, along with any file descriptors, to daemon. '''
+    from array import array
+    from json import dumps
+    from socket import SCM_RIGHTS, SOL_SOCKET
+    data = ( dumps( message ) + '\n' ).encode( 'utf-8' )
+    ancillary_data = (
+        [ ( SOL_SOCKET, SCM_RIGHTS, array( 'i', descriptors ) ) ]
+        if descriptors else [ ] )
+    sent_size = connection.sendmsg( [ data ], ancillary_data )
+    if sent_size < len( data ): connection.sendall( data[ sent_size : ] )
+
+
 def ensure_sanity( project_location = None ):
     ''' Ensures dependency installation. '''
     from pathlib import Path
@@ -89,6 +207,11 @@ def ensure_sanity( project_location = None ):
 
 def main( project_location = None ):
     ''' Entrypoint for development activity. '''
+    if None is not project_location:
+        exit_code = answer_from_tasks_manifest( project_location )
+        if None is exit_code:
+            exit_code = dispatch_to_daemon( project_location )
+        if None is not exit_code: raise SystemExit( exit_code )
     package_discovery_manager, packages_cache_manager = (
         ensure_sanity( project_location = project_location ) )
     from contextlib import ExitStack as CMStack
@@ -97,9 +220,95 @@ def main( project_location = None ):
         contexts.enter_context( packages_cache_manager )
         from .user_interface import enhance
         enhance( )
-        from invoke import Collection, Program
+        from os import environ as current_process_environment
         from . import tasks
-        Program( namespace = Collection.from_module( tasks ) ).run( )
+        runner_name = current_process_environment.get(
+            '_'.join( map( str.upper, ( __package__, 'tasks', 'runner' ) ) ) )
+        if 'invoke' == runner_name: from .tasks._invoke import run
+        else: from .tasks.dispatcher import run
+
+        def execute( argv = None ): run( tasks.namespace, argv )
+
+        if None is not project_location:
+            from .tasks.manifest import record_manifest
+            record_manifest( tasks.namespace )
+            from .daemon import spawn_conditionally
+            spawn_conditionally( execute )
+        execute( )
+
+
+def render_columns( pairs ):
+    ''' Renders pairs of names and help lines in columns, as Invoke does.
+
+        Help lines are wrapped to fit the width of the terminal. '''
+    from os import get_terminal_size
+    from sys import stdout
+    from textwrap import TextWrapper
+    try: columns_count = get_terminal_size( stdout.fileno( ) ).columns
+    except ( AttributeError, OSError, ValueError ): columns_count = 80
+    name_width = max( len( name ) for name, _ in pairs )
+    indent, padding = '  ', '   '
+    wrapper = TextWrapper( width = (
+        columns_count - name_width - len( indent ) - len( padding ) - 1 ) )
+    for name, help_line in pairs:
+        help_chunks = wrapper.wrap( help_line or '' )
+        specifier = f"{indent}{name.ljust( name_width )}{padding}"
+        if not help_chunks:
+            print( specifier.rstrip( ) )
+            continue
+        print( specifier + help_chunks[ 0 ] )
+        for chunk in help_chunks[ 1 : ]:
+            print( ' ' * len( specifier ) + chunk )
+    print( '' )
+
+
+def render_completion_candidates( manifest, words ):
+    ''' Renders candidates for completion of words after program name.
+
+        Emulates the completion logic of Invoke. '''
+    from shlex import split as split_tokens
+    tokens = split_tokens( ' '.join( words ) )
+    contexts = manifest[ 'contexts' ]
+    names = { }
+    for name, aliases in manifest[ 'names' ]:
+        names[ name ] = name
+        names.update( dict.fromkeys( aliases, name ) )
+    # Scripts pass the whole command, including the program name.
+    if tokens and not tokens[ 0 ].startswith( '-' ) and (
+        tokens[ 0 ] not in names
+    ): tokens = tokens[ 1 : ]
+    if not tokens or not tokens[ -1 ].startswith( '-' ):
+        _render_task_names( manifest )
+        return
+    context = contexts[ '' ]
+    tokens_iterator = iter( tokens[ : -1 ] )
+    for token in tokens_iterator:
+        if token in names: context = contexts[ names[ token ] ]
+        elif token in context[ 'valued' ]: next( tokens_iterator, None )
+    tail = tokens[ -1 ]
+    if tail in context[ 'known' ]:
+        if tail not in context[ 'valued' ]: _render_task_names( manifest )
+    elif tail.startswith( '--' ):
+        for name in context[ 'names' ]:
+            if name.startswith( '--' ): print( name )
+    elif '-' == tail:
+        for name in context[ 'names' ]: print( name )
+
+
+def _render_task_names( manifest ):
+    for name, aliases in manifest[ 'names' ]:
+        print( name )
+        for alias in aliases: print( alias )
+
+
+def render_tasks_listing( listing ):
+    ''' Renders listing of tasks, as Invoke does. '''
+    print( f"{listing[ 'opener' ]}:\n" )
+    render_columns( listing[ 'pairs' ] )
+    default, root = listing[ 'default' ], listing.get( 'root' )
+    if not default: return
+    if root: print( f"Default {root!r} task: .{default}\n" )
+    else: print( f"Default task: {default}\n" )
 
 
 @_context_manager
@@ -60,6 +60,11 @@ scribe: _typ.Any
 tv_error = ( TypeError, ValueError )
 
 
+# Context manager factories, which observe execution of subprocesses.
+# Each is called with the normalized command specification.
+subprocess_observers = [ ]
+
+
 class Class( ABCFactory ):
     ''' Factory for all classes in the package.
 
@@ -358,8 +363,13 @@ def execute_subprocess( command_specification, **nomargs ):
     # TODO? Intercept 'subprocess.SubprocessError'.
     _data.scribe.debug(
         f"Executing {command_specification!r} with {options!r}." )
-    # nosemgrep: python.lang.security.audit.dangerous-subprocess-use-audit
-    return run( command_specification, check = True, **options ) # nosec B603
+    from contextlib import ExitStack as CMStack
+    with CMStack( ) as contexts:
+        for observer in subprocess_observers:
+            contexts.enter_context( observer( command_specification ) )
+        # nosemgrep: python.lang.security.audit.dangerous-subprocess-use-audit
+        return run( # nosec B603
+            command_specification, check = True, **options )
 
 # TODO: Remove this alias and use thereof.
 execute_external = execute_subprocess
@@ -0,0 +1,299 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+''' Persistent server for quick dispatch of commands.
+
+    The server keeps the package, its parsed configuration, and its probes of
+    language installations warm in memory. It listens on a Unix socket in the
+    project state directory. For each command, the thin client in
+    :py:mod:`__main__` passes its standard streams, arguments, working
+    directory, and environment. The server forks a child process to execute
+    the command with them and reports the exit code back to the client.
+
+    The server exits when the package sources, the requirements of its
+    packages cohort, or project configuration change, after which the next
+    command runs in its own process and spawns a fresh server. It also exits
+    after a period of idleness.
+
+    Enabled by setting the ``DEVSHIM_DAEMON`` environment variable to ``on``.
+    Only supported on POSIX platforms. '''
+
+
+from . import base as __
+
+
+# Seconds of idleness after which the server exits.
+idle_duration_maximum = 3600
+
+
+def spawn_conditionally( execute ):
+    ''' Spawns server in background, if enabled and supported.
+
+        The supplied function executes a command from its arguments. '''
+    if 'posix' != __.os_class: return
+    if 'on' != __.view_environment_entry( ( 'daemon', ) ): return
+    from os import _exit, fork, setsid, waitpid
+    from sys import stderr, stdout
+    stdout.flush( ); stderr.flush( )
+    # Double fork to detach from controlling terminal and avoid zombies.
+    pid = fork( )
+    if pid:
+        waitpid( pid, 0 )
+        return
+    try:
+        setsid( )
+        if fork( ): return
+        _detach_standard_streams( )
+        serve( execute )
+    finally: _exit( 0 ) # pylint: disable=protected-access
+
+
+def serve( execute ):
+    ''' Serves commands until stale, idle, or stopped. '''
+    from socket import AF_UNIX, SOCK_STREAM, socket as Socket, timeout
+    from time import monotonic
+    from .data import paths
+    location = paths.state.DEV.daemon_socket
+    if _probe_server( location ): return
+    generation = _calculate_generation( )
+    _warm_caches( )
+    from .fs_utilities import ensure_directory
+    ensure_directory( location.parent )
+    if location.exists( ): location.unlink( )
+    with Socket( AF_UNIX, SOCK_STREAM ) as listener:
+        try: listener.bind( str( location ) )
+        except OSError: return # Path too long or lost race to other server.
+        listener.listen( )
+        listener.settimeout( 60 )
+        __.scribe.info( f"Serving commands on {str( location )!r}." )
+        last_activity_time = monotonic( )
+        try:
+            while True:
+                _reap_children( )
+                try: connection, _ = listener.accept( )
+                except timeout:
+                    if idle_duration_maximum < (
+                        monotonic( ) - last_activity_time
+                    ): break
+                    continue
+                last_activity_time = monotonic( )
+                with connection:
+                    if not _handle_connection(
+                        connection, listener, generation, execute
+                    ): break
+        finally:
+            if location.exists( ): location.unlink( )
+    __.scribe.info( "Server stopped." )
+
+
+def _calculate_generation( ):
+    ''' Calculates generation of package, its cohort, and configuration.
+
+        Changes to the generation indicate that the server is stale. '''
+    from pathlib import Path
+    from .data import paths
+    from .pre import (
+        calculate_cohort_identifier, derive_cohort_requirements_location, )
+    package_location = Path( __file__ ).parent
+    # Package may be imported from an archive, such as a zip file.
+    while not package_location.exists( ):
+        package_location = package_location.parent
+    try:
+        cohort_identifier = calculate_cohort_identifier(
+            derive_cohort_requirements_location( ) )
+    except OSError: cohort_identifier = None
+    records = [ cohort_identifier ]
+    for location in ( package_location, paths.configuration.SELF ):
+        records.extend( _survey_generation_records( location ) )
+    return hash( tuple( records ) )
+
+
+def _detach_standard_streams( ):
+    ''' Points standard streams to null device and log file. '''
+    from os import (
+        O_APPEND, O_CREAT, O_RDONLY, O_WRONLY,
+        close, devnull, dup2, open as open_descriptor,
+    )
+    from .data import paths
+    from .fs_utilities import ensure_directory
+    log_location = paths.state.DEV.daemon_log
+    ensure_directory( log_location.parent )
+    null_fd = open_descriptor( devnull, O_RDONLY )
+    log_fd = open_descriptor(
+        log_location, O_WRONLY | O_CREAT | O_APPEND, 0o600 )
+    dup2( null_fd, 0 ); dup2( log_fd, 1 ); dup2( log_fd, 2 )
+    close( null_fd ); close( log_fd )
+
+
+def _execute_in_child( connection, listener, request, descriptors, execute ):
+    ''' Executes command in child process with client standard streams. '''
+    from os import _exit, chdir, close, dup2, getpid
+    from signal import SIGINT, default_int_handler, signal
+    from sys import stderr, stdout
+    listener.close( )
+    signal( SIGINT, default_int_handler )
+    stdout.flush( ); stderr.flush( )
+    for fd, descriptor in enumerate( descriptors ):
+        dup2( descriptor, fd )
+        close( descriptor )
+    chdir( request[ 'cwd' ] )
+    environment = request[ 'environment' ]
+    for name, value in _view_package_environment( ).items( ):
+        environment.setdefault( name, value )
+    __.current_process_environment.clear( )
+    __.current_process_environment.update( environment )
+    _send_reply( connection, dict( status = 'started', pid = getpid( ) ) )
+    try: execute( request[ 'argv' ] )
+    except SystemExit as exc:
+        if None is exc.code: exit_code = 0
+        elif isinstance( exc.code, int ): exit_code = exc.code
+        else: exit_code = 1
+    except BaseException: # pylint: disable=broad-except
+        __.scribe.exception( "Command failed." )
+        exit_code = 1
+    else: exit_code = 0
+    stdout.flush( ); stderr.flush( )
+    try: _send_reply( connection, dict( status = 'exited', code = exit_code ) )
+    finally: _exit( exit_code ) # pylint: disable=protected-access
+
+
+def _handle_connection( connection, listener, generation, execute ):
+    ''' Handles request from client connection.
+
+        Returns false if the server should stop. '''
+    from os import close, fork
+    request, descriptors = _receive_request( connection )
+    try:
+        command = request.get( 'command' )
+        if 'stop' == command: return False
+        if 'run' != command or 3 != len( descriptors ): return True
+        if generation != _calculate_generation( ):
+            # Remove socket before reply, so that next server can bind.
+            from .data import paths
+            paths.state.DEV.daemon_socket.unlink( )
+            _send_reply( connection, dict( status = 'stale' ) )
+            return False
+        if not _is_environment_compatible( request[ 'environment' ] ):
+            _send_reply( connection, dict( status = 'declined' ) )
+            return True
+        if not fork( ):
+            _execute_in_child(
+                connection, listener, request, descriptors, execute )
+    finally:
+        for descriptor in descriptors: close( descriptor )
+    return True
+
+
+def _is_environment_compatible( environment ):
+    ''' Are package-specific environment entries of client same as ours?
+
+        Entries, which only we have, are set during initialization and are
+        passed along to child processes. '''
+    ours = _view_package_environment( )
+    theirs = _view_package_environment( environment )
+    theirs.pop( __.derive_environment_entry_name( 'daemon' ), None )
+    return all(
+        value == ours.get( name ) for name, value in theirs.items( ) )
+
+
+def _probe_server( location ):
+    ''' Is another server listening at socket location? '''
+    from socket import AF_UNIX, SOCK_STREAM, socket as Socket
+    with Socket( AF_UNIX, SOCK_STREAM ) as connection:
+        try: connection.connect( str( location ) )
+        except OSError: return False
+    return True
+
+
+def _reap_children( ):
+    ''' Reaps any exited child processes. '''
+    from os import WNOHANG, waitpid
+    while True:
+        try: pid, _ = waitpid( -1, WNOHANG )
+        except ChildProcessError: return
+        if not pid: return
+
+
+def _receive_request( connection ):
+    ''' Receives request and any file descriptors from client. '''
+    from array import array
+    from json import loads
+    from socket import CMSG_LEN, SCM_RIGHTS, SOL_SOCKET
+    descriptors = array( 'i' )
+    data, ancillary_data, _, _ = connection.recvmsg(
+        65536, CMSG_LEN( 3 * descriptors.itemsize ) )
+    for level, kind, datum in ancillary_data:
+        if SOL_SOCKET == level and SCM_RIGHTS == kind:
+            descriptors.frombytes(
+                datum[ : len( datum ) - len( datum ) % descriptors.itemsize ] )
+    chunks = [ data ]
+    while data and not data.endswith( b'\n' ):
+        data = connection.recv( 65536 )
+        chunks.append( data )
+    try: request = loads( b''.join( chunks ).decode( 'utf-8' ) )
+    except ValueError: request = { }
+    return request, tuple( descriptors )
+
+
+def _send_reply( connection, reply ):
+    from json import dumps
+    connection.sendall( ( dumps( reply ) + '\n' ).encode( 'utf-8' ) )
+
+
+def _survey_generation_records( location ):
+    ''' Surveys paths, modification times, and sizes of files in location.
+
+        The location may be a directory or a single file, such as an
+        archive. Bytecode caches are ignored. '''
+    from os import walk
+    from pathlib import Path
+    if location.is_file( ): locations = [ location ]
+    else:
+        locations = [ ]
+        for root, directories, files in walk( location ):
+            directories[ : ] = sorted(
+                directory for directory in directories
+                if '__pycache__' != directory )
+            locations.extend( Path( root ) / file for file in sorted( files ) )
+    records = [ ]
+    for location_ in locations:
+        try: stat_result = location_.stat( )
+        except OSError: continue
+        records.append( (
+            str( location_ ), stat_result.st_mtime_ns, stat_result.st_size ) )
+    return records
+
+
+def _view_package_environment( environment = None ):
+    ''' Views package-specific entries of environment. '''
+    if None is environment: environment = __.current_process_environment
+    prefix = f"{__package__.upper( )}_"
+    return {
+        name: value for name, value in environment.items( )
+        if name.startswith( prefix ) }
+
+
+def _warm_caches( ):
+    ''' Probes language installations and parses configuration. '''
+    try:
+        from .languages.python import language
+        language.survey_descriptors( )
+        language.detect_default_descriptor( )
+    except Exception as exc: # pylint: disable=broad-except
+        __.scribe.warning( f"Could not warm caches: {exc}" )
@@ -62,12 +62,20 @@ def build_python_venv( version, overwrite = False ):
         python_path = descriptor.infer_executables_location( name = 'python' )
     from ..fs_utilities import ensure_directory
     venv_path = ensure_directory( derive_venv_path( version, python_path ) )
+    if overwrite or not is_executable_in_venv( 'python', venv_path ):
+        snapshot_key = _calculate_venv_snapshot_key( version, python_path )
+        if snapshot_key and _restore_venv_snapshot( snapshot_key, venv_path ):
+            # Installation is a no-op unless the snapshot has drifted.
+            _install_packages_into_venv( version, venv_path )
+            return
     venv_options = [ ]
     if overwrite: venv_options.append( '--clear' )
     from ..base import execute_subprocess
     execute_subprocess( (
         python_path, '-m', 'virtualenv', *venv_options, venv_path ) )
     _install_packages_into_venv( version, venv_path )
+    snapshot_key = _calculate_venv_snapshot_key( version, python_path )
+    if snapshot_key: _record_venv_snapshot( snapshot_key, venv_path )
 
 
 def _install_packages_into_venv( version, venv_path ):
@@ -77,14 +85,200 @@ def _install_packages_into_venv( version, venv_path ):
         install_python_packages,
         record_python_packages_fixtures,
     )
-    install_python_packages( process_environment )
-    fixtures = calculate_python_packages_fixtures( process_environment )
     # TODO: Get PEP 508 platform identity from language descriptor.
     from ..platforms import pep508_identify_python
     identifier = pep508_identify_python( version = version )
+    # Reproduce recorded fixtures, if they are complete, rather than upgrade.
+    install_python_packages( process_environment, identifier = identifier )
+    fixtures = calculate_python_packages_fixtures( process_environment )
     record_python_packages_fixtures( identifier, fixtures )
 
 
+def _calculate_venv_snapshot_key( version, python_path ):
+    ''' Calculates key of virtual environment snapshot.
+
+        The key covers the identity of the interpreter and the digest of the
+        Python packages fixtures. Returns ``None`` if there are no fixtures
+        or if fingerprints are ignored. '''
+    if 'ignore' == __.view_environment_entry( ( 'fingerprints', ) ):
+        return None
+    from pathlib import Path
+    from ..packages import calculate_python_packages_fixtures_digest
+    from ..platforms import pep508_identify_python
+    fixtures_digest = calculate_python_packages_fixtures_digest(
+        pep508_identify_python( version = version ) )
+    if None is fixtures_digest: return None
+    from hashlib import sha256
+    python_location = Path( python_path ).resolve( )
+    python_stat = python_location.stat( )
+    return sha256( '\0'.join( (
+        str( python_location ),
+        str( python_stat.st_size ),
+        str( python_stat.st_mtime_ns ),
+        fixtures_digest,
+        __.version,
+    ) ).encode( ) ).hexdigest( )
+
+
+def _clone_file( source, target ):
+    ''' Clones file by hardlink, reflink, or copy.
+
+        Read-only files with other links, such as ones from the store of
+        unpacked wheels, are hardlinked. Other files are reflinked, where the
+        file system supports it, so that writes to them are not shared. '''
+    from os import link
+    from shutil import copyfileobj, copystat
+    from stat import S_IWUSR, S_IWGRP, S_IWOTH
+    source_stat = source.stat( )
+    if 1 < source_stat.st_nlink and not (
+        source_stat.st_mode & ( S_IWUSR | S_IWGRP | S_IWOTH )
+    ):
+        try:
+            link( source, target )
+            return
+        except OSError: pass
+    with source.open( 'rb' ) as source_file, \
+            target.open( 'wb' ) as target_file:
+        if not _reflink_file( source_file, target_file ):
+            copyfileobj( source_file, target_file )
+    copystat( source, target )
+
+
+def _clone_tree( source, target, location = None ):
+    ''' Clones directory tree, except for bytecode caches.
+
+        Symbolic links into the source are relocated to the eventual location
+        of the target, which may differ from the target itself. '''
+    from os import readlink, symlink, walk
+    from pathlib import Path
+    location = location or target
+    source_prefix = str( source )
+    for root, directories, files in walk( source ):
+        root_ = Path( root )
+        target_root = target / root_.relative_to( source )
+        target_root.mkdir( parents = True, exist_ok = True )
+        subdirectories = [ ]
+        for name in sorted( ( *directories, *files ) ):
+            if '__pycache__' == name: continue
+            source_ = root_ / name
+            if source_.is_symlink( ):
+                link_target = readlink( source_ )
+                if link_target.startswith( source_prefix ):
+                    link_target = str( location ) + link_target[
+                        len( source_prefix ) : ]
+                symlink( link_target, target_root / name )
+            elif name in directories: subdirectories.append( name )
+            else: _clone_file( source_, target_root / name )
+        directories[ : ] = subdirectories
+
+
+def _derive_venv_snapshot_location( key ):
+    from ..data import paths
+    return paths.caches.DEV.venv_snapshots / key
+
+
+def _record_venv_snapshot( key, venv_path ):
+    ''' Records snapshot of virtual environment, unless one already exists.
+
+        Any other snapshots of the same virtual environment are removed.
+        Failure to record is not fatal. '''
+    from json import dump
+    from os import getpid, replace
+    from shutil import rmtree
+    location = _derive_venv_snapshot_location( key )
+    if location.with_suffix( '.json' ).is_file( ): return
+    staging_location = location.with_name( f".{key}.{getpid( )}.partial" )
+    try:
+        for metadata_location in location.parent.glob( '*.json' ):
+            if str( venv_path ) != _summon_venv_snapshot_location(
+                metadata_location.stem
+            ): continue
+            metadata_location.unlink( )
+            rmtree( metadata_location.with_suffix( '' ), ignore_errors = True )
+        _clone_tree( venv_path, staging_location, location = location )
+        replace( staging_location, location )
+        temporary_location = location.with_suffix( '.json.partial' )
+        with temporary_location.open( 'w', encoding = 'utf-8' ) as file:
+            dump( dict( location = str( venv_path ) ), file )
+        replace( temporary_location, location.with_suffix( '.json' ) )
+    except OSError as exc:
+        __.scribe.warning(
+            f"Could not record snapshot of virtual environment: {exc}" )
+        rmtree( staging_location, ignore_errors = True )
+
+
+def _reflink_file( source_file, target_file ):
+    ''' Shares extents of source file with target file, if possible. '''
+    from sys import platform
+    if not platform.startswith( 'linux' ): return False
+    from fcntl import ioctl
+    try:
+        ioctl( target_file.fileno( ), _ficlone_request, source_file.fileno( ) )
+    except OSError: return False
+    return True
+
+
+# Linux 'FICLONE' request, as from the '_IOW( 0x94, 9, int )' macro.
+_ficlone_request = 0x40049409
+
+
+def _relocate_venv_scripts( tree_path, original_venv_path, venv_path ):
+    ''' Rewrites original location in activation scripts and shebangs. '''
+    from ..fs_utilities import determine_executables_location_part
+    original = str( original_venv_path ).encode( )
+    replacement = str( venv_path ).encode( )
+    if original == replacement: return
+    executables_location = tree_path / determine_executables_location_part( )
+    for location in (
+        tree_path / 'pyvenv.cfg', *executables_location.iterdir( )
+    ):
+        if location.is_symlink( ) or not location.is_file( ): continue
+        # Never write through links which are shared with other trees.
+        if 1 < location.stat( ).st_nlink: continue
+        content = location.read_bytes( )
+        if original not in content: continue
+        location.write_bytes( content.replace( original, replacement ) )
+
+
+def _restore_venv_snapshot( key, venv_path ):
+    ''' Restores virtual environment from snapshot, if one exists.
+
+        Returns true on success. '''
+    from os import getpid, replace
+    from shutil import rmtree
+    original_venv_path = _summon_venv_snapshot_location( key )
+    if None is original_venv_path: return False
+    location = _derive_venv_snapshot_location( key )
+    if not location.is_dir( ): return False
+    __.scribe.info( f"Restoring virtual environment from snapshot {key}." )
+    pid = getpid( )
+    staging_path = venv_path.with_name( f".{venv_path.name}.{pid}.partial" )
+    retired_path = venv_path.with_name( f".{venv_path.name}.{pid}.retired" )
+    try:
+        rmtree( staging_path, ignore_errors = True )
+        _clone_tree( location, staging_path, location = venv_path )
+        _relocate_venv_scripts( staging_path, original_venv_path, venv_path )
+        if venv_path.exists( ): replace( venv_path, retired_path )
+        replace( staging_path, venv_path )
+    except OSError as exc:
+        __.scribe.warning(
+            f"Could not restore virtual environment from snapshot: {exc}" )
+        rmtree( staging_path, ignore_errors = True )
+        return False
+    finally: rmtree( retired_path, ignore_errors = True )
+    return True
+
+
+def _summon_venv_snapshot_location( key ):
+    ''' Summons original location of virtual environment for snapshot. '''
+    from json import load
+    location = _derive_venv_snapshot_location( key ).with_suffix( '.json' )
+    try:
+        with location.open( encoding = 'utf-8' ) as file:
+            return load( file ).get( 'location' )
+    except ( OSError, ValueError ): return None
+
+
 def test_package_executable(
     executable_name, process_environment = None, proper_package_name = None
 ):
@@ -97,8 +97,8 @@ def _summon_definitions( ):
     ''' Summons definitions for environment decriptors. '''
     # TODO? Use 'importlib-resources' to access default definitions.
     location = _data.locations.configuration / 'environments.toml'
-    from tomli import load as summon
-    with location.open( 'rb' ) as file: document = summon( file )
+    from ..fs_utilities import summon_toml
+    document = summon_toml( location )
     # TODO: Check format version and dispatch accordingly.
     return DictionaryProxy( document.get( 'descriptors', { } ) )
 
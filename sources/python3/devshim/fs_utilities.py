@@ -112,6 +112,45 @@ def is_older_than( path, then ):
     return path.stat( ).st_mtime < when
 
 
+def summon_toml( location ):
+    ''' Summons parsed TOML document from file at location.
+
+        A snapshot of the parsed document is kept in the package cache and is
+        reused while the size and modification time of the file and the
+        package version remain the same. Not for documents with secrets,
+        since they would be copied into the cache. '''
+    from hashlib import sha256
+    from os import getpid, replace
+    from pickle import HIGHEST_PROTOCOL, dumps, loads # nosec B403
+    from . import __version__
+    from .data import paths
+    stat_result = location.stat( )
+    key = (
+        str( location ), stat_result.st_size, stat_result.st_mtime_ns,
+        __version__ )
+    snapshot_location = paths.caches.DEV.snapshots / "{}.pickle".format(
+        sha256( str( location ).encode( ) ).hexdigest( ) )
+    try:
+        # Snapshot is written only by us into project-local cache.
+        key_, document = loads( snapshot_location.read_bytes( ) ) # nosec B301
+    except Exception: pass # pylint: disable=broad-except
+    else:
+        if key == key_: return document
+    from tomli import load
+    with location.open( 'rb' ) as file: document = load( file )
+    # Concurrent jobs may write at same time; last one wins.
+    temporary_location = snapshot_location.with_suffix(
+        f".{getpid( )}.partial" )
+    try:
+        ensure_directory( snapshot_location.parent )
+        temporary_location.write_bytes(
+            dumps( ( key, document ), protocol = HIGHEST_PROTOCOL ) )
+        replace( temporary_location, snapshot_location )
+    except OSError as exc:
+        __.scribe.warning( f"Could not record snapshot of TOML: {exc}" )
+    return document
+
+
 def unlink_recursively( path ):
     ''' Pure Python implementation of ``rm -rf``, essentially.
 
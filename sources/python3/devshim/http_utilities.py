@@ -20,71 +20,408 @@
 ''' Conveniences for working with Hypertext Transfer Protocol. '''
 
 
+from sys import version_info as _python_version_info
+from threading import Lock as _Mutex
+
 from . import base as __
 
 
-def retrieve_url( url, destination = None, headers = None ): # pylint: disable=too-many-statements
+def retrieve_url( # pylint: disable=too-complex,too-many-branches,too-many-statements
+    url, destination = None, headers = None, digest = None
+):
     ''' Retrieves URL into destination via Hypertext Transfer Protocol.
 
         The destination may be a path-like object, an object with a ``write``
         method, such as an open stream, or a callable which consumes a stream
         from an object with a ``read`` method. The callable must take two
         positional arguments, which will be the HTTP reader object and the
-        context stack that ensures proper resource cleanup. '''
+        context stack that ensures proper resource cleanup.
+
+        If the destination is a path to a file, which was retrieved before,
+        then the request is conditioned upon validators, which were recorded
+        from the previous response. If the server reports that the resource
+        is not modified, then only the modification time of the file is
+        updated. Otherwise, the response is streamed into a partial file,
+        which replaces the destination atomically once complete. If the
+        connection drops, then the retrieval is resumed from the end of the
+        partial file, provided that the server supports ranges and that the
+        resource has not changed in the meantime.
+
+        If an expected digest is given, in the form of
+        ``<algorithm>:<hexadecimal digest>`` (e.g., ``sha256:...`` or
+        ``blake2b_256:...``), then the response is hashed as it is streamed
+        and verified against it. A destination file, which already has the
+        expected digest, is not retrieved again. One which does not have it
+        is retrieved unconditionally. Digests cannot be verified for callable
+        destinations.
+
+        Connections to each host are kept alive and reused by later
+        retrievals, unless a proxy is configured for the host.
+
+        Safe to call from multiple threads. If a host asks for requests to
+        be deferred, via ``Retry-After``, then all requests to that host
+        from this process are deferred accordingly. '''
     # NOTE: Similar implementation exists in 'develop.py'.
     #       Improvements should be reflected in both places.
     from random import random
     from time import sleep
     from urllib.error import HTTPError as HttpError
     from urllib.request import Request as HttpRequest
+    from http.client import HTTPException as HttpException
+    from socket import timeout as SocketTimeout
     destination = _normalize_retrieval_destination( destination )
+    if digest and callable( destination ):
+        # TODO: Use exception factory.
+        raise __.fuse_exception_classes( ( ValueError, ) )(
+            "Cannot verify digest of data consumed by callable." )
     headers = headers or { } # TODO: Validate headers.
     request = HttpRequest( url, headers = headers )
+    if isinstance( destination, __.Path ) and destination.is_file( ):
+        if not digest: _condition_request( request, destination )
+        elif _probe_digest( destination, digest ): return destination
+        else:
+            # Corrupt or tampered file must not be validated by server.
+            try: _derive_validators_location( destination ).unlink( )
+            except FileNotFoundError: pass
     attempts_count_max = 2
     for attempts_count in range( attempts_count_max + 1 ):
-        try: return _retrieve_url( request, destination )
+        _await_host_gate( request.host )
+        try: return _retrieve_url( request, destination, digest )
+        except ( ConnectionError, HttpException, SocketTimeout ) as exc:
+            # Partial file, if any, is kept so that next attempt can resume.
+            __.scribe.error(
+                f"Connection failed during retrieval from {url!r}: {exc}" )
+            if attempts_count_max == attempts_count: raise
+            sleep( 2 ** attempts_count + 2 * random( ) ) # nosec: B311
+            continue
         except HttpError as exc:
+            if 304 == exc.code:                     # Not Modified
+                __.scribe.debug( f"Not modified: {url!r}" )
+                destination.touch( )
+                return destination
             __.scribe.error( f"Failed to retrieve data from {url!r}." )
             # Exponential backoff with collision-breaking jitter.
             backoff_time = 2 ** attempts_count + 2 * random( ) # nosec: B311
             # https://www.iana.org/assignments/http-status-codes/http-status-codes.xhtml
-            if exc.code in ( 301, 302, 307, 308 ):  # Redirects
+            if exc.code in ( 301, 302, 303, 307, 308 ):  # Redirects
                 if 'Location' in exc.headers:
-                    url = exc.headers[ 'Location' ]
-                    return retrieve_url( url, destination, headers )
+                    from urllib.parse import urljoin
+                    url = urljoin( url, exc.headers[ 'Location' ] )
+                    return retrieve_url( url, destination, headers, digest )
                 raise
             if 404 == exc.code: raise               # Not Found
-            if 429 == exc.code:                     # Too Many Requests
-                backoff_time = float(
-                    exc.headers.get( 'Retry-After', backoff_time ) )
+            if 416 == exc.code:                     # Range Not Satisfiable
+                if not isinstance( destination, __.Path ): raise
+                _discard_partial_file(
+                    _derive_partial_location( destination ) )
+                if attempts_count_max == attempts_count: raise
+                continue
+            if exc.code in ( 429, 503 ):    # Too Many Requests, Unavailable
+                backoff_time = _parse_retry_after(
+                    exc.headers.get( 'Retry-After' ), backoff_time )
                 if 120 < backoff_time: raise # Do not wait too long.
+                _close_host_gate( request.host, backoff_time )
             if attempts_count_max == attempts_count: raise
             __.scribe.info(
                 f"Will attempt retrieval from {url!r} again "
                 f"in {backoff_time} seconds." )
-            sleep( backoff_time )
+            if exc.code not in ( 429, 503 ): sleep( backoff_time )
     raise __.fuse_exception_classes( ( RuntimeError, ) )(
         'Wut? Unexpectedly fell out of HTTP retrieval retry loop.' )
 
-def _retrieve_url( request, destination ):
+def _await_host_gate( host ):
+    ''' Waits until host may be accessed again. '''
+    from time import monotonic, sleep
+    while True:
+        with _host_gates_mutex: reopen_time = _host_gates.get( host, 0 )
+        delay = reopen_time - monotonic( )
+        if 0 >= delay: return
+        sleep( delay )
+
+
+def _close_host_gate( host, duration ):
+    ''' Defers access to host, across threads, for duration in seconds. '''
+    from time import monotonic
+    with _host_gates_mutex:
+        _host_gates[ host ] = max(
+            _host_gates.get( host, 0 ), monotonic( ) + duration )
+
+
+def _parse_retry_after( value, default ):
+    ''' Parses seconds or HTTP date from ``Retry-After`` header. '''
+    if None is value: return default
+    try: return max( 0.0, float( value ) )
+    except ValueError: pass
+    from datetime import datetime as DateTime, timezone as TimeZone
+    from email.utils import parsedate_to_datetime
+    try: then = parsedate_to_datetime( value )
+    except ( TypeError, ValueError ): return default
+    return max( 0.0, ( then - DateTime.now( TimeZone.utc ) ).total_seconds( ) )
+
+
+def _access_url( request, contexts ):
+    ''' Accesses URL via pooled connection, if possible.
+
+        Falls back to :py:func:`urllib.request.urlopen` for proxied hosts and
+        for schemes other than HTTP and HTTPS. Responses, which are not
+        successful, raise HTTP errors, as with that function. '''
+    from urllib.request import (
+        getproxies, proxy_bypass, urlopen as access_url, )
+    if request.type not in ( 'http', 'https' ) or (
+        request.type in getproxies( ) and not proxy_bypass( request.host )
+    ):
+        # nosemgrep: python.lang.security.audit.dynamic-urllib-use-detected
+        return contexts.enter_context( access_url( request ) )
+    from http.client import HTTPException as HttpException
+    from urllib.error import HTTPError as HttpError
+    headers = {
+        'Accept-Encoding': 'identity', 'User-Agent': _user_agent,
+        **dict( request.header_items( ) ) }
+    key = ( request.type, request.host )
+    while True:
+        connection, reused = _checkout_connection( key )
+        try:
+            connection.request( 'GET', request.selector, headers = headers )
+            response = connection.getresponse( )
+        except ( ConnectionError, HttpException ):
+            connection.close( )
+            # Server may have closed idle connection. Retry with fresh one.
+            if reused: continue
+            raise
+        break
+    contexts.callback( _checkin_connection, key, connection, response )
+    if 200 <= response.status < 300: return response
+    from io import BytesIO
+    raise HttpError(
+        request.full_url, response.status, response.reason,
+        response.headers, BytesIO( response.read( ) ) )
+
+
+def _condition_range( request, partial_location ):
+    ''' Conditions request upon range beyond end of partial file.
+
+        Returns offset at which retrieval resumes. Partial files without
+        strong validators cannot be resumed and are discarded. '''
+    from json import loads
+    for header_name in ( 'Range', 'If-range' ):
+        request.remove_header( header_name )
+    try: offset = partial_location.stat( ).st_size
+    except OSError: return 0
+    try:
+        validators = loads( _derive_validators_location( partial_location )
+            .read_text( encoding = 'utf-8' ) )
+    except ( OSError, ValueError ): validators = { }
+    validator = validators.get( 'etag', '' )
+    if validator.startswith( 'W/' ): validator = ''
+    validator = validator or validators.get( 'last-modified' )
+    if not offset or not validator:
+        _discard_partial_file( partial_location )
+        return 0
+    request.add_header( 'Range', f"bytes={offset}-" )
+    request.add_header( 'If-Range', validator )
+    return offset
+
+
+def _condition_request( request, destination ):
+    ''' Conditions request upon validators of previous retrieval. '''
+    if not destination.is_file( ): return
+    from json import loads
+    try:
+        validators = loads( _derive_validators_location( destination )
+            .read_text( encoding = 'utf-8' ) )
+    except ( OSError, ValueError ): return
+    for name, header_name in (
+        ( 'etag', 'If-None-Match' ),
+        ( 'last-modified', 'If-Modified-Since' ),
+    ):
+        if name in validators:
+            request.add_header( header_name, validators[ name ] )
+
+
+def _create_hasher( digest ):
+    ''' Creates hasher for algorithm of expected digest. '''
+    from hashlib import blake2b, new as create_hasher
+    algorithm = digest.split( ':', maxsplit = 1 )[ 0 ]
+    # Package indices name truncated variant of BLAKE2b in this manner.
+    if 'blake2b_256' == algorithm: return blake2b( digest_size = 32 )
+    return create_hasher( algorithm )
+
+
+def _derive_partial_location( destination ):
+    return destination.with_name( f"{destination.name}.partial" )
+
+
+def _derive_validators_location( destination ):
+    return destination.with_name( f"{destination.name}.validators" )
+
+
+def _discard_partial_file( location ):
+    ''' Removes partial file and its validators, if they exist. '''
+    for location_ in ( location, _derive_validators_location( location ) ):
+        try: location_.unlink( )
+        except FileNotFoundError: pass
+
+
+def _probe_digest( location, digest ):
+    ''' Does file have expected digest? '''
+    hasher = _create_hasher( digest )
+    with location.open( 'rb' ) as file:
+        _stream_response( file, hasher.update )
+    return _verify_digest( hasher, digest, complain = False )
+
+
+def _verify_digest( hasher, digest, complain = True ):
+    ''' Verifies digest of hasher against expected digest.
+
+        Raises error on mismatch, unless asked not to complain. '''
+    from hmac import compare_digest
+    expected = digest.split( ':', maxsplit = 1 )[ -1 ].lower( )
+    actual = hasher.hexdigest( )
+    if compare_digest( expected, actual ): return True
+    if not complain: return False
+    # TODO: Use exception factory.
+    raise __.fuse_exception_classes( ( ValueError, ) )(
+        f"Digest mismatch: expected {expected!r}, received {actual!r}." )
+
+
+def _record_validators( destination, headers ):
+    ''' Records validators from response for later conditional requests.
+
+        Failure to record is not fatal. '''
+    from json import dumps
+    location = _derive_validators_location( destination )
+    validators = {
+        name: headers[ name ] for name in ( 'etag', 'last-modified' )
+        if name in headers }
+    try:
+        if validators:
+            location.write_text( dumps( validators ), encoding = 'utf-8' )
+        elif location.exists( ): location.unlink( )
+    except OSError as exc:
+        __.scribe.warning( f"Could not record HTTP validators: {exc}" )
+
+
+def _checkin_connection( key, connection, response ):
+    ''' Returns connection to pool, if response was completely read. '''
+    if not response.isclosed( ) or response.will_close:
+        connection.close( )
+        return
+    with _connections_mutex:
+        idle_connections = _connections.setdefault( key, [ ] )
+        if connections_per_host_maximum > len( idle_connections ):
+            idle_connections.append( connection )
+            return
+    connection.close( )
+
+
+def _checkout_connection( key ):
+    ''' Takes idle connection from pool or opens new one.
+
+        Also reports whether connection was taken from pool. '''
+    with _connections_mutex:
+        idle_connections = _connections.get( key )
+        if idle_connections: return idle_connections.pop( ), True
+    scheme, host = key
+    if 'https' == scheme:
+        from http.client import HTTPSConnection
+        from ssl import create_default_context
+        return HTTPSConnection(
+            host, context = create_default_context( ),
+            timeout = connection_timeout ), False
+    from http.client import HTTPConnection
+    return HTTPConnection( host, timeout = connection_timeout ), False
+
+
+def _forget_connections( ):
+    ''' Forgets connections inherited from parent process after fork.
+
+        Idle connections share their sockets with the parent process and
+        with any other children of it. So, they must not be used by a child.
+        Mutexes, which were held by threads of the parent process, are
+        released, since those threads do not exist in the child. '''
+    for mutex in ( _connections_mutex, _host_gates_mutex ):
+        if mutex.locked( ): mutex.release( )
+    for connections in _connections.values( ):
+        # Closing only releases descriptors of child. Parent is unaffected.
+        for connection in connections: connection.close( )
+    _connections.clear( )
+
+
+def _retrieve_url( request, destination, digest ):
     # NOTE: Similar implementation exists in 'develop.py'.
     #       Improvements should be reflected in both places.
     from contextlib import ExitStack as ContextStack
-    from urllib.request import urlopen as access_url
     contexts = ContextStack( )
     with contexts:
-        # nosemgrep: python.lang.security.audit.dynamic-urllib-use-detected
-        http_reader = contexts.enter_context( access_url( request ) )
-        if None is destination: return http_reader.read( )
-        if callable( destination ): return destination( http_reader, contexts )
         if isinstance( destination, __.Path ):
-            file = contexts.enter_context( destination.open( 'wb' ) )
-            file.write( http_reader.read( ) )
-        elif callable( getattr( destination, 'write', None ) ):
-            destination.write( http_reader.read( ) )
+            return _retrieve_url_into_file(
+                request, destination, digest, contexts )
+        http_reader = _access_url( request, contexts )
+        if callable( destination ): return destination( http_reader, contexts )
+        hasher = _create_hasher( digest ) if digest else None
+        if None is destination:
+            data = http_reader.read( )
+            if hasher:
+                hasher.update( data )
+                _verify_digest( hasher, digest )
+            return data
+        _stream_response( http_reader, destination.write, hasher )
+        if hasher: _verify_digest( hasher, digest )
         return destination
 
 
+def _retrieve_url_into_file( request, destination, digest, contexts ):
+    ''' Streams response into partial file and then replaces destination.
+
+        Resumes from end of existing partial file, if possible. '''
+    from os import replace
+    partial_location = _derive_partial_location( destination )
+    offset = _condition_range( request, partial_location )
+    http_reader = _access_url( request, contexts )
+    if 206 != getattr( http_reader, 'status', None ): offset = 0
+    hasher = _create_hasher( digest ) if digest else None
+    if offset and hasher:
+        with partial_location.open( 'rb' ) as file:
+            _stream_response( file, hasher.update )
+    if not offset:
+        _record_validators( partial_location, http_reader.headers )
+    with partial_location.open( 'ab' if offset else 'wb' ) as file:
+        size = _stream_response( http_reader, file.write, hasher )
+    _verify_response_size( http_reader, size )
+    if hasher:
+        try: _verify_digest( hasher, digest )
+        except ValueError:
+            _discard_partial_file( partial_location )
+            raise
+    replace( partial_location, destination )
+    _record_validators( destination, http_reader.headers )
+    _discard_partial_file( partial_location )
+    return destination
+
+
+def _stream_response( reader, write, hasher = None ):
+    ''' Streams data from reader to writer in chunks of bounded size.
+
+        Returns number of bytes streamed. '''
+    size = 0
+    for chunk in iter( lambda: reader.read( retrieval_chunk_size ), b'' ):
+        if hasher: hasher.update( chunk )
+        write( chunk )
+        size += len( chunk )
+    return size
+
+
+def _verify_response_size( http_reader, size ):
+    ''' Verifies that response was not truncated by dropped connection.
+
+        Reads of bounded size do not detect truncation on their own. '''
+    try: expected_size = int( http_reader.headers[ 'Content-Length' ] )
+    except ( KeyError, TypeError, ValueError ): return
+    if expected_size > size:
+        from http.client import IncompleteRead
+        raise IncompleteRead( b'', expected_size - size )
+
+
 def _normalize_retrieval_destination( destination ):
     if isinstance( destination, str ): destination = __.Path( destination )
     if isinstance( destination, __.Path ) and not destination.exists( ):
@@ -100,3 +437,23 @@ def _normalize_retrieval_destination( destination ):
             "as retrieval destination.".format(
                 class_name = __.derive_class_fqname( type( destination ) ) ) )
     return destination
+
+
+#: Seconds to wait on connection to host or on data from it.
+connection_timeout = 60
+#: Maximum number of idle connections to keep alive per host.
+connections_per_host_maximum = 8
+#: Bytes to read from response or file at a time.
+retrieval_chunk_size = 1 << 16
+
+# Idle keep-alive connections by scheme and host. Requests are not pipelined
+# on them, since 'http.client' awaits each response before the next request.
+_connections = { }
+_connections_mutex = _Mutex( )
+_host_gates = { }
+_host_gates_mutex = _Mutex( )
+_user_agent = "Python-urllib/{}.{}".format( *_python_version_info )
+
+try: from os import register_at_fork as _register_at_fork
+except ImportError: pass # Platform cannot fork.
+else: _register_at_fork( after_in_child = _forget_connections )
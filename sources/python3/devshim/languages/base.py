@@ -25,6 +25,7 @@ import typing as _typ
 
 # pylint: disable=unused-import
 from abc import ABCMeta as ABCFactory, abstractmethod as abstract
+from functools import cached_property
 from types import MappingProxyType as DictionaryProxy
 
 from .. import base as __
@@ -53,11 +54,13 @@ locations: _typ.Any
 class Language:
     ''' Model for language. '''
 
-    __slots__ = ( 'name', 'title', 'descriptor_class', 'version_parser', )
+    __slots__ = (
+        'name', 'title', 'descriptor_class', 'descriptors', 'version_parser', )
 
     def __init__( self, name, title, version_parser ):
         # TODO: Validate arguments.
         self.name = name
+        self.descriptors = { }
         self.title = title
         self.version_parser = version_parser
         self.descriptor_class = type(
@@ -79,18 +82,41 @@ class Language:
             If in a virtual environment, then the language descriptor for that
             environment is returned. Else, the first available language
             descriptor from the project descriptors is returned. '''
+        name = self.detect_default_descriptor_name( )
+        return self.produce_descriptor( name )
+
+    def detect_default_descriptor_name( self ):
+        ''' Detects name of default language descriptor.
+
+            Unlike instantiation of the descriptor, this does not summon or
+            create version records. '''
         # TODO: Detect if in relevant virtual environment and infer descriptor.
-        return next( iter( self.survey_descriptors( ).values( ) ) )
+        return next( iter( self.survey_descriptors( ).keys( ) ) )
 
     def produce_descriptor( self, descriptor = None ):
-        ''' Produces instance of language descriptor. '''
+        ''' Produces instance of language descriptor.
+
+            Instances are retained for the session. An instance is produced
+            anew only if the definitions or records of its descriptor have
+            changed since it was produced. '''
         if None is descriptor: return self.detect_default_descriptor( )
-        return self.descriptor_class( descriptor )
+        descriptor_class = self.descriptor_class
+        stamp = descriptor_class.calculate_stamp( descriptor )
+        entry = self.descriptors.get( descriptor )
+        if None is not entry and stamp == entry[ 0 ]: return entry[ 1 ]
+        instance = descriptor_class( descriptor )
+        # Records may have been created by instantiation.
+        self.descriptors[ descriptor ] = (
+            descriptor_class.calculate_stamp( descriptor ), instance )
+        return instance
 
     def survey_descriptors( self ):
-        ''' Returns language descriptors which have relevant definitions. '''
+        ''' Returns definitions of descriptors which are supportable.
+
+            Support is determined from the capabilities of the providers
+            alone, so that no versions are discovered by the survey. '''
         descriptor_class = self.descriptor_class
-        definitions = _data.definitions[ self.name ]
+        definitions = _summon_definitions( self.name )
         from os import environ as current_process_environment
         descriptor = current_process_environment.get(
             __.derive_environment_entry_name( self.name, 'descriptor' ) )
@@ -101,11 +127,10 @@ class Language:
                 raise create_data_validation_error(
                     f"No descriptor {descriptor!r} in definitions "
                     f"for language {self.title}." )
-        descriptors = { }
-        for descriptor, definition in definitions.items( ):
-            if not descriptor_class.is_supportable( definition ): continue
-            descriptors[ descriptor ] = descriptor_class( descriptor )
-        return DictionaryProxy( descriptors )
+        return DictionaryProxy( {
+            descriptor: DictionaryProxy( definition )
+            for descriptor, definition in definitions.items( )
+            if descriptor_class.is_supportable( definition ) } )
 
     def validate_descriptor( self, descriptor ):
         ''' Validates descriptor against available language descriptors. '''
@@ -122,21 +147,47 @@ class LanguageDescriptor( metaclass = ABCFactory ):
 
     language: Language
 
+    @classmethod
+    def calculate_stamp( class_, name ):
+        ''' Calculates stamp from modification times of descriptor data.
+
+            The data are the definitions of the language descriptors and the
+            records of the named descriptor. '''
+        stamps = [ ]
+        for location in (
+            _infer_definitions_location( class_.language.name ),
+            class_.infer_records_location( name ),
+        ):
+            try: stamps.append( location.stat( ).st_mtime_ns )
+            except FileNotFoundError: stamps.append( None )
+        return tuple( stamps )
+
     @classmethod
     def create_record( class_, name ):
         ''' Creates language descriptor record and persists it. '''
-        definition = _data.definitions[ class_.language.name ][ name ]
+        definition = _summon_definitions( class_.language.name )[ name ]
         location = class_.infer_records_location( name )
         if not location.exists( ): records = { }
         else: records = dict( class_.summon_records( name ) )
         from operator import itemgetter
         record = next( iter( sorted(
-            class_.survey_provider_support( definition ),
+            class_.discover_provider_versions( definition ),
             key = itemgetter( 'implementation-version' ), reverse = True ) ) )
         records[ calculate_platform_identifier( ) ] = dict( record )
         class_.persist_records( name, records )
         return record
 
+    @classmethod
+    def discover_provider_versions( class_, definition, platform = None ):
+        ''' Discovers current versions from supportive providers.
+
+            Each provider may spawn processes or access the network to
+            discover its current version, unless it has cached that. '''
+        return [
+            provider_class.form_version_record( definition )
+            for provider_class in class_.survey_provider_support(
+                definition, platform = platform ).values( ) ]
+
     @classmethod
     def infer_records_location( class_, descriptor = None ):
         ''' Infers location for language descriptor records.
@@ -184,7 +235,7 @@ class LanguageDescriptor( metaclass = ABCFactory ):
         if isinstance( descriptor, LanguageDescriptor ):
             return descriptor.definition
         if isinstance( descriptor, str ):
-            return _data.definitions[ class_.language.name ][ descriptor ]
+            return _summon_definitions( class_.language.name )[ descriptor ]
         return descriptor # TODO: Sanity-check definition.
 
     @classmethod
@@ -202,11 +253,10 @@ class LanguageDescriptor( metaclass = ABCFactory ):
         ''' Summons records for language descriptor. '''
         location = class_.infer_records_location( name )
         if not location.exists( ): class_.create_record( name )
-        from tomli import load as summon
-        with location.open( 'rb' ) as file:
-            # TODO: Check format version and update records format,
-            #       if necessary.
-            records = summon( file )[ 'platforms' ]
+        from ..fs_utilities import summon_toml
+        # TODO: Check format version and update records format,
+        #       if necessary.
+        records = summon_toml( location )[ 'platforms' ]
         records = {
             platform_name: DictionaryProxy( {
                 'implementation-version':
@@ -219,27 +269,35 @@ class LanguageDescriptor( metaclass = ABCFactory ):
 
     @classmethod
     def survey_provider_support( class_, definition, platform = None ):
-        ''' Surveys all providers which support language descriptor. '''
+        ''' Surveys all providers which support language descriptor.
+
+            Support is checked against capabilities of provider classes. '''
         definition = class_.provide_definition( definition )
         provider_classes = class_.provide_provider_classes( )
-        supports = [ ]
-        for provider_class in provider_classes.values( ):
-            if not provider_class.check_descriptor_support(
-                definition, platform = platform
-            ): continue
-            supports.append( provider_class.form_version_record( definition ) )
-        return supports
+        return DictionaryProxy( {
+            name: provider_class
+            for name, provider_class in provider_classes.items( )
+            if provider_class.check_descriptor_support(
+                definition, platform = platform ) } )
 
     def __init__( self, name ):
         # TODO: Validate name against definition keys.
         self.name = validate_argument_class( name, str, 'name', self.__init__ )
         self.definition = self._summon_definition( )
         self.record = self._summon_record( )
-        self.features = self._instantiate_features( )
-        self.providers = self._instantiate_providers( )
 
     def __str__( self ): return f"{self.language.title} {self.name}"
 
+    @cached_property
+    def features( self ):
+        ''' Language installation features, instantiated on first access. '''
+        return self._instantiate_features( )
+
+    @cached_property
+    def providers( self ):
+        ''' Language installation providers, instantiated on first access. '''
+        return self._instantiate_providers( )
+
     def infer_executables_location( self, name = None ):
         ''' Infers installation location for executables.
 
@@ -329,7 +387,7 @@ class LanguageDescriptor( metaclass = ABCFactory ):
 
     def _summon_definition( self ):
         return DictionaryProxy(
-            _data.definitions[ self.language.name ][ self.name ] )
+            _summon_definitions( self.language.name )[ self.name ] )
 
     def _summon_record( self ):
         records = self.summon_records( self.name )
@@ -627,20 +685,31 @@ def _calculate_locations( ):
     ) )
 
 
-def _summon_definitions( name ):
-    ''' Summons definitions for language descriptors. '''
+def _infer_definitions_location( name ):
     # TODO? Use 'importlib-resources' to access default definitions.
-    location = _data.locations.configuration / f"{name}.toml"
-    from tomli import load as summon
-    with location.open( 'rb' ) as file: document = summon( file )
+    return _data.locations.configuration / f"{name}.toml"
+
+
+def _summon_definitions( name ):
+    ''' Summons definitions for language descriptors.
+
+        Definitions are retained for the session and are summoned anew only
+        if their file has changed. '''
+    location = _infer_definitions_location( name )
+    stamp = location.stat( ).st_mtime_ns
+    entry = _definitions_cache.get( name )
+    if None is not entry and stamp == entry[ 0 ]: return entry[ 1 ]
+    from ..fs_utilities import summon_toml
+    document = summon_toml( location )
     # TODO: Check format version and dispatch accordingly.
-    return DictionaryProxy( document.get( 'descriptors', { } ) )
+    definitions = DictionaryProxy( document.get( 'descriptors', { } ) )
+    _definitions_cache[ name ] = ( stamp, definitions )
+    return definitions
+
+_definitions_cache = { }
 
 
 _data = create_semelfactive_namespace( create_invocable_dictionary(
-    definitions = (
-        # nosemgrep
-        lambda: create_semelfactive_dictionary( _summon_definitions ) ),
     locations = _calculate_locations,
 ) )
 __getattr__ = _data.__getattr__
@@ -37,13 +37,9 @@ class LanguageProvider( __.LanguageProvider ):
     @classmethod
     def discover_current_version( class_, definition ):
         # TODO: Validate version definition.
-        _ensure_installer( )
         pb_definition_name_base = (
             _calculate_pb_definition_name_base( definition ) )
-        from ....base import execute_external
-        pb_definition_names = execute_external(
-            ( _data.pb_executable_location, '--definitions' ),
-            capture_output = True ).stdout.strip( ).split( '\n' )
+        pb_definition_names = _survey_pb_definition_names( )
         # TODO: Filter prerelease versions by default, but allow override.
         pb_definition_name_candidates = [
             pb_definition_name for pb_definition_name in pb_definition_names
@@ -147,8 +143,13 @@ def _ensure_installer( ):
         if not is_older_than( repository_path, TimeDelta( days = 1 ) ):
             # TODO: Test execute permissions by current user.
             if _data.pb_executable_location.exists( ): return
+    # Retrieval is conditional and replaces archive only if it changed.
+    inode = (
+        repository_path.stat( ).st_ino if repository_path.exists( ) else None )
     from ....scm_utilities import github_retrieve_tarball
     github_retrieve_tarball( 'pyenv/pyenv', 'master', repository_path )
+    if inode == repository_path.stat( ).st_ino:
+        if _data.pb_executable_location.exists( ): return
     _install_installer_archive( repository_path )
 
 def _install_installer_archive( archive ):
@@ -208,6 +209,26 @@ def _produce_calculators( ):
         supportable_base_version = _prepare_supportable_base_version,
     )
 
+def _survey_pb_definition_names( ):
+    ''' Surveys names of definitions known to ``python-build``.
+
+        Surveyed at most once per process, since it may involve retrieval
+        of the installer and always involves a subprocess. Forked processes,
+        such as those which execute commands for the daemon, survey anew. '''
+    if 'names' not in _pb_definition_names_cache:
+        _ensure_installer( )
+        from ....base import execute_external
+        _pb_definition_names_cache[ 'names' ] = tuple( execute_external(
+            ( _data.pb_executable_location, '--definitions' ),
+            capture_output = True ).stdout.strip( ).split( '\n' ) )
+    return _pb_definition_names_cache[ 'names' ]
+
+_pb_definition_names_cache = { }
+
+try: from os import register_at_fork as _register_at_fork
+except ImportError: pass # Platform cannot fork.
+else: _register_at_fork( after_in_child = _pb_definition_names_cache.clear )
+
 _data = __.create_semelfactive_namespace( __.create_invocable_dictionary(
     _produce_calculators( )
 ) )
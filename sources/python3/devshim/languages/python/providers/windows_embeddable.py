@@ -151,10 +151,12 @@ def _verify_archive( location ):
 
 def _discover_versions( ):
     from bs4 import BeautifulSoup
+    # Retrieval is conditional upon changes since previous retrieval.
+    location = __.http_retrieve_url(
+        'https://www.python.org/downloads/windows',
+        _data.locations.downloads_page )
     html = BeautifulSoup(
-        __.http_retrieve_url(
-            'https://www.python.org/downloads/windows' ).decode( ),
-        'html.parser' )
+        location.read_text( encoding = 'utf-8' ), 'html.parser' )
     versions = [ ]
     for hyperlink in html.find_all( 'a' ):
         href = hyperlink.get( 'href' )
@@ -196,10 +198,9 @@ def _summon_versions( ):
     if must_discover:
         versions = _discover_versions( )
         _persist_versions( versions )
-    from tomli import load as summon
-    with location.open( 'rb' ) as file:
-        # TODO: Check format version and update records format, if necessary.
-        records = summon( file )[ 'versions' ]
+    from ....fs_utilities import summon_toml
+    # TODO: Check format version and update records format, if necessary.
+    records = summon_toml( location )[ 'versions' ]
     return __.DictionaryProxy( {
         __.language.version_parser( version ): data
         for version, data in records.items( ) } )
@@ -212,6 +213,8 @@ def _calculate_locations( ):
     base_location = locations.data / 'python/providers/windows-embeddable'
     return create_immutable_namespace( dict(
         archives = user_directories.artifacts / 'windows-embeddable',
+        downloads_page = (
+            user_directories.caches / 'windows-embeddable/downloads.html' ),
         version_records = base_location / 'versions.toml',
     ) )
 
@@ -74,6 +74,9 @@ def calculate_user_directories( ):
         caches = caches_location,
         data = data_location,
         installations = data_location / 'installations',
+        pypi_digests = caches_location / 'pypi-digests',
+        unpacked_wheels = caches_location / 'unpacked-wheels',
+        wheelhouse = caches_location / 'wheelhouse',
     ) )
 
 
@@ -96,8 +99,12 @@ def _calculate_caches_locations( locations ):
         DEV = __.SimpleNamespace(
             SELF = caches_path / f"{__package__}",
             repositories = caches_path / f"{__package__}/repositories",
+            snapshots = caches_path / f"{__package__}/snapshots",
+            tasks_manifest = caches_path / f"{__package__}/tasks.json",
+            venv_snapshots = caches_path / f"{__package__}/venv-snapshots",
         ),
         hypothesis = caches_path / 'hypothesis',
+        mypy = caches_path / 'mypy',
         setuptools = caches_path / 'setuptools',
         sphinx = caches_path / 'sphinx',
     )
@@ -120,8 +127,9 @@ def _calculate_configuration_locations( locations ):
         # TODO? Move 'pypackages.toml' to Devshim config path.
         #       Or move into 'pyproject.toml'.
         pypackages = location / 'pypackages.toml',
-        # TODO: Move 'pypackages.fixtures.toml' to state path.
-        pypackages_fixtures = location / 'pypackages.fixtures.toml',
+        # TODO: Move 'pypackages.fixtures' to state path.
+        pypackages_fixtures = location / 'pypackages.fixtures',
+        pypackages_fixtures_legacy = location / 'pypackages.fixtures.toml',
         pyproject = locations.project / 'pyproject.toml',
     )
 
@@ -165,6 +173,11 @@ def _calculate_state_locations( locations ):
         SELF = location,
         DEV = __.SimpleNamespace(
             SELF = my_location,
+            daemon_log = my_location / 'daemon.log',
+            daemon_socket = my_location / 'daemon.socket',
+            fingerprints = my_location / 'fingerprints',
+            python_identifiers = my_location / 'python-identifiers.json',
+            telemetry = my_location / 'telemetry',
         ),
     )
 
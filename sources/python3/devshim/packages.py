@@ -27,36 +27,142 @@
 
 
 from re import compile as _regex_compile
+from threading import Lock as _Mutex
 
 from . import base as __
 
 
 def install_python_packages( process_environment, identifier = None ):
-    ''' Installs required Python packages into virtual environment. '''
+    ''' Installs required Python packages into virtual environment.
+
+        A fingerprint of the installation is recorded in the virtual
+        environment. If it matches on a later installation, then nothing is
+        installed. If only requirements have changed since, then only the
+        changed requirements are installed. Set the ``DEVSHIM_FINGERPRINTS``
+        environment variable to ``ignore`` to install everything anyway.
+
+        Without an identifier, the packages are upgraded and the recorded
+        fingerprint is disregarded. '''
     from .base import execute_external
-    raw, frozen, unpublished = generate_pip_requirements_text(
+    raw, frozen, unpublished = _generate_pip_requirements(
         identifier = identifier )
-    if not identifier or not frozen:
+    is_frozen = bool( identifier and frozen ) and _are_fixtures_complete(
+        raw, frozen, unpublished )
+    venv_location = _derive_venv_location( process_environment )
+    fingerprint = _calculate_venv_fingerprint(
+        venv_location, frozen if is_frozen else raw, unpublished, is_frozen )
+    # Upgrades depend on the state of the package index, not only on local
+    # inputs, and so cannot be skipped by fingerprint.
+    recorded_fingerprint = (
+        _summon_venv_fingerprint( venv_location ) if identifier else None )
+    if None is not fingerprint and fingerprint == recorded_fingerprint:
+        __.scribe.info( "Python packages in virtual environment up to date." )
+        return
+    is_partial = _is_venv_fingerprint_compatible(
+        fingerprint, recorded_fingerprint )
+    if is_partial:
+        requirements = _filter_changed_requirements(
+            fingerprint, recorded_fingerprint, 'requirements' )
+        unpublished = _filter_changed_requirements(
+            fingerprint, recorded_fingerprint, 'unpublished' )
+        should_install_project = (
+            fingerprint[ 'project' ] != recorded_fingerprint[ 'project' ] )
+    else:
+        requirements = frozen if is_frozen else raw
+        should_install_project = True
+    if requirements and not is_frozen:
         pip_options = [ ]
         if not identifier:
             pip_options.append( '--upgrade' )
             pip_options.append( '--upgrade-strategy=eager' )
         execute_pip_with_requirements(
-            process_environment, 'install', raw, pip_options = pip_options )
-    else:
+            process_environment, 'install', '\n'.join( requirements ),
+            pip_options = pip_options )
+    elif requirements:
         pip_options = [ '--require-hashes' ]
-        execute_pip_with_requirements(
-            process_environment, 'install', frozen, pip_options = pip_options )
+        # Fixtures are complete closure of dependencies. Changed fixtures
+        # from a partial match need not pull in dependencies of their own.
+        if is_partial: pip_options.append( '--no-deps' )
+        _install_frozen_python_packages(
+            process_environment, identifier, requirements, pip_options )
     if unpublished:
         execute_pip_with_requirements(
-            process_environment, 'install', unpublished )
+            process_environment, 'install', '\n'.join( unpublished ) )
     # Pip cannot currently mix editable and digest-bound requirements,
     # so we must install editable packages separately. (As of 2022-02-06.)
     # https://github.com/pypa/pip/issues/4995
-    execute_external(
-        ( _derive_python_location( process_environment ),
-          *'-m pip install --editable .'.split( ), ),
-        env = process_environment )
+    if should_install_project:
+        execute_external(
+            ( _derive_python_location( process_environment ),
+              *'-m pip install --editable .'.split( ), ),
+            env = process_environment )
+    _persist_venv_fingerprint( venv_location, fingerprint )
+
+
+def _are_fixtures_complete( raw, frozen, unpublished ):
+    ''' Do frozen and unpublished requirements cover all raw requirements?
+
+        Raw requirements with environment markers are not considered, since
+        the markers cannot be evaluated for the target interpreter here.
+        Neither are build tools, which are never recorded as fixtures,
+        since ``pip freeze`` omits them. '''
+    from packaging.requirements import InvalidRequirement, Requirement
+    from packaging.utils import canonicalize_name
+    names = {
+        *map( _extract_frozen_requirement_name, frozen ),
+        *( canonicalize_name( Requirement( requirement ).name )
+           for requirement in unpublished ),
+        *_build_tools_names }
+    for requirement in raw:
+        try: requirement_ = Requirement( requirement )
+        except InvalidRequirement: continue
+        if requirement_.marker: continue
+        if canonicalize_name( requirement_.name ) not in names:
+            __.scribe.info(
+                f"No fixture for {requirement_.name!r}. "
+                "Installing from raw requirements." )
+            return False
+    return True
+
+
+# Distributions which 'pip freeze' omits on Python versions before 3.12.
+_build_tools_names = frozenset( (
+    'distribute', 'pip', 'setuptools', 'wheel' ) )
+
+
+def _install_frozen_python_packages(
+    process_environment, identifier, requirements, pip_options
+):
+    ''' Installs frozen requirements, from wheelhouse when possible.
+
+        Missing artifacts are prefetched into the wheelhouse first. Wheels
+        from the wheelhouse are installed natively, where possible, and by
+        Pip otherwise. If prefetching or installation from the wheelhouse
+        fails, then packages are installed from the package index instead. '''
+    from subprocess import CalledProcessError # nosec B404
+    try:
+        prefetch_python_packages(
+            process_environment, identifier, requirements )
+    except ( CalledProcessError, OSError ) as exc:
+        __.scribe.warning( f"Could not prefetch into wheelhouse: {exc}" )
+    requirements_ = _produce_wheelhouse_requirements(
+        identifier, requirements )
+    if None is not requirements_:
+        requirements = _install_wheels_natively(
+            process_environment, identifier, requirements )
+        if not requirements: return
+        requirements_ = _produce_wheelhouse_requirements(
+            identifier, requirements )
+        try:
+            execute_pip_with_requirements(
+                process_environment, 'install', '\n'.join( requirements_ ),
+                pip_options = pip_options )
+        except CalledProcessError as exc:
+            __.scribe.warning( f"Could not install from wheelhouse: {exc}" )
+        else: return
+    execute_pip_with_requirements(
+        process_environment, 'install', '\n'.join( requirements ),
+        pip_options = pip_options )
 
 
 def execute_pip_with_requirements(
@@ -85,6 +191,15 @@ def execute_pip_with_requirements(
 
 def generate_pip_requirements_text( identifier = None ):
     ''' Generates Pip requirements lists from local configuration. '''
+    return tuple(
+        '\n'.join( requirements ) for requirements
+        in _generate_pip_requirements( identifier = identifier ) )
+
+
+def _generate_pip_requirements( identifier = None ):
+    ''' Generates Pip requirements from local configuration.
+
+        Each frozen requirement, with its digests, is one entry. '''
     # https://pip.pypa.io/en/stable/reference/requirements-file-format/
     # https://pip.pypa.io/en/stable/topics/repeatable-installs/
     specifications, fixtures = indicate_python_packages(
@@ -103,7 +218,7 @@ def generate_pip_requirements_text( identifier = None ):
                 f"--hash {digest}" for digest in fixture.digests )
             frozen.append( f"{name}=={fixture.version} \\\n    {options}" )
     raw.extend( extract_python_package_requirements( specifications ) )
-    return '\n'.join( raw ), '\n'.join( frozen ), '\n'.join( unpublished )
+    return raw, frozen, unpublished
 
 
 def ensure_python_packages( domain = '*', excludes = ( ) ):
@@ -212,6 +327,125 @@ def _canonicalize_pypackages_domain( domain ):
     raise RuntimeError( 'invalid state', f"Invalid domain: {domain!r}" )
 
 
+def _calculate_venv_fingerprint(
+    venv_location, requirements, unpublished, is_frozen
+):
+    ''' Calculates fingerprint of installation into virtual environment.
+
+        The fingerprint covers the interpreter of the virtual environment,
+        the requirements, the project metadata for the editable installation,
+        and the distributions which are currently installed. Returns
+        ``None`` if not a virtual environment which we manage or if
+        fingerprints are ignored. '''
+    if None is venv_location: return None
+    if 'ignore' == __.view_environment_entry( ( 'fingerprints', ) ):
+        return None
+    from hashlib import sha256
+    from .data import paths
+    from .environments import generate_venv_executable_location
+    python_location = generate_venv_executable_location(
+        'python', venv_path = venv_location ).resolve( )
+    python_stat = python_location.stat( )
+    configuration_location = venv_location / 'pyvenv.cfg'
+    hasher = sha256( )
+    for location in (
+        configuration_location,
+        paths.configuration.pyproject,
+        paths.project / 'setup.cfg',
+        paths.project / 'setup.py',
+    ):
+        hasher.update( b'\0' )
+        if location.is_file( ): hasher.update( location.read_bytes( ) )
+    return dict(
+        distributions = _survey_venv_distributions( venv_location ),
+        interpreter = (
+            f"{python_location}:{python_stat.st_size}:"
+            f"{python_stat.st_mtime_ns}" ),
+        mode = 'frozen' if is_frozen else 'raw',
+        project = hasher.hexdigest( ),
+        requirements = list( requirements ),
+        unpublished = list( unpublished ),
+        version = __.version,
+    )
+
+
+def _derive_venv_fingerprint_location( venv_location ):
+    return venv_location / f"{__package__}-packages.json"
+
+
+def _derive_venv_location( process_environment ):
+    if 'OUR_VENV_NAME' not in process_environment: return None
+    from .data import locations
+    return locations.environments / process_environment[ 'OUR_VENV_NAME' ]
+
+
+def _filter_changed_requirements( fingerprint, recorded_fingerprint, kind ):
+    recorded_requirements = frozenset( recorded_fingerprint[ kind ] )
+    return [
+        requirement for requirement in fingerprint[ kind ]
+        if requirement not in recorded_requirements ]
+
+
+def _is_venv_fingerprint_compatible( fingerprint, recorded_fingerprint ):
+    ''' Can installation be updated from recorded fingerprint?
+
+        The virtual environment must have the same interpreter and mode of
+        installation. And its distributions must not have been altered since
+        the recording. '''
+    if None is fingerprint or None is recorded_fingerprint: return False
+    return all(
+        fingerprint[ name ] == recorded_fingerprint.get( name )
+        for name in ( 'distributions', 'interpreter', 'mode', 'version' ) )
+
+
+def _persist_venv_fingerprint( venv_location, fingerprint ):
+    ''' Persists fingerprint with distributions surveyed after installation.
+
+        Failure to persist is not fatal. '''
+    if None is fingerprint: return
+    from json import dumps
+    from os import getpid, replace
+    fingerprint = dict(
+        fingerprint,
+        distributions = _survey_venv_distributions( venv_location ) )
+    location = _derive_venv_fingerprint_location( venv_location )
+    temporary_location = location.with_name(
+        f".{location.name}.{getpid( )}.partial" )
+    try:
+        temporary_location.write_text(
+            dumps( fingerprint, indent = 2, sort_keys = True ),
+            encoding = 'utf-8' )
+        replace( temporary_location, location )
+    except OSError as exc:
+        __.scribe.warning( f"Could not persist venv fingerprint: {exc}" )
+
+
+def _summon_venv_fingerprint( venv_location ):
+    if None is venv_location: return None
+    from json import loads
+    location = _derive_venv_fingerprint_location( venv_location )
+    try: return loads( location.read_text( encoding = 'utf-8' ) )
+    except ( OSError, ValueError ): return None
+
+
+def _survey_venv_distributions( venv_location ):
+    ''' Surveys names of distributions installed in virtual environment. '''
+    return sorted(
+        path.name
+        for location in _survey_venv_site_packages_locations( venv_location )
+        for path in location.glob( '*.dist-info' ) )
+
+
+def _survey_venv_site_packages_locations( venv_location ):
+    patterns = (
+        'lib/python*/site-packages', 'lib/pypy*/site-packages',
+        'Lib/site-packages', )
+    return tuple(
+        location
+        for pattern in patterns for location in venv_location.glob( pattern )
+        if location.is_dir( ) )
+
+
 def _derive_python_location( process_environment ):
     if 'OUR_VENV_NAME' not in process_environment: return 'python'
     from .data import locations
@@ -231,18 +465,19 @@ def indicate_python_packages( identifier = None ):
         First return value is contents of packages specifications file.
         Second return value is list of dependency fixtures for the given
         platform identifier. Will be empty if none is given. '''
-    from tomli import load
     from .data import paths
-    fixtures_path = paths.configuration.pypackages_fixtures
-    if identifier and fixtures_path.exists( ):
-        with fixtures_path.open( 'rb' ) as file:
-            fixtures = load( file ).get( identifier, [ ] )
+    from .fs_utilities import summon_toml
+    if identifier:
+        _migrate_python_packages_fixtures( )
+        shard_path = _derive_python_packages_fixtures_shard_path( identifier )
+        if shard_path.exists( ):
+            fixtures = summon_toml( shard_path ).get( 'fixtures', [ ] )
+        else: fixtures = [ ]
     else: fixtures = [ ]
-    with paths.configuration.pypackages.open( 'rb' ) as file:
-        specifications = load( file )
-    with paths.configuration.pyproject.open( 'rb' ) as file:
-        specifications[ 'construction' ] = (
-            load( file )[ 'build-system' ][ 'requires' ] )
+    specifications = summon_toml( paths.configuration.pypackages )
+    specifications[ 'construction' ] = (
+        summon_toml( paths.configuration.pyproject )
+        [ 'build-system' ][ 'requires' ] )
     return specifications, fixtures
 
 
@@ -263,50 +498,134 @@ def _ensure_python_packages( requirements ):
 
 
 def record_python_packages_fixtures( identifier, fixtures ):
-    ''' Records table of Python packages fixtures. '''
-    from operator import itemgetter
-    from tomli import load
-    from tomli_w import dump
+    ''' Records table of Python packages fixtures.
+
+        Only the shard for the identifier is rewritten, along with the index
+        of shards, if the identifier is new to it. '''
+    _migrate_python_packages_fixtures( )
+    _persist_toml_atomically(
+        _derive_python_packages_fixtures_shard_path( identifier ),
+        dict( fixtures = fixtures ) )
+    shards = _summon_python_packages_fixtures_index( )
+    if identifier in shards: return
+    shards[ identifier ] = f"{identifier}.toml"
+    _persist_python_packages_fixtures_index( shards )
+
+
+def calculate_python_packages_fixtures_digest( identifier ):
+    ''' Calculates digest of Python packages fixtures for identifier.
+
+        The digest also covers the packages specifications and the project
+        metadata for the editable installation. Returns ``None`` if no
+        fixtures are recorded for the identifier. '''
+    from hashlib import sha256
     from .data import paths
-    fixtures_path = paths.configuration.pypackages_fixtures
-    if fixtures_path.exists( ):
-        with fixtures_path.open( 'rb' ) as file: document = load( file )
-    else: document = { }
-    document[ identifier ] = fixtures
-    # Minimize delta sizes for SCM commits by preserving order.
-    # I.e., a micro version bump should not reshuffle a large block of data.
-    document = dict( sorted( document.items( ), key = itemgetter( 0 ) ) )
-    with fixtures_path.open( 'wb' ) as file: dump( document, file )
+    _migrate_python_packages_fixtures( )
+    shard_path = _derive_python_packages_fixtures_shard_path( identifier )
+    if not shard_path.is_file( ): return None
+    hasher = sha256( )
+    for location in (
+        shard_path,
+        paths.configuration.pypackages,
+        paths.configuration.pyproject,
+        paths.project / 'setup.cfg',
+        paths.project / 'setup.py',
+    ):
+        hasher.update( b'\0' )
+        if location.is_file( ): hasher.update( location.read_bytes( ) )
+    return hasher.hexdigest( )
 
 
 def delete_python_packages_fixtures( identifiers ):
     ''' Deletes tables of Python packages fixtures. '''
-    from tomli import load
+    _migrate_python_packages_fixtures( )
+    shards = _summon_python_packages_fixtures_index( )
+    for identifier in identifiers:
+        shard_path = _derive_python_packages_fixtures_shard_path( identifier )
+        if shard_path.exists( ): shard_path.unlink( )
+        shards.pop( identifier, None )
+    _persist_python_packages_fixtures_index( shards )
+
+
+def _derive_python_packages_fixtures_shard_path( identifier ):
+    from .data import paths
+    return paths.configuration.pypackages_fixtures / f"{identifier}.toml"
+
+
+def _migrate_python_packages_fixtures( ):
+    ''' Splits legacy Python packages fixtures file into shards.
+
+        Each table of the legacy file becomes the shard for its identifier.
+        The legacy file is removed afterwards. '''
+    from .data import paths
+    legacy_path = paths.configuration.pypackages_fixtures_legacy
+    if not legacy_path.exists( ): return
+    __.scribe.info(
+        f"Migrating Python packages fixtures from {str( legacy_path )!r}." )
+    from .fs_utilities import summon_toml
+    document = summon_toml( legacy_path )
+    shards = _summon_python_packages_fixtures_index( )
+    for identifier, fixtures in document.items( ):
+        _persist_toml_atomically(
+            _derive_python_packages_fixtures_shard_path( identifier ),
+            dict( fixtures = fixtures ) )
+        shards[ identifier ] = f"{identifier}.toml"
+    _persist_python_packages_fixtures_index( shards )
+    legacy_path.unlink( )
+
+
+def _persist_python_packages_fixtures_index( shards ):
+    from operator import itemgetter
+    from .data import paths
+    # Minimize delta sizes for SCM commits by preserving order.
+    shards = dict( sorted( shards.items( ), key = itemgetter( 0 ) ) )
+    _persist_toml_atomically(
+        paths.configuration.pypackages_fixtures / 'index.toml',
+        { 'format-version': 1, 'shards': shards } )
+
+
+def _persist_toml_atomically( location, document ):
+    ''' Persists TOML document via temporary file and replacement. '''
+    from os import getpid, replace
     from tomli_w import dump
+    from .fs_utilities import ensure_directory
+    ensure_directory( location.parent )
+    temporary_location = location.with_suffix( f".{getpid( )}.partial" )
+    with temporary_location.open( 'wb' ) as file: dump( document, file )
+    replace( temporary_location, location )
+
+
+def _summon_python_packages_fixtures_index( ):
+    ''' Summons index of Python packages fixtures shards. '''
     from .data import paths
-    fixtures_path = paths.configuration.pypackages_fixtures
-    if not fixtures_path.exists( ): return
-    with fixtures_path.open( 'rb' ) as file: document = load( file )
-    for identifier in identifiers:
-        if identifier not in document: continue
-        document.pop( identifier )
-    with fixtures_path.open( 'wb' ) as file: dump( document, file )
+    from .fs_utilities import summon_toml
+    location = paths.configuration.pypackages_fixtures / 'index.toml'
+    if not location.exists( ): return { }
+    # TODO: Check format version and update index format, if necessary.
+    return dict( summon_toml( location ).get( 'shards', { } ) )
 
 
 def calculate_python_packages_fixtures( environment ):
     ''' Calculates Python package fixtures, such as digests or URLs. '''
+    entries = [
+        entry for entry in indicate_current_python_packages( environment )
+        if 'editable' not in entry.flags ]
+    releases = [
+        ( entry.requirement.name,
+          next( iter( entry.requirement.specifier ) ).version )
+        for entry in entries if not entry.requirement.url ]
+    digests_by_release = dict( zip(
+        releases, aggregate_pypi_releases_digests( releases ) ) )
     fixtures = [ ]
-    for entry in indicate_current_python_packages( environment ):
+    for entry in entries:
         requirement = entry.requirement
         fixture = dict( name = requirement.name )
-        if 'editable' in entry.flags: continue
         if requirement.url: fixture.update( dict( url = requirement.url, ) )
         else:
             package_version = next( iter( requirement.specifier ) ).version
-            try:
-                digests = aggregate_pypi_release_digests(
-                    requirement.name, package_version )
-            except: continue # pylint: disable=bare-except
+            digests = digests_by_release[
+                ( requirement.name, package_version ) ]
+            if None is digests: continue
             fixture.update( dict(
                 version = package_version,
                 digests = tuple( map( lambda s: f"sha256:{s}", digests ) )
@@ -315,8 +634,51 @@ def calculate_python_packages_fixtures( environment ):
     return fixtures
 
 
-def indicate_current_python_packages( environment ):
-    ''' Returns currently-installed Python packages. '''
+def indicate_current_python_packages( environment, use_pip = False ):
+    ''' Returns currently-installed Python packages.
+
+        For virtual environments, which we manage, the distribution metadata
+        in their site packages is scanned directly. This is much faster than
+        starting Pip in a subprocess and reports the same entries as
+        ``pip freeze`` would, except that editable installations from
+        Git work trees are reported with local file URLs rather than their
+        remote URLs. Pip is used for other environments or if requested. '''
+    venv_location = _derive_venv_location( environment )
+    if use_pip or None is venv_location:
+        return _indicate_current_python_packages_via_pip( environment )
+    return _survey_current_python_packages( venv_location )
+
+
+def _derive_pep440_direct_reference( direct_url ):
+    ''' Derives PEP 440 direct reference from PEP 610 direct URL record.
+
+        Matches the references which ``pip freeze`` reports. '''
+    url = direct_url[ 'url' ]
+    fragments = [ ]
+    if 'vcs_info' in direct_url:
+        vcs_info = direct_url[ 'vcs_info' ]
+        url = f"{vcs_info[ 'vcs' ]}+{url}@{vcs_info[ 'commit_id' ]}"
+    elif 'archive_info' in direct_url:
+        archive_info = direct_url[ 'archive_info' ]
+        if 'hash' in archive_info: fragments.append( archive_info[ 'hash' ] )
+    if 'subdirectory' in direct_url:
+        fragments.append( f"subdirectory={direct_url[ 'subdirectory' ]}" )
+    if fragments: url = f"{url}#{'&'.join( fragments )}"
+    return url
+
+
+def _derive_venv_freeze_excludes( venv_location ):
+    ''' Derives names of distributions which ``pip freeze`` omits.
+
+        Pip omits build tools as well as itself on Python versions before
+        3.12, which do not bundle the build tools in new environments. '''
+    version = _probe_venv_python_version( venv_location )
+    if None is not version and ( 3, 12 ) <= version: return { 'pip' }
+    return set( _build_tools_names )
+
+
+def _indicate_current_python_packages_via_pip( environment ):
+    ''' Returns currently-installed Python packages via ``pip freeze``. '''
     eggstractor = _regex_compile(
         r'''.*#egg=(?P<package_name>\w[\w\-]+\w)(?:&.*)?$''' )
     from types import SimpleNamespace
@@ -346,21 +708,393 @@ def indicate_current_python_packages( environment ):
     return entries
 
 
+def _is_git_work_tree_with_remote( location ):
+    ''' Is location within Git work tree, which has a remote?
+
+        Pip only reports editable installations from such work trees as VCS
+        requirements. '''
+    for location_ in ( location, *location.parents ):
+        git_location = location_ / '.git'
+        if git_location.is_file( ): # Linked work tree or submodule.
+            try: content = git_location.read_text( encoding = 'utf-8' )
+            except OSError: return False
+            if not content.startswith( 'gitdir:' ): return False
+            git_location = location_ / content[ 7 : ].strip( )
+        elif not git_location.is_dir( ): continue
+        # Linked work trees share configuration of main repository.
+        common_location = git_location / 'commondir'
+        if common_location.is_file( ):
+            git_location = git_location / common_location.read_text(
+                encoding = 'utf-8' ).strip( )
+        try:
+            configuration = ( git_location / 'config' ).read_text(
+                encoding = 'utf-8' )
+        except OSError: return False
+        return '[remote "' in configuration
+    return False
+
+
+def _probe_venv_python_version( venv_location ):
+    ''' Probes major and minor Python version from venv configuration. '''
+    try:
+        lines = ( venv_location / 'pyvenv.cfg' ).read_text(
+            encoding = 'utf-8' ).splitlines( )
+    except OSError: return None
+    for line in lines:
+        name, _, value = line.partition( '=' )
+        if name.strip( ) not in ( 'version', 'version_info' ): continue
+        try: return tuple( map( int, value.strip( ).split( '.' )[ : 2 ] ) )
+        except ValueError: continue
+    return None
+
+
+def _survey_current_python_packages( venv_location ):
+    ''' Surveys distributions in site packages of virtual environment. '''
+    from importlib.metadata import distributions
+    from packaging.utils import canonicalize_name
+    excludes = _derive_venv_freeze_excludes( venv_location )
+    locations = _survey_venv_site_packages_locations( venv_location )
+    entries = { }
+    for distribution in distributions(
+        path = [ str( location ) for location in locations ]
+    ):
+        name = distribution.metadata[ 'Name' ]
+        if not name: continue
+        canonical_name = canonicalize_name( name )
+        # Earlier distributions on path shadow later ones.
+        if canonical_name in excludes or canonical_name in entries: continue
+        entry = _survey_distribution( distribution, name )
+        if None is not entry: entries[ canonical_name ] = entry
+    # Legacy editable installations only leave links in site packages.
+    for link_location in (
+        link_location for location in locations
+        for link_location in location.glob( '*.egg-link' )
+    ):
+        entry = _survey_egg_link( link_location )
+        if None is entry: continue
+        canonical_name = canonicalize_name( entry.requirement.name )
+        if canonical_name in excludes or canonical_name in entries: continue
+        entries[ canonical_name ] = entry
+    return sorted(
+        entries.values( ),
+        key = lambda entry: entry.requirement.name.lower( ) )
+
+
+def _survey_egg_link( location ):
+    ''' Surveys editable requirement from legacy link to project.
+
+        Returns ``None`` unless project is in Git work tree with remote. '''
+    from importlib.metadata import distributions
+    from pathlib import Path
+    from types import SimpleNamespace
+    from packaging.requirements import Requirement
+    try:
+        project_location = Path( location.read_text(
+            encoding = 'utf-8' ).splitlines( )[ 0 ].strip( ) )
+    except ( IndexError, OSError ): return None
+    if not _is_git_work_tree_with_remote( project_location ): return None
+    for distribution in distributions( path = [ str( project_location ) ] ):
+        name = distribution.metadata[ 'Name' ]
+        if not name: continue
+        return SimpleNamespace(
+            flags = [ 'editable' ],
+            requirement = Requirement(
+                f"{name}@ {project_location.as_uri( )}" ) )
+    return None
+
+
+def _survey_distribution( distribution, name ):
+    ''' Surveys requirement and flags of distribution.
+
+        Returns ``None`` for distributions which ``pip freeze`` would not
+        report in a usable form. '''
+    from json import loads
+    from pathlib import Path
+    from types import SimpleNamespace
+    from urllib.parse import urlparse as parse_url
+    from urllib.request import url2pathname
+    from packaging.requirements import Requirement
+    entry = SimpleNamespace( flags = [ ] )
+    direct_url_text = distribution.read_text( 'direct_url.json' )
+    try: direct_url = loads( direct_url_text ) if direct_url_text else None
+    except ValueError: direct_url = None
+    if direct_url:
+        url = direct_url.get( 'url', '' )
+        if direct_url.get( 'dir_info', { } ).get( 'editable' ):
+            if not url.startswith( 'file:' ): return None
+            location = Path( url2pathname( parse_url( url ).path ) )
+            if not _is_git_work_tree_with_remote( location ): return None
+            entry.flags.append( 'editable' )
+        requirement = (
+            f"{name}@ {_derive_pep440_direct_reference( direct_url )}" )
+    elif '+' in distribution.version: return None # Skip local versions.
+    else: requirement = f"{name}=={distribution.version}"
+    entry.requirement = Requirement( requirement )
+    return entry
+
+
 pypi_release_digests_cache = { }
 def aggregate_pypi_release_digests( name, version, index_url = '' ):
-    ''' Aggregates hashes for release on PyPI. '''
+    ''' Aggregates hashes for release on PyPI.
+
+        Since digests of published releases are immutable, they are also
+        cached in the user cache directory, where they are shared across
+        projects and Python versions. '''
     cache_index = ( index_url, name, version )
     digests = pypi_release_digests_cache.get( cache_index )
     if digests: return digests
-    release_info = retrieve_pypi_release_information(
-        name, version, index_url = index_url )
-    digests = [
-        package_info[ 'digests' ][ 'sha256' ]
-        for package_info in release_info ]
+    digests = _summon_pypi_release_digests( cache_index )
+    if not digests:
+        release_info = retrieve_pypi_release_information(
+            name, version, index_url = index_url )
+        digests = [
+            package_info[ 'digests' ][ 'sha256' ]
+            for package_info in release_info ]
+        if digests: _persist_pypi_release_digests( cache_index, digests )
     pypi_release_digests_cache[ cache_index ] = digests
     return digests
 
 
+#: Maximum total size, in bytes, of persistent cache of PyPI digests.
+pypi_release_digests_cache_size_maximum = 16 * 1024 * 1024
+
+
+def _derive_pypi_release_digests_location( cache_index ):
+    ''' Derives location of cache entry from its content address. '''
+    from hashlib import sha256
+    from packaging.utils import canonicalize_name
+    from .data import user_directories
+    index_url, name, version = cache_index
+    address = sha256( '\0'.join( (
+        index_url or 'https://pypi.org', canonicalize_name( name ), version,
+    ) ).encode( ) ).hexdigest( )
+    return user_directories.pypi_digests / address[ : 2 ] / address
+
+
+def _persist_pypi_release_digests( cache_index, digests ):
+    ''' Persists digests for release into cache. Evicts, if necessary.
+
+        Failure to persist is not fatal. '''
+    from json import dumps
+    from os import getpid, replace
+    from threading import get_ident
+    from .fs_utilities import ensure_directory
+    location = _derive_pypi_release_digests_location( cache_index )
+    temporary_location = location.with_suffix(
+        f".{getpid( )}-{get_ident( )}.partial" )
+    try:
+        ensure_directory( location.parent )
+        temporary_location.write_text( dumps( digests ), encoding = 'utf-8' )
+        replace( temporary_location, location )
+    except OSError as exc:
+        __.scribe.warning( f"Could not cache digests: {exc}" )
+        return
+    with _pypi_release_digests_cache_mutex:
+        if _pypi_release_digests_cache_state.get( 'evicted' ): return
+        _pypi_release_digests_cache_state[ 'evicted' ] = True
+    _evict_pypi_release_digests( )
+
+
+def _evict_pypi_release_digests( ):
+    ''' Evicts least recently used digests until cache is within size.
+
+        Recency of use is tracked by modification time of each entry. '''
+    from .data import user_directories
+    entries = [ ]
+    for location in user_directories.pypi_digests.glob( '*/*' ):
+        try: stat_result = location.stat( )
+        except OSError: continue
+        entries.append(
+            ( stat_result.st_mtime_ns, stat_result.st_size, location ) )
+    size = sum( entry[ 1 ] for entry in entries )
+    for _, entry_size, location in sorted( entries ):
+        if pypi_release_digests_cache_size_maximum >= size: break
+        try: location.unlink( )
+        except OSError: continue
+        size -= entry_size
+
+
+def _summon_pypi_release_digests( cache_index ):
+    ''' Summons digests for release from cache, if they are present. '''
+    from json import loads
+    from os import utime
+    location = _derive_pypi_release_digests_location( cache_index )
+    try:
+        digests = loads( location.read_text( encoding = 'utf-8' ) )
+        utime( location ) # Mark as recently used.
+    except ( OSError, ValueError ): return None
+    return digests
+
+
+_pypi_release_digests_cache_mutex = _Mutex( )
+_pypi_release_digests_cache_state = { }
+
+
+def aggregate_pypi_releases_digests( releases, index_url = '', jobs = 8 ):
+    ''' Aggregates hashes for several releases on PyPI concurrently.
+
+        Each release is a pair of package name and version. The digests are
+        returned in the order of the releases. If the digests for a release
+        cannot be retrieved, then ``None`` is returned in its place. At most
+        ``jobs`` retrievals are in flight at once. '''
+    def aggregate( release ):
+        try: return aggregate_pypi_release_digests( *release, index_url )
+        except Exception: # pylint: disable=broad-except
+            __.scribe.warning(
+                "Could not retrieve digests for {} {}.".format( *release ) )
+            return None
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor( max_workers = jobs ) as executor:
+        return list( executor.map( aggregate, releases ) )
+
+
+def lock_python_packages(
+    location, requirements, python_locations, index_url = '', jobs = 8
+):
+    ''' Locks exact, hashed requirements for several Python interpreters.
+
+        The requirements are resolved by Pip for each interpreter, without
+        installing anything. Releases from an existing lock are preferred,
+        unless the requirements no longer admit them, so that relocking
+        only changes what it must. Digests for all
+        artifacts of each release are then aggregated concurrently. Releases,
+        which only some interpreters need, are qualified by environment
+        markers. '''
+    constraints = _filter_python_packages_lock_constraints(
+        _extract_python_packages_lock_constraints(
+            location.read_text( encoding = 'utf-8' ) )
+        if location.is_file( ) else [ ], requirements )
+    environments_by_release = { }
+    environments = [ ]
+    for python_location in python_locations:
+        environment, releases = _resolve_python_packages(
+            python_location, requirements, constraints, index_url )
+        environments.append( environment )
+        for release in releases:
+            environments_by_release.setdefault( release, [ ] ).append(
+                environment )
+    releases = sorted( environments_by_release )
+    digests = aggregate_pypi_releases_digests(
+        releases, index_url = index_url, jobs = jobs )
+    lines = [ *_python_packages_lock_preamble ]
+    for release, digests_ in zip( releases, digests ):
+        if not digests_:
+            raise RuntimeError(
+                "Could not lock {} {} without digests.".format( *release ) )
+        environments_ = environments_by_release[ release ]
+        marker = '' if len( environments_ ) == len( environments ) else (
+            _derive_python_packages_lock_marker( environments_ ) )
+        lines.append( '{}=={}{} \\'.format(
+            *release, f" ; {marker}" if marker else '' ) )
+        lines.extend(
+            f"    --hash=sha256:{digest} \\" for digest in sorted( digests_ ) )
+        lines[ -1 ] = lines[ -1 ][ : -2 ]
+    from os import getpid, replace
+    temporary_location = location.with_name( f".{location.name}.{getpid( )}" )
+    temporary_location.write_text(
+        '\n'.join( lines ) + '\n', encoding = 'utf-8' )
+    replace( temporary_location, location )
+
+
+def _derive_python_packages_lock_marker( environments ):
+    ''' Derives environment marker which selects environments. '''
+    return ' or '.join( sorted( frozenset(
+        'implementation_name == "{implementation_name}" '
+        'and python_version == "{python_version}"'.format( **environment )
+        for environment in environments ) ) )
+
+
+def _extract_python_packages_lock_constraints( content ):
+    ''' Extracts pinned releases, along with any markers, from lock. '''
+    return [
+        line.rstrip( '\\' ).strip( ) for line in content.splitlines( )
+        if line and not line[ 0 ].isspace( ) and not line.startswith( '#' ) ]
+
+
+def _filter_python_packages_lock_constraints( constraints, requirements ):
+    ''' Filters pinned releases which requirements no longer admit. '''
+    from packaging.requirements import InvalidRequirement, Requirement
+    from packaging.utils import canonicalize_name
+    specifiers_by_name = { }
+    for requirement in requirements:
+        try: requirement_ = Requirement( requirement )
+        except InvalidRequirement: continue
+        specifiers_by_name.setdefault(
+            canonicalize_name( requirement_.name ), [ ] ).append(
+                requirement_.specifier )
+    constraints_ = [ ]
+    for constraint in constraints:
+        name, _, version = (
+            constraint.split( ';', maxsplit = 1 )[ 0 ].partition( '==' ) )
+        if all(
+            specifier.contains( version.strip( ), prereleases = True )
+            for specifier in specifiers_by_name.get(
+                canonicalize_name( name.strip( ) ), ( ) )
+        ): constraints_.append( constraint )
+        else:
+            __.scribe.info(
+                f"Requirements no longer admit {constraint!r}. Unpinning." )
+    return constraints_
+
+
+def _resolve_python_packages(
+    python_location, requirements, constraints, index_url
+):
+    ''' Resolves requirements for interpreter with Pip, installing nothing.
+
+        Constraints are tried first and are dropped, as a last resort, if
+        they cannot be satisfied, such as when a bumped requirement needs
+        newer releases of its own dependencies. Returns marker environment
+        of the interpreter and pairs of name and version of the resolved
+        releases. '''
+    from json import load
+    from subprocess import CalledProcessError # nosec B404
+    from tempfile import TemporaryDirectory
+    from .pre import ensure_pip
+    pip_location = ensure_pip( )
+    pip_options = (
+        [ '--index-url', f"{index_url}/simple" ] if index_url else [ ] )
+    with TemporaryDirectory( ) as temporary_location:
+        temporary_location = __.Path( temporary_location )
+        requirements_location = temporary_location / 'requirements.txt'
+        requirements_location.write_text(
+            '\n'.join( requirements ), encoding = 'utf-8' )
+        constraints_location = temporary_location / 'constraints.txt'
+        constraints_location.write_text(
+            '\n'.join( constraints ), encoding = 'utf-8' )
+        report_location = temporary_location / 'report.json'
+        command = (
+            python_location, pip_location, 'install',
+            '--dry-run', '--ignore-installed', '--quiet',
+            '--report', report_location, *pip_options,
+            '--requirement', requirements_location )
+        try:
+            __.execute_subprocess(
+                ( *command, '--constraint', constraints_location ) )
+        except CalledProcessError:
+            if not constraints: raise
+            __.scribe.info(
+                "Could not resolve with existing lock. Resolving anew." )
+            __.execute_subprocess( command )
+        with report_location.open( encoding = 'utf-8' ) as file:
+            report = load( file )
+    from packaging.utils import canonicalize_name
+    return report[ 'environment' ], [
+        ( canonicalize_name( entry[ 'metadata' ][ 'name' ] ),
+          entry[ 'metadata' ][ 'version' ] )
+        for entry in report[ 'install' ] ]
+
+
+_python_packages_lock_preamble = (
+    '#',
+    f"# This file is autogenerated by {__package__}.",
+    '# To update it, run:',
+    '#',
+    f"#    {__package__} freshen.cohort",
+    '#',
+)
+
+
 def retrieve_pypi_release_information( name, version, index_url = '' ): # pylint: disable=inconsistent-return-statements,too-many-locals
     ''' Retrieves information about specific release on PyPI. '''
     index_url = index_url or 'https://pypi.org'
@@ -392,6 +1126,411 @@ def _pep508_requirement_to_name( requirement ):
     return _return_name( name )
 
 
+def prefetch_python_packages(
+    process_environment, identifier, requirements = None
+):
+    ''' Prefetches artifacts for frozen Python packages into wheelhouse.
+
+        The artifacts are retrieved by Pip with the Python of the
+        environment, so that they are suitable for its interpreter. They are
+        stored in the wheelhouse under their SHA-256 digests and selected
+        for the platform identifier. Source distributions without wheels are
+        built into wheels once, which are stored in their place.
+        Only requirements without available selections are retrieved.
+
+        If no frozen requirements are given, then those from the fixtures
+        for the identifier are prefetched. '''
+    if None is requirements:
+        _, requirements, _ = _generate_pip_requirements(
+            identifier = identifier )
+    selections = _summon_wheelhouse_selections( identifier )
+    requirements_by_name = {
+        _extract_frozen_requirement_name( requirement ): requirement
+        for requirement in requirements
+        if not _is_wheelhouse_selection_available(
+            selections, requirement ) }
+    if not requirements_by_name: return
+    __.scribe.info(
+        f"Prefetching {len( requirements_by_name )} Python packages "
+        "into wheelhouse." )
+    from pathlib import Path
+    from tempfile import TemporaryDirectory
+    with TemporaryDirectory( ) as location_raw:
+        location = Path( location_raw )
+        execute_pip_with_requirements(
+            process_environment, 'download',
+            '\n'.join( requirements_by_name.values( ) ),
+            pip_options = (
+                '--require-hashes', '--no-deps', '--dest', location ) )
+        for artifact_location in sorted( location.iterdir( ) ):
+            name, selection = _store_wheelhouse_artifact(
+                process_environment, artifact_location, requirements_by_name )
+            if None is not name: selections[ name ] = selection
+    _persist_wheelhouse_selections( identifier, selections )
+
+
+def _install_wheels_natively( process_environment, identifier, requirements ):
+    ''' Installs wheels from wheelhouse by linking their unpacked trees.
+
+        Each wheel is unpacked once, after verification of its digest, into
+        a store, which is addressed by that digest. Its files are then
+        hardlinked into the site packages of the virtual environment, or
+        copied if links cannot be made. Installation metadata and scripts
+        for entry points are generated, as Pip would.
+
+        Only supported on POSIX platforms. Set the
+        ``DEVSHIM_PACKAGES_INSTALLER`` environment variable to ``pip`` to
+        always use Pip instead. Returns requirements which were not
+        installed, such as ones for already-installed distributions, so
+        that Pip can install them. '''
+    if 'posix' != __.os_class: return requirements
+    if 'pip' == __.view_environment_entry( ( 'packages', 'installer' ) ):
+        return requirements
+    venv_location = _derive_venv_location( process_environment )
+    if None is venv_location: return requirements
+    site_locations = _survey_venv_site_packages_locations( venv_location )
+    if 1 != len( site_locations ): return requirements
+    site_location = site_locations[ 0 ]
+    from zipfile import BadZipFile
+    from packaging.utils import canonicalize_name
+    installed_names = frozenset(
+        canonicalize_name( location.name.split( '-', maxsplit = 1 )[ 0 ] )
+        for location in site_location.glob( '*.dist-info' ) )
+    selections = _summon_wheelhouse_selections( identifier )
+    requirements_ = [ ]
+    for requirement in requirements:
+        name = _extract_frozen_requirement_name( requirement )
+        wheels = selections[ name ][ 'wheels' ]
+        if name in installed_names or 1 != len( wheels ):
+            requirements_.append( requirement )
+            continue
+        try:
+            if _install_unpacked_wheel(
+                _unpack_wheel( wheels[ 0 ] ), venv_location, site_location
+            ): continue
+        except ( BadZipFile, OSError, ValueError ) as exc:
+            __.scribe.warning( f"Could not install {name!r} natively: {exc}" )
+        requirements_.append( requirement )
+    return requirements_
+
+
+def _install_unpacked_wheel( tree_location, venv_location, site_location ):
+    ''' Installs unpacked wheel into site packages of virtual environment.
+
+        Returns false, without installing anything, if the wheel has
+        features which are not supported, such as entry points which
+        reference modules rather than callables. Pip installs such wheels
+        instead. Metadata is installed last, so that an interrupted
+        installation is not considered complete. '''
+    from os.path import relpath
+    from .fs_utilities import ensure_directory
+    from .pre import link_file
+    metadata_location = next( tree_location.glob( '*.dist-info' ) )
+    data_location = metadata_location.with_suffix( '.data' )
+    if data_location.exists( ) and not all(
+        location.name in ( 'platlib', 'purelib', 'scripts' )
+        for location in data_location.iterdir( )
+    ): return False
+    if 'Wheel-Version: 1.' not in ( metadata_location / 'WHEEL' ).read_text(
+        encoding = 'utf-8' ): return False
+    entry_points = _survey_wheel_entry_points( metadata_location )
+    if not all( ':' in value for _, value in entry_points ): return False
+    from .environments import generate_venv_executable_location
+    python_location = generate_venv_executable_location(
+        'python', venv_path = venv_location )
+    shebang = f"#!{python_location}\n"
+    # Kernels truncate long shebangs, for which Pip uses a shell trampoline.
+    if 127 < len( shebang ) or ' ' in str( python_location ): return False
+    scripts_location = python_location.parent
+    records = _summon_wheel_records( metadata_location )
+    entries = [ ]
+    sources = [
+        ( location, tree_location ) for location in tree_location.iterdir( )
+        if location not in ( metadata_location, data_location ) ]
+    sources.extend(
+        ( data_location / name, data_location / name )
+        for name in ( 'platlib', 'purelib' )
+        if ( data_location / name ).is_dir( ) )
+    for source, anchor in sources:
+        for location in (
+            sorted( source.rglob( '*' ) ) if source.is_dir( ) else ( source, )
+        ):
+            if location.is_dir( ): continue
+            relative_location = location.relative_to( anchor )
+            link_file( location, site_location / relative_location )
+            path = relative_location.as_posix( )
+            record = records.get(
+                location.relative_to( tree_location ).as_posix( ), ( '', '' ) )
+            entries.append( ( path, *record ) )
+    ensure_directory( scripts_location )
+    script_sources = [ ]
+    if ( data_location / 'scripts' ).is_dir( ):
+        script_sources.extend(
+            ( location.name, _rewrite_wheel_script( location, shebang ) )
+            for location
+            in sorted( ( data_location / 'scripts' ).iterdir( ) ) )
+    script_sources.extend(
+        ( name, _produce_entry_point_script( value, shebang ) )
+        for name, value in entry_points )
+    for name, content in script_sources:
+        location = scripts_location / name
+        if location.exists( ): location.unlink( )
+        location.write_bytes( content )
+        location.chmod( 0o755 )
+        entries.append( (
+            relpath( location, site_location ).replace( '\\', '/' ),
+            _calculate_record_digest( content ), str( len( content ) ) ) )
+    metadata_location_ = site_location / metadata_location.name
+    ensure_directory( metadata_location_ )
+    for location in sorted( metadata_location.iterdir( ) ):
+        if location.name in ( 'INSTALLER', 'RECORD' ): continue
+        link_file( location, metadata_location_ / location.name )
+        entries.append( (
+            f"{metadata_location.name}/{location.name}",
+            *records.get(
+                f"{metadata_location.name}/{location.name}", ( '', '' ) ) ) )
+    installer = f"{__package__}\n".encode( )
+    ( metadata_location_ / 'INSTALLER' ).write_bytes( installer )
+    entries.append( (
+        f"{metadata_location.name}/INSTALLER",
+        _calculate_record_digest( installer ), str( len( installer ) ) ) )
+    entries.append( ( f"{metadata_location.name}/RECORD", '', '' ) )
+    _persist_wheel_records( metadata_location_ / 'RECORD', entries )
+    return True
+
+
+def _calculate_record_digest( content ):
+    ''' Calculates digest of content in form for wheel records. '''
+    from base64 import urlsafe_b64encode
+    from hashlib import sha256
+    digest = urlsafe_b64encode( sha256( content ).digest( ) ).rstrip( b'=' )
+    return f"sha256={digest.decode( 'ascii' )}"
+
+
+def _derive_unpacked_wheel_location( digest ):
+    from .data import user_directories
+    return user_directories.unpacked_wheels / digest[ : 2 ] / digest
+
+
+def _persist_wheel_records( location, entries ):
+    from csv import writer as create_csv_writer
+    with location.open( 'w', encoding = 'utf-8', newline = '' ) as file:
+        create_csv_writer( file, lineterminator = '\n' ).writerows( entries )
+
+
+def _produce_entry_point_script( value, shebang ):
+    ''' Produces script for entry point, in the same form as Pip does.
+
+        Entry point must reference a callable within a module. '''
+    reference = value.split( '[', maxsplit = 1 )[ 0 ].strip( )
+    module_name, _, attribute_name = reference.partition( ':' )
+    return _entry_point_script_template.format(
+        attribute_name = attribute_name,
+        import_name = attribute_name.split( '.', maxsplit = 1 )[ 0 ],
+        module_name = module_name.strip( ),
+        shebang = shebang,
+    ).encode( 'utf-8' )
+
+
+def _rewrite_wheel_script( location, shebang ):
+    ''' Rewrites placeholder shebang of script from wheel. '''
+    content = location.read_bytes( )
+    if not content.startswith( b'#!python' ): return content
+    return shebang.encode( ) + content.split( b'\n', maxsplit = 1 )[ -1 ]
+
+
+def _summon_wheel_records( metadata_location ):
+    ''' Summons digests and sizes of files from records of wheel. '''
+    from csv import reader as create_csv_reader
+    location = metadata_location / 'RECORD'
+    with location.open( encoding = 'utf-8', newline = '' ) as file:
+        return {
+            row[ 0 ]: tuple( row[ 1 : 3 ] )
+            for row in create_csv_reader( file ) if 3 <= len( row ) }
+
+
+def _survey_wheel_entry_points( metadata_location ):
+    ''' Surveys names and references of script entry points of wheel. '''
+    from configparser import RawConfigParser
+    entry_points = RawConfigParser( )
+    entry_points.optionxform = str # Preserve case of script names.
+    entry_points.read( metadata_location / 'entry_points.txt' )
+    return tuple(
+        ( name, value )
+        for section in ( 'console_scripts', 'gui_scripts' )
+        if entry_points.has_section( section )
+        for name, value in entry_points.items( section ) )
+
+
+def _unpack_wheel( wheel ):
+    ''' Unpacks wheel from wheelhouse into store, unless already unpacked.
+
+        Verifies digest of wheel beforehand. '''
+    digest = wheel[ 'digest' ]
+    location = _derive_unpacked_wheel_location( digest )
+    if location.is_dir( ): return location
+    archive_location = _derive_wheelhouse_location( digest ) / wheel[ 'name' ]
+    from .pre import calculate_file_digest, unpack_wheel
+    if digest != calculate_file_digest( archive_location ):
+        # TODO: Use exception factory.
+        raise ValueError( f"Digest mismatch for {str( archive_location )!r}." )
+    return unpack_wheel( archive_location, location )
+
+
+_entry_point_script_template = '''{shebang}# -*- coding: utf-8 -*-
+import re
+import sys
+from {module_name} import {import_name}
+if __name__ == '__main__':
+    sys.argv[0] = re.sub(r'(-script\\.pyw|\\.exe)?$', '', sys.argv[0])
+    sys.exit({attribute_name}())
+'''
+
+
+def _derive_wheelhouse_location( digest ):
+    from .data import user_directories
+    return user_directories.wheelhouse / digest[ : 2 ] / digest
+
+
+def _derive_wheelhouse_selections_location( identifier ):
+    from .data import user_directories
+    return user_directories.wheelhouse / 'selections' / f"{identifier}.json"
+
+
+def _extract_frozen_requirement_digests( requirement ):
+    return _frozen_requirement_digest_regex.findall( requirement )
+
+
+def _extract_frozen_requirement_name( requirement ):
+    from packaging.utils import canonicalize_name
+    return canonicalize_name( requirement.split( '==', maxsplit = 1 )[ 0 ] )
+
+
+def _is_wheelhouse_selection_available( selections, requirement ):
+    ''' Is selection for frozen requirement in wheelhouse?
+
+        The selection must be from one of the digests of the requirement and
+        all of its wheels must be present. '''
+    name = _extract_frozen_requirement_name( requirement )
+    selection = selections.get( name )
+    if not selection: return False
+    if selection[ 'digest' ] not in _extract_frozen_requirement_digests(
+        requirement
+    ): return False
+    return all(
+        ( _derive_wheelhouse_location( wheel[ 'digest' ] ) / wheel[ 'name' ] )
+        .is_file( ) for wheel in selection[ 'wheels' ] )
+
+
+def _persist_wheelhouse_selections( identifier, selections ):
+    ''' Persists selections of artifacts for platform identifier. '''
+    from json import dumps
+    from os import getpid, replace
+    from .fs_utilities import ensure_directory
+    location = _derive_wheelhouse_selections_location( identifier )
+    ensure_directory( location.parent )
+    temporary_location = location.with_suffix( f".{getpid( )}.partial" )
+    temporary_location.write_text(
+        dumps( selections, indent = 2, sort_keys = True ),
+        encoding = 'utf-8' )
+    replace( temporary_location, location )
+
+
+def _produce_wheelhouse_requirements( identifier, requirements ):
+    ''' Produces frozen requirements for installation from wheelhouse.
+
+        The requirements are preceded by options which restrict Pip to the
+        selected artifacts in the wheelhouse. Digests of wheels, which were
+        built from source distributions, are added to their requirements.
+        Returns ``None`` unless all requirements have selections. '''
+    selections = _summon_wheelhouse_selections( identifier )
+    if not all(
+        _is_wheelhouse_selection_available( selections, requirement )
+        for requirement in requirements
+    ): return None
+    options = [ '--no-index' ]
+    requirements_ = [ ]
+    for requirement in requirements:
+        selection = selections[
+            _extract_frozen_requirement_name( requirement ) ]
+        for wheel in selection[ 'wheels' ]:
+            location = _derive_wheelhouse_location( wheel[ 'digest' ] )
+            options.append( f"--find-links {location.as_uri( )}" )
+            if selection[ 'digest' ] == wheel[ 'digest' ]: continue
+            requirement = (
+                f"{requirement} \\\n    --hash sha256:{wheel[ 'digest' ]}" )
+        requirements_.append( requirement )
+    return [ *options, *requirements_ ]
+
+
+def _store_wheelhouse_artifact(
+    process_environment, artifact_location, requirements_by_name
+):
+    ''' Stores wheels for artifact in wheelhouse under their digests.
+
+        Source distributions are built into wheels, which are stored instead.
+        Returns name of matching requirement and selection for it. '''
+    from os import getpid, replace
+    from pathlib import Path
+    from shutil import copyfile
+    from tempfile import TemporaryDirectory
+    from .fs_utilities import ensure_directory
+    from .pre import calculate_file_digest
+    digest = calculate_file_digest( artifact_location )
+    name = next( (
+        name for name, requirement in requirements_by_name.items( )
+        if digest in _extract_frozen_requirement_digests( requirement ) ),
+        None )
+    if None is name: return None, None
+    # Each source distribution is built into its own directory,
+    # so that wheels from other builds are not stored with its selection.
+    with TemporaryDirectory( ) as wheels_location:
+        if '.whl' == artifact_location.suffix:
+            wheels = [ ( digest, artifact_location ) ]
+        else:
+            wheels = [
+                ( calculate_file_digest( location ), location )
+                for location in _build_wheelhouse_wheels(
+                    process_environment, artifact_location,
+                    Path( wheels_location ) ) ]
+        for digest_, location in wheels:
+            location_ = ensure_directory(
+                _derive_wheelhouse_location( digest_ ) )
+            temporary_location = location_ / f".{location.name}.{getpid( )}"
+            copyfile( location, temporary_location )
+            replace( temporary_location, location_ / location.name )
+    return name, dict(
+        digest = digest,
+        wheels = [
+            dict( digest = digest_, name = location.name )
+            for digest_, location in wheels ] )
+
+
+def _build_wheelhouse_wheels( process_environment, sdist_location, location ):
+    ''' Builds wheel from source distribution for Python of environment.
+
+        Returns wheels in location, which should be empty beforehand. '''
+    from .base import execute_external
+    execute_external(
+        ( _derive_python_location( process_environment ),
+          '-m', 'pip', 'wheel', '--no-deps', '--wheel-dir', location,
+          sdist_location ),
+        env = process_environment )
+    return sorted( location.glob( '*.whl' ) )
+
+
+def _summon_wheelhouse_selections( identifier ):
+    ''' Summons selections of artifacts for platform identifier. '''
+    from json import loads
+    location = _derive_wheelhouse_selections_location( identifier )
+    try: return loads( location.read_text( encoding = 'utf-8' ) )
+    except ( OSError, ValueError ): return { }
+
+
+_frozen_requirement_digest_regex = _regex_compile(
+    r'''--hash sha256:(?P<digest>[0-9a-f]{64})''' )
+
+
 class Version:
     ''' Version manager.
 
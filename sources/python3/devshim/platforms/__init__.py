@@ -45,11 +45,81 @@ def pep508_identify_python( version = None ):
 
 def identify_python( mode, python_path ):
     ''' Reports compatibility identifier for Python at given path. '''
+    return survey_python_identifiers( python_path )[ mode ]
+
+
+def survey_python_identifiers( python_path ):
+    ''' Surveys compatibility identifiers of all modes for Python at path.
+
+        The Python is probed at most once per binary. The identifiers are
+        persisted and keyed by path, inode, size, and modification time of
+        the binary, along with any overrides of platform identity from the
+        environment. '''
+    python_path = str( python_path )
+    record = _summon_python_record( python_path )
+    identifiers = _data.python_identifiers
+    if record == identifiers.get( python_path, { } ).get( 'binary' ):
+        return __.DictionaryProxy( identifiers[ python_path ][ 'modes' ] )
     # TODO: Use 'importlib-resources' to locate this script.
     from ..data import paths
     detector_path = (
         paths.sources.aux.python3 / 'devshim/platforms/identity.py' )
+    from json import loads
     from ..base import execute_external
-    return execute_external(
-        ( python_path, detector_path, '--mode', mode ),
-        capture_output = True ).stdout.strip( )
+    modes = loads( execute_external(
+        ( python_path, detector_path, '--mode', 'ALL' ),
+        capture_output = True ).stdout )
+    identifiers[ python_path ] = dict( binary = record, modes = modes )
+    _persist_python_identifiers( identifiers )
+    return __.DictionaryProxy( modes )
+
+
+def _persist_python_identifiers( identifiers ):
+    ''' Persists identifiers of Python binaries.
+
+        Failure to persist is not fatal. '''
+    from json import dump
+    from os import getpid, replace
+    from ..data import paths
+    from ..fs_utilities import ensure_directory
+    location = paths.state.DEV.python_identifiers
+    # Concurrent jobs may persist at same time; last one wins.
+    temporary_location = location.with_suffix( f".{getpid( )}.partial" )
+    try:
+        ensure_directory( location.parent )
+        with temporary_location.open( 'w', encoding = 'utf-8' ) as file:
+            dump( identifiers, file )
+        replace( temporary_location, location )
+    except OSError as exc:
+        __.scribe.warning( f"Could not persist Python identifiers: {exc}" )
+
+
+def _summon_python_identifiers( ):
+    from json import load
+    from ..data import paths
+    location = paths.state.DEV.python_identifiers
+    try:
+        with location.open( encoding = 'utf-8' ) as file:
+            return load( file )
+    except ( OSError, ValueError ): return { }
+
+
+def _summon_python_record( python_path ):
+    ''' Summons record of identity for Python binary at path. '''
+    from os import stat
+    stat_result = stat( python_path )
+    from .identity import override_names
+    environment = __.current_process_environment
+    overrides = {
+        name: environment[ name ] for name in override_names
+        if name in environment }
+    return dict(
+        inode = stat_result.st_ino,
+        size = stat_result.st_size,
+        mtime = stat_result.st_mtime_ns,
+        overrides = overrides )
+
+
+_data = __.create_semelfactive_namespace( __.create_invocable_dictionary(
+    python_identifiers = _summon_python_identifiers,
+) )
@@ -43,6 +43,11 @@ def _determine_prefix( ):
 
 _prefix = _determine_prefix( )
 
+#: Names of environment entries which override platform identity.
+override_names = tuple( f"{_prefix}_{name}" for name in (
+    'CPU_ARCHITECTURE', 'OS_CLASS',
+    'OS_KERNEL_ADDRESS_SIZE', 'OS_KERNEL_NAME', ) )
+
 
 def calculate_bdist_compatibility_identifier( ):
     ''' Returns summary identifier for binary distribution compatibility. '''
@@ -182,16 +187,24 @@ dispatch_table = _DictionaryProxy( {
 
 
 def main( ):
-    ''' Prints identifier label for active Python process. '''
+    ''' Prints identifier label for active Python process.
+
+        If mode is 'ALL', then prints JSON object of labels for all modes. '''
     _setup_python_search_paths( )
     from argparse import ArgumentParser
     cli_parser = ArgumentParser( )
     cli_parser.add_argument( '--mode',
         default = 'bdist-compatibility', metavar = 'MODE',
-        choices = dispatch_table.keys( )
+        choices = ( *dispatch_table.keys( ), 'ALL' )
     )
     cli_arguments = cli_parser.parse_args( )
-    print( dispatch_table[ cli_arguments.mode ]( ) )
+    mode = cli_arguments.mode
+    if 'ALL' != mode:
+        print( dispatch_table[ mode ]( ) )
+        return
+    from json import dumps
+    print( dumps( {
+        mode: calculator( ) for mode, calculator in dispatch_table.items( ) } ) )
 
 
 def _setup_python_search_paths( ):
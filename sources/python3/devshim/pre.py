@@ -40,6 +40,39 @@ def calculate_cache_identifier( ):
     return hasher.hexdigest( )
 
 
+def calculate_cohort_identifier( requirements ):
+    ''' Calculates identifier of packages cohort from its requirements.
+
+        Combines the cache identifier with a digest of the requirements, so
+        that a cohort can be reused for as long as neither changes. '''
+    from hashlib import sha256
+    if isinstance( requirements, __.Path ):
+        content = requirements.read_bytes( )
+    elif isinstance( requirements, str ): content = requirements.encode( )
+    else: content = '\n'.join( map( str, requirements ) ).encode( )
+    hasher = sha256( )
+    hasher.update( calculate_cache_identifier( ).encode( ) )
+    hasher.update( content )
+    return hasher.hexdigest( )
+
+
+def calculate_file_digest( location ):
+    ''' Calculates hex-encoded SHA-256 digest of file. '''
+    from hashlib import sha256
+    hasher = sha256( )
+    with location.open( 'rb' ) as file:
+        for chunk in iter( lambda: file.read( 1 << 16 ), b'' ):
+            hasher.update( chunk )
+    return hasher.hexdigest( )
+
+
+def derive_cohort_requirements_location( ):
+    ''' Derives location of exact requirements for packages cohort.
+
+        The requirements are locked by the ``freshen.cohort`` task. '''
+    return __.Path( __file__ ).parent / 'packages.exact.pip'
+
+
 def ensure_archives_store( ):
     ''' Ensures directory for retrieved archives exists. '''
     from .fs_utilities import ensure_directory
@@ -63,29 +96,33 @@ def ensure_pip( ):
 
 
 def ensure_python_packages( cohort_name, requirements ):
-    ''' Ensures all packages in cohort are recent. '''
-    location = ensure_python_packages_cache( cohort_name )
-    try: next( location.iterdir( ) )
-    except StopIteration: pass
-    else:
-        from datetime import timedelta as TimeDelta
-        from .fs_utilities import is_older_than
-        if not is_older_than( location, TimeDelta( days = 1 ) ):
-            return location
+    ''' Ensures packages cohort for requirements is assembled.
+
+        The cohort is reused for as long as its requirements and the cache
+        identifier remain unchanged. Once a cohort is assembled for new
+        requirements, the assemblies for other requirements are removed. '''
+    location = ensure_python_packages_cache( cohort_name, requirements )
+    if location.is_dir( ): return location
     install_python_packages( location, requirements )
+    _prune_python_packages_cohorts( location )
     return location
 
 
-def ensure_python_packages_cache( cohort_name ):
-    ''' Ensures directory for installed Python packages cohort exists. '''
+def ensure_python_packages_cache( cohort_name, requirements = None ):
+    ''' Ensures directory for installed Python packages cohorts exists.
+
+        Returns location of cohort for requirements, which defaults to the
+        exact requirements of this package. The cohort itself only exists
+        after it is assembled. '''
+    if None is requirements:
+        requirements = derive_cohort_requirements_location( )
     from .fs_utilities import ensure_directory
     # TODO: Use caches location from base module after revision.
     return ensure_directory(
         __.Path( __.view_environment_entry( ( 'project', 'location' ) ) )
         .joinpath(
             f".local/caches/{__package__}/packages",
-            calculate_cache_identifier( ),
-            cohort_name ) )
+            calculate_cohort_identifier( requirements ) ) ) / cohort_name
 
 
 def execute_python_subprocess( command_specification, **nomargs ):
@@ -113,17 +150,41 @@ def imports_from_cache( ):
 
 
 def install_python_packages( location, requirements ):
-    ''' Installs Python packages into directory. '''
-    if isinstance( requirements, __.Path ):
-        requirements = ( '--requirement', requirements, )
-    elif isinstance( requirements, str ):
-        requirements = ( requirements, )
-    __.scribe.info( f"Installing Python packages to '{location}'." )
-    # Force reinstall to help ensure sanity.
-    execute_python_subprocess(
-        ( ensure_pip( ), 'install', '--target', location,
-          '--force-reinstall', '--upgrade', '--upgrade-strategy=eager',
-          *requirements ) )
+    ''' Installs Python packages into directory.
+
+        Wheels are unpacked once into a store, which is shared across
+        projects, and their files are linked into the directory. If any
+        artifact is not a wheel, then Pip installs the packages instead. The
+        directory is assembled beside its location and then moved into
+        place, so that an interrupted assembly is never used. '''
+    from os import getpid, replace
+    from shutil import rmtree
+    from .fs_utilities import ensure_directory
+    staging_location = location.with_name( f".{location.name}.{getpid( )}" )
+    rmtree( staging_location, ignore_errors = True )
+    trees_locations = _ensure_unpacked_wheels( requirements )
+    if None is trees_locations:
+        _install_python_packages_via_pip( staging_location, requirements )
+    else:
+        __.scribe.info( f"Linking Python packages into '{location}'." )
+        ensure_directory( staging_location )
+        for tree_location in trees_locations:
+            _link_unpacked_wheel( tree_location, staging_location )
+    try: replace( staging_location, location )
+    except OSError: # Another process assembled it concurrently.
+        rmtree( staging_location, ignore_errors = True )
+        if not location.is_dir( ): raise
+
+
+def link_file( source, target ):
+    ''' Hardlinks file to target or copies it, if that is not possible. '''
+    from os import link
+    from shutil import copy2
+    if not target.parent.is_dir( ):
+        target.parent.mkdir( parents = True, exist_ok = True )
+    if target.exists( ) or target.is_symlink( ): target.unlink( )
+    try: link( source, target )
+    except OSError: copy2( source, target )
 
 
 def retrieve_pip( location ):
@@ -134,17 +195,179 @@ def retrieve_pip( location ):
     retrieve_url( url, location )
 
 
+def unpack_wheel( archive_location, location ):
+    ''' Unpacks wheel into store location, unless already unpacked.
+
+        Verifies paths of its members beforehand. Files in the store are
+        made read-only, since they are shared by links. '''
+    if location.is_dir( ): return location
+    from os import getpid, replace
+    from pathlib import PurePosixPath
+    from shutil import rmtree
+    from stat import S_IWGRP, S_IWOTH, S_IWUSR, S_IXUSR
+    from zipfile import ZipFile
+    from .fs_utilities import ensure_directory
+    temporary_location = location.with_name( f".{location.name}.{getpid( )}" )
+    ensure_directory( location.parent )
+    with ZipFile( archive_location ) as archive:
+        for member in archive.infolist( ):
+            path = PurePosixPath( member.filename )
+            if path.is_absolute( ) or '..' in path.parts:
+                # TODO: Use exception factory.
+                raise ValueError( f"Unsafe path in wheel: {path!s}" )
+        archive.extractall( temporary_location )
+        for member in archive.infolist( ):
+            if member.is_dir( ): continue
+            member_location = temporary_location / member.filename
+            mode = member_location.stat( ).st_mode
+            # Preserve executable permissions, which extraction drops.
+            if ( member.external_attr >> 16 ) & S_IXUSR: mode |= 0o111
+            member_location.chmod( mode & ~( S_IWUSR | S_IWGRP | S_IWOTH ) )
+    try: replace( temporary_location, location )
+    except OSError: # Another process unpacked it concurrently.
+        rmtree( temporary_location, ignore_errors = True )
+        if not location.is_dir( ): raise
+    return location
+
+
+def _calculate_user_caches_location( ):
+    ''' Calculates user caches location, as 'platformdirs' does.
+
+        The 'platformdirs' package is part of the cohort and so is not
+        available during bootstrap. '''
+    from sys import platform
+    environment = __.current_process_environment
+    home_location = __.Path.home( )
+    if 'nt' == __.os_class:
+        return __.Path(
+            environment.get( 'LOCALAPPDATA', '' ).strip( )
+            or home_location / 'AppData/Local'
+        ) / __package__ / __package__ / 'Cache'
+    if 'darwin' == platform:
+        return home_location / 'Library/Caches' / __package__
+    return __.Path(
+        environment.get( 'XDG_CACHE_HOME', '' ).strip( )
+        or home_location / '.cache' ) / __package__
+
+
+def _derive_cohort_selections_location( requirements ):
+    return _calculate_user_caches_location( ).joinpath(
+        'cohorts', f"{calculate_cohort_identifier( requirements )}.json" )
+
+
+def _derive_unpacked_wheel_location( digest ):
+    return _calculate_user_caches_location( ).joinpath(
+        'unpacked-wheels', digest[ : 2 ], digest )
+
+
+def _ensure_unpacked_wheels( requirements ):
+    ''' Ensures that wheels for requirements are unpacked into store.
+
+        The wheels, which Pip selects for the requirements, are recorded, so
+        that later assemblies of the same cohort need not consult Pip.
+        Returns locations of unpacked wheels or ``None``, if any artifact is
+        not a wheel. '''
+    selections_location = _derive_cohort_selections_location( requirements )
+    digests = _summon_cohort_selections( selections_location )
+    if None is not digests:
+        locations = tuple( map( _derive_unpacked_wheel_location, digests ) )
+        if all( location.is_dir( ) for location in locations ):
+            return locations
+    from tempfile import TemporaryDirectory
+    __.scribe.info( "Retrieving Python packages." )
+    with TemporaryDirectory( ) as temporary_location:
+        execute_python_subprocess(
+            ( ensure_pip( ), 'download', '--dest', temporary_location,
+              *_normalize_requirements( requirements ) ) )
+        digests = [ ]
+        for archive_location in sorted(
+            __.Path( temporary_location ).iterdir( )
+        ):
+            if '.whl' != archive_location.suffix: return None
+            digest = calculate_file_digest( archive_location )
+            unpack_wheel(
+                archive_location, _derive_unpacked_wheel_location( digest ) )
+            digests.append( digest )
+    _persist_cohort_selections( selections_location, digests )
+    return tuple( map( _derive_unpacked_wheel_location, digests ) )
+
+
+def _install_python_packages_via_pip( location, requirements ):
+    __.scribe.info( f"Installing Python packages to '{location}'." )
+    # Force reinstall to help ensure sanity.
+    execute_python_subprocess(
+        ( ensure_pip( ), 'install', '--target', location,
+          '--force-reinstall', '--upgrade', '--upgrade-strategy=eager',
+          *_normalize_requirements( requirements ) ) )
+
+
+def _link_unpacked_wheel( tree_location, location ):
+    ''' Links files of unpacked wheel into directory.
+
+        Lays out files as Pip does for installations with '--target'.
+        Scripts, headers, and data from the wheel are omitted, since the
+        cohort only serves imports. '''
+    from os import walk
+    from pathlib import PurePath
+    for root, _, files in walk( tree_location ):
+        root_ = __.Path( root )
+        for file in files:
+            source = root_ / file
+            parts = source.relative_to( tree_location ).parts
+            if parts[ 0 ].endswith( '.data' ):
+                if 3 > len( parts ): continue
+                if parts[ 1 ] not in ( 'platlib', 'purelib' ): continue
+                parts = parts[ 2 : ]
+            link_file( source, location / PurePath( *parts ) )
+
+
+def _normalize_requirements( requirements ):
+    if isinstance( requirements, __.Path ):
+        return ( '--requirement', requirements, )
+    if isinstance( requirements, str ): return ( requirements, )
+    return tuple( requirements )
+
+
+def _persist_cohort_selections( location, digests ):
+    from json import dump
+    from os import getpid, replace
+    from .fs_utilities import ensure_directory
+    temporary_location = location.with_name( f".{location.name}.{getpid( )}" )
+    try:
+        ensure_directory( location.parent )
+        with temporary_location.open( 'w', encoding = 'utf-8' ) as file:
+            dump( digests, file )
+        replace( temporary_location, location )
+    except OSError as exc:
+        __.scribe.warning( f"Could not record cohort selections: {exc}" )
+
+
+def _prune_python_packages_cohorts( location ):
+    ''' Removes assemblies of packages cohort for other requirements.
+
+        Directories for requirements, which no longer hold any cohorts, are
+        removed as well. '''
+    from shutil import rmtree
+    for location_ in location.parent.parent.glob( f"*/{location.name}" ):
+        if location_ == location: continue
+        rmtree( location_, ignore_errors = True )
+        try: location_.parent.rmdir( )
+        except OSError: pass # Still holds other cohorts.
+
+
+def _summon_cohort_selections( location ):
+    from json import load
+    try:
+        with location.open( encoding = 'utf-8' ) as file:
+            return load( file )
+    except ( OSError, ValueError ): return None
+
+
 def _conditionally_execute( ):
     cohort_name = __.view_environment_entry( ( 'packages', 'cohort' ) )
     # TODO: Decode requirements location from environment.
     if not cohort_name: return
-    # TODO: Generate 'packages.exact.pip' programmatically.
-    # XXX: Rebuild 'packages.exact.pip' via:
-    #   pip-compile \
-    #       --generate-hashes \
-    #       --output-file sources/python3/devshim/packages.exact.pip \
-    #       pyproject.toml
     ensure_python_packages(
-        cohort_name, __.Path( __file__ ).parent / 'packages.exact.pip' )
+        cohort_name, derive_cohort_requirements_location( ) )
 
 _conditionally_execute( )
@@ -33,10 +33,9 @@ def discover_version( ):
 
 def discover_information( ):
     ''' Discovers information about project from local configuration. '''
-    from tomli import load
     from .data import paths
-    with paths.configuration.pyproject.open( 'rb' ) as file:
-        tables = load( file )
+    from .fs_utilities import summon_toml
+    tables = summon_toml( paths.configuration.pyproject )
     information = tables[ 'project' ]
     information.update( tables[ 'tool' ][ 'setuptools' ] )
     # TODO: Tool should be 'devshim'.
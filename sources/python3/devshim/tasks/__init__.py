@@ -68,14 +68,38 @@ def install_python( version ):
     language.produce_descriptor( version ).install( )
 
 
+@__.task(
+    'Install: Python Packages Wheelhouse',
+    multiplexer = __.PythonVersionMultiplexer( ),
+)
+def install_python_wheelhouse( version = None ):
+    ''' Prefetches artifacts for Python packages fixtures into wheelhouse.
+
+        The wheelhouse is shared across projects. Virtual environments can be
+        built without Internet access from it afterwards.
+
+        This task requires Internet access and may take some time. '''
+    from ..environments import (
+        build_python_venv as build_python_venv_,
+        is_executable_in_venv,
+    )
+    if not is_executable_in_venv( 'pip', version = version ):
+        # Restoration from a snapshot does not prefetch.
+        build_python_venv_( version, overwrite = True )
+    process_environment = __.derive_venv_variables( version = version )
+    from ..platforms import pep508_identify_python
+    identifier = pep508_identify_python( version = version )
+    from ..packages import prefetch_python_packages
+    prefetch_python_packages( process_environment, identifier )
+
+
 @__.task(
     'Build: Python Virtual Environment',
     multiplexer = __.PythonVersionMultiplexer( ),
 )
 def build_python_venv( version, overwrite = False ):
     ''' Creates virtual environment for requested Python version. '''
-    # TODO? Install exact packages, if possible.
-    from ._invoke import extract_task_invocable
+    from .dispatcher import extract_task_invocable
     extract_task_invocable( install_python )( version )
     from .. import environments
     environments.build_python_venv( version, overwrite = overwrite )
@@ -221,6 +245,45 @@ def freshen_python_packages( version = None ):
     __.invoke_task( test, version = version )
 
 
+@__.task( 'Freshen: Bootstrap Packages Lock' )
+def freshen_python_cohort( index_url = '' ):
+    ''' Locks hashed requirements of bootstrap packages cohort.
+
+        Dependencies from 'pyproject.toml' are resolved for the current
+        Python and for each declared Python version, which is installed, and
+        the results are merged into one file of exact requirements. Pins
+        from the existing file are preferred, so that only bumped
+        dependencies and their dependencies change.
+
+        This task requires Internet access and may take some time. '''
+    from ..fs_utilities import summon_toml
+    from ..languages.python import language
+    from ..packages import lock_python_packages
+    from ..pre import derive_cohort_requirements_location
+    requirements = (
+        summon_toml( __.paths.auxiliary / 'pyproject.toml' )
+        [ 'project' ][ 'dependencies' ] )
+    # The cohort is consumed by whichever interpreter runs 'develop.py'.
+    from pathlib import Path
+    from sys import executable as python_location
+    python_locations = [ Path( python_location ) ]
+    for version in language.survey_descriptors( ):
+        try:
+            python_locations.append(
+                language.produce_descriptor( version )
+                .infer_executables_location( name = 'python' ) )
+        except Exception: # pylint: disable=broad-except
+            __.scribe.warning(
+                f"Absent or corrupt installation for Python {version!r}. "
+                "Skipping." )
+    python_locations = list( {
+        location.resolve( ): location for location in python_locations
+    }.values( ) )
+    lock_python_packages(
+        derive_cohort_requirements_location( ),
+        requirements, python_locations, index_url = index_url )
+
+
 @__.task( 'Freshen: Git Modules' )
 def freshen_git_modules( ):
     ''' Performs recursive update of all Git modules.
@@ -256,8 +319,25 @@ def freshen( ):
         This task requires Internet access and may take some time. '''
 
 
+_lint_targets_default = (
+    __.paths.sources.prj.python3,
+    __.paths.tests.prj.python3,
+    __.paths.project / 'develop.py',
+    __.paths.project / 'setup.py',
+    __.paths.sources.prj.sphinx / 'conf.py',
+)
+
+
+_lint_inputs = (
+    *_lint_targets_default,
+    __.paths.configuration.pyproject,
+    __.identify_venv_packages,
+)
+
+
 @__.task(
     'Lint: Bandit',
+    inputs = _lint_inputs,
     multiplexer = __.PythonVersionMultiplexer( ),
 )
 def lint_bandit( version = None ):
@@ -278,11 +358,10 @@ def lint_bandit( version = None ):
 
 @__.task(
     'Lint: Mypy',
+    inputs = (
+        *_lint_inputs, __.produce_arguments_files_identifier( 'files' ), ),
     multiplexer = __.PythonVersionMultiplexer( ),
-    task_nomargs = dict(
-        iterable = ( 'packages', 'modules', 'files', ),
-        pre = ( clean_tool_caches, ), # TODO: Target Mypy cache only.
-    ),
+    task_nomargs = dict( iterable = ( 'packages', 'modules', 'files', ), ),
 )
 def lint_mypy( packages, modules, files, version = None ):
     ''' Lints the source code with Mypy. '''
@@ -304,6 +383,9 @@ def lint_mypy( packages, modules, files, version = None ):
     modules_str = ' '.join( map(
         lambda module: f"--module {module}", modules ) )
     files_str = ' '.join( map( str, files ) )
+    # Cleared only when linting, so that up-to-date lints stay no-ops.
+    from ..fs_utilities import unlink_recursively
+    unlink_recursively( __.paths.caches.mypy )
     __.project_execute_external(
         f"mypy {packages_str} {modules_str} {files_str}",
         env = process_environment )
@@ -311,6 +393,8 @@ def lint_mypy( packages, modules, files, version = None ):
 
 @__.task(
     'Lint: Pylint',
+    inputs = (
+        *_lint_inputs, __.produce_arguments_files_identifier( 'targets' ), ),
     multiplexer = __.PythonVersionMultiplexer( ),
     task_nomargs = dict( iterable = ( 'targets', 'checks', ), ),
 )
@@ -336,6 +420,7 @@ def lint_pylint( targets, checks, report = False, version = None ):
 
 @__.task(
     'Lint: Semgrep',
+    inputs = ( *_lint_inputs, linters.semgrep.identify_rules, ),
     multiplexer = __.PythonVersionMultiplexer( ),
 )
 def lint_semgrep( version = None ):
@@ -361,25 +446,18 @@ def lint_semgrep( version = None ):
         f"{files_str}", cwd = rules_location, env = process_environment )
 
 
-_lint_targets_default = (
-    __.paths.sources.prj.python3,
-    __.paths.tests.prj.python3,
-    __.paths.project / 'develop.py',
-    __.paths.project / 'setup.py',
-    __.paths.sources.prj.sphinx / 'conf.py',
-)
-
-
 @__.task( multiplexer = __.PythonVersionMultiplexer( ), )
 def lint( version = None ):
     ''' Lints the source code. '''
-    __.invoke_task(
-        lint_pylint, targets = ( ), checks = ( ), version = version )
-    __.invoke_task( lint_semgrep, version = version )
-    __.invoke_task(
-        lint_mypy,
-        packages = ( ), modules = ( ), files = ( ), version = version )
-    __.invoke_task( lint_bandit, version = version )
+    from os import cpu_count
+    __.invoke_tasks_concurrently(
+        __.call( lint_pylint, targets = ( ), checks = ( ), version = version ),
+        __.call( lint_semgrep, version = version ),
+        __.call(
+            lint_mypy,
+            packages = ( ), modules = ( ), files = ( ), version = version ),
+        __.call( lint_bandit, version = version ),
+        jobs = min( 4, cpu_count( ) or 1 ) )
 
 
 @__.task( 'Make: Code Coverage Report' )
@@ -423,7 +501,24 @@ def check_urls( ):
         venv_specification = { } )
 
 
-@__.task( 'Test: README Render' )
+def _identify_sdist( arguments ): # pylint: disable=unused-argument
+    ''' Identifies source distribution, which Twine checks, by its digest. '''
+    path = _get_sdist_path( )
+    if not path.is_file( ): return None
+    from ..pre import calculate_file_digest
+    return calculate_file_digest( path )
+
+
+@__.task(
+    'Test: README Render',
+    # The project readme is assembled from the README and the changelog.
+    inputs = (
+        'README.*',
+        __.paths.configuration.pyproject,
+        __.paths.sources.prj.sphinx / 'changelog.rst',
+        _identify_sdist,
+    ),
+)
 def check_readme( ):
     ''' Checks that the README will render correctly on PyPI. '''
     path = _get_sdist_path( )
@@ -479,6 +574,12 @@ def _get_wheel_path( ):
 
 @__.task(
     'Artifact: Documentation',
+    inputs = (
+        __.paths.sources.prj.sphinx,
+        __.paths.sources.prj.python3,
+        'README.*',
+        lambda arguments: __.paths.artifacts.sphinx_html.exists( ),
+    ),
     task_nomargs = dict( pre = ( check_urls, ), ),
 )
 def make_html( ):
@@ -491,7 +592,11 @@ def make_html( ):
         venv_specification = { } )
 
 
-@__.task( task_nomargs = dict( pre = ( clean, make_wheel, make_html, ), ), )
+@__.task(
+    task_nomargs = dict(
+        pre = ( clean, __.concurrently( make_wheel, make_html ), ),
+    ),
+)
 def make( ):
     ''' Generates all of the artifacts. '''
 
@@ -502,8 +607,7 @@ def _ensure_clean_workspace( ):
         'git status --short', capture_output = True )
     if result.stdout or result.stderr:
         # TODO: Use different error-handling mechanism.
-        from invoke import Exit
-        raise Exit( 'Dirty workspace. Please stash or commit changes.' )
+        raise SystemExit( 'Dirty workspace. Please stash or commit changes.' )
 
 
 @__.task( 'Change: Project Version' )
@@ -546,7 +650,6 @@ def bump_stage( ):
 def branch_release( remote = 'origin' ):
     ''' Makes a new branch for development torwards a release. '''
     import re
-    from invoke import Exit  # TODO: Use different error-handling mechanism.
     _ensure_clean_workspace( )
     project_version = __.discover_project_version( )
     mainline_regex = re.compile(
@@ -558,13 +661,14 @@ def branch_release( remote = 'origin' ):
         'git branch --show-current', capture_output = True ).stdout.strip( )
     if mainline_branch != true_branch:
         # TODO: Use different error-reporting mechanism.
-        raise Exit( f"Cannot create release from branch: {true_branch}" )
+        raise SystemExit(
+            f"Cannot create release from branch: {true_branch}" )
     from ..packages import Version
     this_version = Version.from_string( project_version )
     stage = this_version.stage
     if 'a' != stage:
         # TODO: Use different error-reporting mechanism.
-        raise Exit( f"Cannot create release from stage: {stage}" )
+        raise SystemExit( f"Cannot create release from stage: {stage}" )
     target_branch = f"release-{this_version.major}.{this_version.minor}"
     __.project_execute_external( f"git checkout -b {target_branch}" )
 
@@ -666,42 +770,29 @@ def check_pypi_integrity( version = None, index_url = '' ):
         url = package_info[ 'url' ]
         if not package_info.get( 'has_sig', False ):
             # TODO: Use different error-handling mechanism.
-            from invoke import Exit
-            raise Exit( f"No signature found for: {url}" )
-        check_pypi_package( url )
+            raise SystemExit( f"No signature found for: {url}" )
+        digest = package_info.get( 'digests', { } ).get( 'sha256' )
+        check_pypi_package( url, digest = digest and f"sha256:{digest}" )
+
 
+# TODO: Move to '.packages'.
+def check_pypi_package( package_url, digest = None ):
+    ''' Verifies signature on package.
 
-# TODO: Move to '.packages' and separate retry logic from fetch logic.
-def check_pypi_package( package_url ): # pylint: disable=too-many-locals
-    ''' Verifies signature on package. '''
+        Also verifies digest of package, if one is expected. '''
     from ..file_utilities import assert_gpg_tty
     assert_gpg_tty( )
     from urllib.parse import urlparse as parse_url
     package_filename = parse_url( package_url ).path.split( '/' )[ -1 ]
     from pathlib import Path
     from tempfile import TemporaryDirectory
-    from time import sleep
-    from urllib.error import URLError as UrlError
-    from urllib.request import urlopen as access_url
+    from ..http_utilities import retrieve_url
     with TemporaryDirectory( ) as cache_path_raw:
         cache_path = Path( cache_path_raw )
         package_path = cache_path / package_filename
         signature_path = cache_path / f"{package_filename}.asc"
-        attempts_count_max = 2
-        for attempts_count in range( attempts_count_max + 1 ):
-            try:
-                # nosemgrep: python.lang.security.audit.dynamic-urllib-use-detected
-                with access_url( package_url ) as http_reader:
-                    with package_path.open( 'wb' ) as file:
-                        file.write( http_reader.read( ) )
-                # nosemgrep: python.lang.security.audit.dynamic-urllib-use-detected
-                with access_url( f"{package_url}.asc" ) as http_reader:
-                    with signature_path.open( 'wb' ) as file:
-                        file.write( http_reader.read( ) )
-            except UrlError:
-                if attempts_count_max == attempts_count: raise
-                sleep( 2 ** attempts_count )
-            else: break
+        retrieve_url( package_url, package_path, digest = digest )
+        retrieve_url( f"{package_url}.asc", signature_path )
         __.execute_external( f"gpg --verify {signature_path}" )
 
 
@@ -796,7 +887,7 @@ def show_python( all_versions = False ):
     from ..languages.python import language
     if all_versions:
         for version in language.survey_descriptors( ).keys( ): print( version )
-    else: print( language.detect_default_descriptor( ).name )
+    else: print( language.detect_default_descriptor_name( ) )
 
 
 @__.task( )
@@ -807,7 +898,130 @@ def show_environments( ):
     for descriptor in survey_descriptors( ).keys( ): print( descriptor )
 
 
-# For use by Invoke's module loader. Must be called 'namespace' (or 'ns').
+@__.task( )
+def benchmark_startup( repetitions = 5, task_name = 'lint.pylint' ):
+    ''' Compares cold-start times of native and Invoke task dispatchers.
+
+        Each repetition renders help for a task in a fresh process, which
+        runs without the tasks manifest or daemon shortcuts. '''
+    from functools import partial
+    from sys import executable as active_python_path
+    from ..base import (
+        current_process_environment, derive_environment_entry_name, )
+    command = (
+        active_python_path, str( __.paths.project / 'develop.py' ),
+        '--help', task_name )
+    environment = dict( current_process_environment )
+    environment.pop( derive_environment_entry_name( 'daemon' ), None )
+    runner_entry_name = derive_environment_entry_name( 'tasks', 'runner' )
+    _benchmark(
+        tuple(
+            ( runner_name, partial(
+                __.project_execute_external, command,
+                capture_output = True,
+                env = { **environment, runner_entry_name: runner_name } ) )
+            for runner_name in ( 'invoke', 'native' ) ),
+        repetitions )
+
+
+def _benchmark( subjects, repetitions ):
+    ''' Times repetitions of subjects and reports durations and speedup.
+
+        Subjects are pairs of names and callables. Speedup is of the last
+        subject relative to the first, by median duration. '''
+    from statistics import median
+    from time import perf_counter
+    durations = { }
+    for name, subject in subjects:
+        durations[ name ] = [ ]
+        for _ in range( repetitions ):
+            time_start = perf_counter( )
+            subject( )
+            durations[ name ].append( perf_counter( ) - time_start )
+    width = max( map( len, durations ) )
+    for name, durations_ in durations.items( ):
+        print( f"{name:>{width}}: "
+               f"minimum {min( durations_ ) * 1000:.2f} ms, "
+               f"median {median( durations_ ) * 1000:.2f} ms" )
+    medians = tuple( map( median, durations.values( ) ) )
+    print( f"speedup: {medians[ 0 ] / medians[ -1 ]:.2f}x" )
+
+
+@__.task( )
+def benchmark_http( requests_count = 200 ):
+    ''' Compares pooled and unpooled HTTP retrievals from local server.
+
+        The server stands in for a package index. Like such indices, it
+        keeps connections alive between requests. Durations are per
+        request. '''
+    from functools import partial
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    from threading import Thread
+    from urllib.request import urlopen as access_url
+    from ..http_utilities import retrieve_url
+
+    class Handler( BaseHTTPRequestHandler ):
+        ''' Responds with small JSON document to any request. '''
+
+        disable_nagle_algorithm = True # As production servers do.
+        protocol_version = 'HTTP/1.1'
+
+        def do_GET( self ): # pylint: disable=invalid-name
+            ''' Responds to GET request. '''
+            body = b'{"releases": {}}'
+            self.send_response( 200 )
+            self.send_header( 'Content-Length', str( len( body ) ) )
+            self.send_header( 'Content-Type', 'application/json' )
+            self.end_headers( )
+            self.wfile.write( body )
+
+        def log_message( self, format, *args ): # pylint: disable=redefined-builtin
+            pass
+
+    def retrieve_unpooled( url ):
+        # nosemgrep: python.lang.security.audit.dynamic-urllib-use-detected
+        with access_url( url ) as http_reader: return http_reader.read( )
+
+    with ThreadingHTTPServer( ( '127.0.0.1', 0 ), Handler ) as server:
+        Thread( target = server.serve_forever, daemon = True ).start( )
+        url = "http://127.0.0.1:{}/pypi/package/json".format(
+            server.server_address[ 1 ] )
+        _benchmark( (
+            ( 'unpooled', partial( retrieve_unpooled, url ) ),
+            ( 'pooled', partial( retrieve_url, url ) ),
+        ), requests_count )
+        server.shutdown( )
+
+
+@__.task( )
+def benchmark_packages_survey( version = None, repetitions = 5 ):
+    ''' Compares surveys of installed packages via Pip and via metadata.
+
+        Both surveys are of the virtual environment for the Python version.
+        Their entries are also compared for equality. '''
+    from functools import partial
+    from ..packages import indicate_current_python_packages
+    process_environment = __.derive_venv_variables( version = version )
+    entries = { }
+
+    def survey( name, use_pip ):
+        entries[ name ] = indicate_current_python_packages(
+            process_environment, use_pip = use_pip )
+
+    _benchmark(
+        tuple(
+            ( name, partial( survey, name, use_pip ) )
+            for name, use_pip in ( ( 'pip', True ), ( 'metadata', False ) ) ),
+        repetitions )
+    surveys = [
+        [ ( str( entry.requirement ), entry.flags )
+          for entry in entries_ if 'editable' not in entry.flags ]
+        for entries_ in entries.values( ) ]
+    print( "identical: {}".format(
+        'yes' if surveys[ 0 ] == surveys[ 1 ] else 'no' ) )
+
+
+# Collection of tasks for the command-line dispatchers.
 namespace = __.TaskCollection( )
 namespace.add_task( bootstrap )
 namespace.add_task( ease )
@@ -842,6 +1056,7 @@ namespace.subcollection_from_path( 'clean' ).add_task(
     clean, name = 'ALL', default = True )
 namespace.add_collection( __.TaskCollection(
     'freshen',
+    cohort = freshen_python_cohort,
     git_hooks = freshen_git_hooks,
     git_modules = freshen_git_modules,
     pypackages = freshen_python_packages,
@@ -853,6 +1068,7 @@ namespace.add_collection( __.TaskCollection(
     'install',
     git_hooks = install_git_hooks,
     python = install_python,
+    wheelhouse = install_python_wheelhouse,
 ) )
 namespace.add_collection( __.TaskCollection(
     'lint',
@@ -887,4 +1103,7 @@ namespace.add_collection( __.TaskCollection(
 ) )
 namespace.add_collection( __.TaskCollection(
     'xp',
+    benchmark_http = benchmark_http,
+    benchmark_packages_survey = benchmark_packages_survey,
+    benchmark_startup = benchmark_startup,
 ) )
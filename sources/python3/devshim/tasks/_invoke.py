@@ -17,14 +17,47 @@
 #                                                                            #
 #============================================================================#
 
-''' Augmentations to Invoke. '''
+''' Dispatch of tasks with Invoke.
 
+    Alternative to the native dispatcher. Selected by setting the
+    ``DEVSHIM_TASKS_RUNNER`` environment variable to ``invoke``. '''
 
-from invoke import Task as _Task
+
+from invoke import Executor as _Executor, Task as _Task
+
+
+class Executor( _Executor ):
+    ''' Executes tasks from command line via native scheduler. '''
+
+    def execute( self, *tasks ):
+        from ..telemetry import establish_session
+        from .scheduler import execute_task
+        with establish_session( ):
+            for call in self.normalize( tasks ):
+                execute_task(
+                    call.task.native_task, *call.args, **call.kwargs )
+        return { }
 
 
 class Task( _Task ):
-    ''' Patches for broken methods. '''
+    ''' Adapts native task to Invoke. Patches broken methods. '''
+
+    def __init__( self, task ):
+        from inspect import signature as scan_signature
+
+        # pylint: disable=unused-argument
+        def body( context, *posargs, **nomargs ):
+            return task( *posargs, **nomargs )
+        # pylint: enable=unused-argument
+
+        body.__doc__ = task.__doc__
+        body.__module__ = task.__module__
+        body.__name__ = task.__name__
+        body.__signature__ = scan_signature( task.body )
+        # Prerequisites and postrequisites are left to native scheduler.
+        super( ).__init__(
+            body, aliases = task.aliases, iterable = list( task.iterable ) )
+        self.native_task = task
 
     def argspec(self, invocable): # pylint: disable=arguments-renamed
         ''' Returns the argument specifications for given callable.
@@ -40,7 +73,8 @@ class Task( _Task ):
         )
         from invoke.tasks import NO_DEFAULT
         acceptable_variate_species = (
-            Variate.POSITIONAL_ONLY, Variate.POSITIONAL_OR_KEYWORD, )
+            Variate.POSITIONAL_ONLY, Variate.POSITIONAL_OR_KEYWORD,
+            Variate.KEYWORD_ONLY, )
         variates = scan_signature( invocable ).parameters
         specifications = {
             variate_name:
@@ -50,9 +84,24 @@ class Task( _Task ):
         return specifications.keys( ), specifications
 
 
-def extract_task_invocable( task ):
-    ''' Extracts innermost invocable from Invoke task. '''
-    invocable = task.body
-    while hasattr( invocable, '__wrapped__' ):
-        invocable = invocable.__wrapped__
-    return invocable
+def produce_collection( collection ):
+    ''' Produces Invoke collection from native collection. '''
+    from invoke import Collection
+    collection_ = Collection( )
+    collection_.name = collection.name
+    for name, task in collection.tasks.items( ):
+        collection_.add_task(
+            Task( task ), name = name, default = name == collection.default )
+    for name, subcollection in collection.collections.items( ):
+        collection_.add_collection(
+            produce_collection( subcollection ), name = name )
+    return collection_
+
+
+def run( collection, argv = None ):
+    ''' Runs tasks according to command-line arguments, using Invoke. '''
+    from invoke import Program
+    Program(
+        namespace = produce_collection( collection ),
+        executor_class = Executor,
+    ).run( argv )
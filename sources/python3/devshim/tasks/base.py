@@ -26,12 +26,16 @@ from abc import (
     ABCMeta as ABCFactory, abstractmethod as abstract_function,
 )
 
-from invoke import Collection as TaskCollection, call
-
 from ..base import execute_external, scribe
 from ..data import paths, project_name
 from ..environments import derive_venv_variables
 from ..project import discover_version as discover_project_version
+from .dispatcher import TaskCollection, call
+from .fingerprints import (
+    identify_venv_packages,
+    produce_arguments_files_identifier,
+)
+from .scheduler import CallGroup, concurrently
 # pylint: enable=unused-import
 
 from .. import base as __
@@ -59,6 +63,7 @@ def project_execute_external(
 
 def task( # pylint: disable=too-complex
     title = '', *,
+    inputs = None,
     multiplexer = None,
     task_nomargs = None,
 ):
@@ -66,31 +71,51 @@ def task( # pylint: disable=too-complex
 
         Banalities include:
         * Rendering a title box.
-        * Iterative execution over multiple platform versions. '''
+        * Iterative execution over multiple platform versions.
+        * Concurrent execution over multiple platform versions.
+        * Skipping of invocations for which declared inputs are unchanged.
+
+        Inputs may be files, directories, glob patterns relative to the
+        project, or callables which receive the bound arguments of an
+        invocation and return an identity string. '''
     from functools import wraps
-    from ._invoke import Task
-    from ..user_interface import render_boxed_title
+    from .dispatcher import Task
+    from .fingerprints import register_inputs
+    from .scheduler import (
+        invoke_task_invocable,
+        invoke_task_invocable_concurrently,
+    )
 
     def decorator( invocable ):
         ''' Produces invoker for the handling of assorted banalities. '''
         if None is not multiplexer:
             # TODO: Validate argument multiplexer.
             multiplexer.augment_docstring( invocable )
+            _augment_docstring_with_jobs( invocable )
+        if inputs: register_inputs( invocable, inputs )
 
         # nosemgrep: python.lang.maintainability.useless-inner-function
         @wraps( invocable )
-        def invoker( context, *posargs, **nomargs ): # pylint: disable=unused-argument
+        def invoker( *posargs, **nomargs ):
             ''' Handles assorted banalities. '''
             if None is not multiplexer:
-                for value, re_posargs, re_nomargs in multiplexer.multiplex(
-                    invocable, posargs, nomargs
-                ):
-                    if title: render_boxed_title( title, supplement = value )
-                    _invoke_task_invocable( invocable, re_posargs, re_nomargs )
+                jobs = nomargs.pop( 'jobs', 1 )
+                invocations = tuple( multiplexer.multiplex(
+                    invocable, posargs, nomargs ) )
+                if 1 < jobs and 1 < len( invocations ):
+                    invoke_task_invocable_concurrently(
+                        invocable, title, invocations, jobs )
+                    return
+                for value, re_posargs, re_nomargs in invocations:
+                    invoke_task_invocable(
+                        invocable, re_posargs, re_nomargs,
+                        title = title, supplement = value )
             else:
-                if title: render_boxed_title( title )
-                _invoke_task_invocable( invocable, posargs, nomargs )
+                invoke_task_invocable(
+                    invocable, posargs, nomargs, title = title )
 
+        if None is not multiplexer:
+            _augment_signature_with_jobs( invoker, invocable )
         return Task( invoker, **( task_nomargs or { } ) )
 
     return decorator
@@ -143,7 +168,7 @@ class PythonVersionMultiplexer( ArgumentMultiplexer ):
         argument = binder.arguments[ self.argument_name ]
         from ..languages.python import language
         if None is argument and self.enable_default:
-            versions = ( language.detect_default_descriptor( ).name, )
+            versions = ( language.detect_default_descriptor_name( ), )
         elif 'ALL' == argument:
             versions = language.survey_descriptors( ).keys( )
         else: versions = ( language.validate_descriptor( argument ), )
@@ -152,17 +177,45 @@ class PythonVersionMultiplexer( ArgumentMultiplexer ):
             yield version, binder.args, binder.kwargs
 
 
+def invoke_tasks_concurrently( *calls, jobs = None ):
+    ''' Invokes tasks concurrently, each in its own worker process.
+
+        Output from each task is captured and then rendered in the order of
+        the calls. If any task fails, then the exit code of the first failed
+        call is used for exit, once all of the tasks have finished. '''
+    from .scheduler import execute_calls_concurrently
+    return execute_calls_concurrently( calls, jobs = jobs )
+
+
 def invoke_task( task_, *posargs, **nomargs ):
-    ''' Invokes task with context. '''
-    # Invoke with fake context until we remove dependency on Invoke.
-    from invoke import Context
-    return task_( Context( ), *posargs, **nomargs )
-
-
-def _invoke_task_invocable( invocable, posargs, nomargs ):
-    from subprocess import CalledProcessError as SubprocessFailure # nosec B404
-    try: invocable( *posargs, **nomargs )
-    except SubprocessFailure as exc:
-        excc = type( exc )
-        __.scribe.error( f"{excc.__module__}.{excc.__qualname__}: {exc}" )
-        raise SystemExit( exc.returncode ) from exc
+    ''' Invokes task, along with its prerequisites and postrequisites.
+
+        Invocation is skipped if equivalent invocation has already completed
+        during this session. '''
+    from .scheduler import execute_task
+    return execute_task( task_, *posargs, **nomargs )
+
+
+def _augment_docstring_with_jobs( invocable ):
+    ''' Augments docstring of invocable to describe concurrency argument. '''
+    invocable.__doc__ = '\n\n'.join( (
+        invocable.__doc__,
+        "If argument 'jobs' is greater than one, then up to that many "
+        "multiplexed invocations execute concurrently." ) )
+
+
+def _augment_signature_with_jobs( invoker, invocable ):
+    ''' Augments signature of invoker with concurrency argument. '''
+    from inspect import (
+        Parameter as Variate,
+        signature as scan_signature,
+    )
+    signature = scan_signature( invocable )
+    if 'jobs' in signature.parameters:
+        # TODO: Use exception factory.
+        raise ValueError(
+            f"Multiplexed task {invocable.__name__!r} "
+            "cannot have argument 'jobs'." )
+    invoker.__signature__ = signature.replace( parameters = (
+        *signature.parameters.values( ),
+        Variate( 'jobs', Variate.KEYWORD_ONLY, default = 1 ) ) )
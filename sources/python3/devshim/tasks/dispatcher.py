@@ -0,0 +1,468 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+''' Native command-line dispatcher for tasks.
+
+    Tasks, collections of tasks, and calls to tasks are modeled here.
+    Command-line arguments are parsed straight from the signatures of task
+    invocables, following the conventions of Invoke:
+
+    * Underscores in names become dashes.
+    * Arguments without defaults may be supplied positionally.
+    * Boolean arguments are flags; those which default to true also have
+      ``--no-`` variants.
+    * Values are coerced to the types of their defaults.
+    * Iterable arguments accumulate the values of repeated flags.
+
+    Several tasks, each with its own arguments, may be given in one command.
+
+    Only a few core flags are supported: ``--complete``, ``--help``,
+    ``--list``, and ``--version``. Set the ``DEVSHIM_TASKS_RUNNER``
+    environment variable to ``invoke`` to dispatch with Invoke instead. '''
+
+
+from .. import base as __
+
+
+class Task:
+    ''' Task with invocable body, prerequisites, and postrequisites. '''
+
+    def __init__(
+        self, body, *, aliases = ( ), iterable = ( ), post = ( ), pre = ( )
+    ):
+        # TODO: Validate arguments.
+        self.body = body
+        self.aliases = tuple( aliases )
+        self.iterable = tuple( iterable )
+        self.post = tuple( post )
+        self.pre = tuple( pre )
+        # Introspectors, such as Sphinx autodoc, look for these.
+        self.__doc__ = getattr( body, '__doc__', '' )
+        self.__module__ = getattr( body, '__module__', '' )
+        self.__name__ = getattr( body, '__name__', '' )
+
+    def __call__( self, *posargs, **nomargs ):
+        return self.body( *posargs, **nomargs )
+
+    def __repr__( self ):
+        return f"<{type( self ).__qualname__} {self.name!r}>"
+
+    @property
+    def name( self ):
+        ''' Name of task body. '''
+        return self.__name__
+
+
+class Call:
+    ''' Call to task with arguments. '''
+
+    def __init__( self, task, *posargs, **nomargs ):
+        # TODO: Validate arguments.
+        self.task = task
+        self.args = posargs
+        self.kwargs = nomargs
+
+    def __repr__( self ):
+        arguments = ', '.join( (
+            *map( repr, self.args ),
+            *( f"{name} = {value!r}" for name, value in self.kwargs.items( ) )
+        ) )
+        return "call( {} )".format(
+            ', '.join( filter( None, ( self.task.name, arguments ) ) ) )
+
+
+def call( task, *posargs, **nomargs ):
+    ''' Produces call to task with arguments.
+
+        Intended for use in prerequisites and postrequisites of tasks. '''
+    return Call( task, *posargs, **nomargs )
+
+
+class TaskCollection:
+    ''' Collection of tasks and subcollections.
+
+        Optional first positional argument is the name of the collection.
+        Other positional arguments are tasks or collections, which are added
+        under their own names. Nominative arguments are added under their
+        argument names. '''
+
+    def __init__( self, *posargs, **nomargs ):
+        self.name = None
+        self.collections = { }
+        self.default = None
+        self.tasks = { }
+        if posargs and isinstance( posargs[ 0 ], str ):
+            self.name, posargs = posargs[ 0 ], posargs[ 1 : ]
+        for object_ in posargs: self._add_object( object_ )
+        for name, object_ in nomargs.items( ):
+            self._add_object( object_, name = name )
+
+    def __getitem__( self, name ):
+        ''' Task for dotted name or alias. Default task for empty name. '''
+        if not name:
+            if None is self.default:
+                raise KeyError( f"No default task in {self.name!r}." )
+            return self.tasks[ self.default ]
+        head, _, tail = name.partition( '.' )
+        if head in self.collections: return self.collections[ head ][ tail ]
+        if tail: raise KeyError( name )
+        if name in self.tasks: return self.tasks[ name ]
+        for task in self.tasks.values( ):
+            if name in map( _transform_name, task.aliases ): return task
+        raise KeyError( name )
+
+    def __repr__( self ):
+        return f"<{type( self ).__qualname__} {self.name!r}>"
+
+    def add_collection( self, collection, name = None ):
+        ''' Adds subcollection under its name or supplied name. '''
+        name = _transform_name( name or collection.name )
+        # TODO: Use exception factory.
+        if not name: raise ValueError( "Subcollection must have name." )
+        self.collections[ name ] = collection
+
+    def add_task( self, task, name = None, aliases = None, default = None ):
+        ''' Adds task under its name or supplied name.
+
+            Task may be made default task of collection. '''
+        name = _transform_name( name or task.name )
+        if aliases: task.aliases = ( *task.aliases, *aliases )
+        self.tasks[ name ] = task
+        if default: self.default = name
+
+    def subcollection_from_path( self, path ):
+        ''' Subcollection for dotted path. '''
+        collection = self
+        for name in path.split( '.' ):
+            collection = collection.collections[ _transform_name( name ) ]
+        return collection
+
+    @property
+    def task_names( self ):
+        ''' Dictionary of dotted task names to their aliases.
+
+            Collection names are aliases of their default tasks. '''
+        names = {
+            name: list( map( _transform_name, task.aliases ) )
+            for name, task in self.tasks.items( ) }
+        for collection_name, collection in self.collections.items( ):
+            for task_name, aliases in collection.task_names.items( ):
+                aliases = [
+                    f"{collection_name}.{alias}" for alias in aliases ]
+                if collection.default == task_name:
+                    aliases.append( collection_name )
+                names[ f"{collection_name}.{task_name}" ] = aliases
+        return names
+
+    def _add_object( self, object_, name = None ):
+        if isinstance( object_, TaskCollection ):
+            self.add_collection( object_, name = name )
+        else: self.add_task( object_, name = name )
+
+
+def extract_task_invocable( task ):
+    ''' Extracts innermost invocable from task. '''
+    invocable = task.body
+    while hasattr( invocable, '__wrapped__' ):
+        invocable = invocable.__wrapped__
+    return invocable
+
+
+def parse_arguments( collection, arguments ):
+    ''' Parses command-line arguments into core flags and task calls.
+
+        Errors are reported via :py:exc:`SystemExit`. '''
+    core = dict(
+        complete = False, help = None, list = None, version = False,
+        remainder = ( ) )
+    tokens = list( arguments )
+    while tokens and tokens[ 0 ].startswith( '-' ):
+        token = tokens.pop( 0 )
+        if '--' == token:
+            core[ 'remainder' ] = tuple( tokens )
+            return core, ( )
+        flag, _, value = token.partition( '=' )
+        name = _core_flags.get( flag )
+        if None is name: raise SystemExit( f"No idea what {token!r} is!" )
+        if name not in ( 'help', 'list' ):
+            core[ name ] = True
+            continue
+        if not value and tokens and not tokens[ 0 ].startswith( '-' ):
+            value = tokens.pop( 0 )
+        core[ name ] = value or True
+    calls = [ ]
+    while tokens:
+        token = tokens.pop( 0 )
+        if '--' == token:
+            core[ 'remainder' ] = tuple( tokens )
+            break
+        task = _lookup_task( collection, token )
+        calls.append( Call( task, **_parse_task_arguments(
+            token, survey_task_arguments( task ), tokens ) ) )
+    return core, tuple( calls )
+
+
+def run( collection, argv = None ):
+    ''' Runs tasks according to command-line arguments.
+
+        Arguments are taken from the process, if not supplied. The first
+        argument is the program name and is ignored. '''
+    if None is argv:
+        from sys import argv as argv_
+        argv = argv_
+    core, calls = parse_arguments( collection, argv[ 1 : ] )
+    from ..__main__ import (
+        render_columns,
+        render_completion_candidates,
+        render_tasks_listing,
+    )
+    if core[ 'complete' ]:
+        from .manifest import survey_manifest
+        render_completion_candidates(
+            survey_manifest( collection ), core[ 'remainder' ] )
+        return
+    if core[ 'version' ]:
+        print( f"{_program_name} {__.version}" )
+        return
+    if True is core[ 'help' ]:
+        print( f"Usage: {_program_name} [--core-opts] "
+               "<subcommand> [--subcommand-opts] ...\n" )
+        print( "Core options:\n" )
+        render_columns( _core_help )
+        render_tasks_listing( survey_listing( collection ) )
+        return
+    if None is not core[ 'help' ]:
+        _render_task_help( collection, core[ 'help' ], render_columns )
+        return
+    if None is not core[ 'list' ]:
+        root = None if True is core[ 'list' ] else core[ 'list' ]
+        render_tasks_listing( survey_listing( collection, root = root ) )
+        return
+    if not calls:
+        if None is collection.default:
+            render_tasks_listing( survey_listing( collection ) )
+            return
+        calls = ( Call( collection[ '' ] ), )
+    from ..telemetry import establish_session
+    from .scheduler import execute_task
+    with establish_session( ):
+        for call_ in calls:
+            execute_task( call_.task, *call_.args, **call_.kwargs )
+
+
+def survey_listing( collection, root = None ):
+    ''' Surveys names and help lines of tasks for listing.
+
+        Listing may be limited to subcollection at root path. '''
+    if None is root: collection_ = collection
+    else:
+        try: collection_ = collection.subcollection_from_path( root )
+        except KeyError as exc:
+            raise SystemExit( f"Sub-collection {root!r} not found!" ) from exc
+    return dict(
+        opener = 'Subcommands',
+        pairs = _survey_listing_pairs( collection_, ( ), root ),
+        default = collection_.default,
+        root = root )
+
+
+def survey_task_arguments( task ):
+    ''' Surveys command-line arguments of task from signature of its body.
+
+        Short flags are assigned as Invoke would assign them. '''
+    from inspect import Parameter as Variate, signature as scan_signature
+    acceptable_variate_species = (
+        Variate.POSITIONAL_ONLY, Variate.POSITIONAL_OR_KEYWORD,
+        Variate.KEYWORD_ONLY, )
+    variates = tuple(
+        variate for variate in scan_signature( task.body ).parameters.values( )
+        if variate.kind in acceptable_variate_species )
+    taken_names = { variate.name for variate in variates }
+    arguments = [ ]
+    for variate in variates:
+        name = _transform_name( variate.name )
+        default = variate.default
+        iterable = variate.name in task.iterable
+        if iterable: kind = list
+        elif default in ( None, Variate.empty ): kind = str
+        else: kind = type( default )
+        flags = [ f"--{name}" ]
+        for character in name:
+            if '-' == character or character in taken_names: continue
+            flags.append( f"-{character}" )
+            break
+        inverse = f"--no-{name}" if True is default else None
+        taken_names.update( ( name, *( flag[ 1 : ] for flag in flags ) ) )
+        arguments.append( __.SimpleNamespace(
+            attribute = variate.name, name = name, flags = tuple( flags ),
+            default = default, inverse = inverse, kind = kind,
+            positional = Variate.empty is default and not iterable ) )
+    return tuple( arguments )
+
+
+def _coerce_value( argument, value ):
+    if argument.kind in ( list, str ): return value
+    try: return argument.kind( value )
+    except ValueError as exc:
+        raise SystemExit(
+            f"Invalid value {value!r} for flag {argument.flags[ 0 ]!r}."
+        ) from exc
+
+
+def _format_flags( argument ):
+    ''' Formats flags of argument for help. '''
+    value = None if bool is argument.kind else (
+        'INT' if int is argument.kind else 'STRING' )
+    flags = [ ]
+    for flag in argument.flags:
+        if None is value:
+            if argument.inverse and flag.startswith( '--' ):
+                flag = f"--[no-]{flag[ 2 : ]}"
+            flags.append( flag )
+        elif flag.startswith( '--' ): flags.append( f"{flag}={value}" )
+        else: flags.append( f"{flag} {value}" )
+    return ', '.join( sorted( flags, key = len ) )
+
+
+def _parse_task_arguments( task_name, arguments, tokens ):
+    ''' Consumes tokens of arguments to task.
+
+        Consumption stops at the first excess bare token,
+        which is presumed to be the name of the next task. '''
+    from inspect import Parameter as Variate
+    flags = { }
+    for argument in arguments:
+        flags.update( dict.fromkeys( argument.flags, argument ) )
+        if argument.inverse: flags[ argument.inverse ] = argument
+    pending = [ argument for argument in arguments if argument.positional ]
+    nomargs = { }
+    while tokens:
+        token = tokens[ 0 ]
+        if '--' == token: break
+        if not token.startswith( '-' ) or '-' == token:
+            if not pending: break
+            tokens.pop( 0 )
+            argument = pending.pop( 0 )
+            nomargs[ argument.attribute ] = _coerce_value( argument, token )
+            continue
+        tokens.pop( 0 )
+        flag, equals, value = token.partition( '=' )
+        argument = flags.get( flag )
+        if None is argument: raise SystemExit( f"No idea what {token!r} is!" )
+        if argument in pending: pending.remove( argument )
+        if bool is argument.kind:
+            nomargs[ argument.attribute ] = flag != argument.inverse
+            continue
+        if not equals:
+            if not tokens:
+                raise SystemExit(
+                    f"Flag {flag!r} needed value and was not given one!" )
+            value = tokens.pop( 0 )
+        value = _coerce_value( argument, value )
+        if list is argument.kind:
+            nomargs.setdefault( argument.attribute, [ ] ).append( value )
+        else: nomargs[ argument.attribute ] = value
+    if pending:
+        names = ', '.join( repr( argument.attribute ) for argument in pending )
+        raise SystemExit(
+            f"{task_name!r} did not receive required positional arguments: "
+            f"{names}" )
+    for argument in arguments:
+        if list is not argument.kind or argument.attribute in nomargs:
+            continue
+        default = argument.default
+        nomargs[ argument.attribute ] = (
+            [ ] if default in ( None, Variate.empty ) else list( default ) )
+    return nomargs
+
+
+def _render_task_help( collection, name, render_columns ):
+    from inspect import cleandoc
+    task = _lookup_task( collection, name )
+    arguments = survey_task_arguments( task )
+    options = '[--options] ' if arguments else ''
+    print( f"Usage: {_program_name} [--core-opts] {name} {options}"
+           "[other tasks here ...]\n" )
+    print( "Docstring:" )
+    for line in cleandoc( task.__doc__ or 'none' ).splitlines( ):
+        print( f"  {line}" if line.strip( ) else '' )
+    print( "\nOptions:" )
+    if not arguments:
+        print( "  none\n" )
+        return
+    render_columns( tuple(
+        ( _format_flags( argument ), '' ) for argument in sorted(
+            arguments, key = lambda argument: argument.name.lower( ) ) ) )
+
+
+def _survey_listing_pairs( collection, ancestors, root ):
+    ''' Surveys pairs of task names and help lines, as Invoke lists them. '''
+    pairs = [ ]
+    prefix = '.'.join( ancestors )
+    if prefix and root: prefix = f".{prefix}"
+    for name, task in sorted( collection.tasks.items( ) ):
+        is_default = collection.default == name
+        aliases = sorted( map( _transform_name, task.aliases ) )
+        if ancestors or root:
+            name = f".{name}"
+            aliases = [ f".{alias}" for alias in aliases ]
+        aliases = [ f"{prefix}{alias}" for alias in aliases ]
+        if ancestors and is_default: aliases.insert( 0, prefix )
+        aliases_str = " ({})".format( ', '.join( aliases ) ) if aliases else ''
+        pairs.append( (
+            f"{prefix}{name}{aliases_str}", _derive_help_line( task ) ) )
+    for name, subcollection in sorted( collection.collections.items( ) ):
+        pairs.extend( _survey_listing_pairs(
+            subcollection, ( *ancestors, name ), root ) )
+    return pairs
+
+
+def _derive_help_line( task ):
+    docstring = ( task.__doc__ or '' ).strip( )
+    return docstring.splitlines( )[ 0 ] if docstring else None
+
+
+def _lookup_task( collection, name ):
+    try: return collection[ name ]
+    except KeyError as exc:
+        raise SystemExit( f"No idea what {name!r} is!" ) from exc
+
+
+def _transform_name( name ):
+    ''' Transforms underscores within name into dashes. '''
+    if not name: return name
+    return '{}{}{}'.format(
+        name[ 0 ], name[ 1 : -1 ].replace( '_', '-' ), name[ 1 : ][ -1 : ] )
+
+
+_core_flags = __.DictionaryProxy( {
+    '--complete': 'complete',
+    '--help': 'help', '-h': 'help',
+    '--list': 'list', '-l': 'list',
+    '--version': 'version', '-V': 'version',
+} )
+_core_help = (
+    ( '--complete',
+      'Print tab-completion candidates for given parse remainder.' ),
+    ( '-h [STRING], --help[=STRING]', 'Show core or per-task help and exit.' ),
+    ( '-l [STRING], --list[=STRING]',
+      'List available tasks, optionally limited to a namespace.' ),
+    ( '-V, --version', 'Show version and exit.' ),
+)
+_program_name = __package__.split( '.', maxsplit = 1 )[ 0 ]
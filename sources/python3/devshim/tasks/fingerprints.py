@@ -0,0 +1,154 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+''' Fingerprints of declared task inputs.
+
+    A task may declare its inputs: files, directories, glob patterns relative
+    to the project, and callables which receive the bound arguments of an
+    invocation and return an identity string. After a successful invocation,
+    a digest of the inputs is recorded. Later invocations with the same
+    arguments and an identical digest are skipped as up to date.
+
+    Set the ``DEVSHIM_FINGERPRINTS`` environment variable to ``ignore`` to
+    execute tasks regardless of recorded fingerprints. '''
+
+
+from .. import base as __
+
+
+# Declared inputs by fully-qualified name of task invocable.
+# Populated at task definition time, so available in worker processes too.
+inputs_registry = { }
+
+
+def register_inputs( invocable, inputs ):
+    ''' Registers declared inputs for task invocable. '''
+    # TODO: Validate argument.
+    inputs_registry[ _derive_invocable_fqname( invocable ) ] = tuple( inputs )
+
+
+def calculate_fingerprint( invocable, posargs, nomargs ):
+    ''' Calculates fingerprint of inputs for invocation of task invocable.
+
+        Returns ``None`` if the task declares no inputs or if the arguments
+        cannot be bound. Else, returns pair of location at which fingerprint
+        is recorded and fingerprint digest. '''
+    inputs = inputs_registry.get( _derive_invocable_fqname( invocable ) )
+    if not inputs: return None
+    from hashlib import sha256
+    from inspect import signature as scan_signature
+    try: binder = scan_signature( invocable ).bind( *posargs, **nomargs )
+    except TypeError: return None
+    binder.apply_defaults( )
+    node_identity = repr( (
+        _derive_invocable_fqname( invocable ),
+        tuple( binder.arguments.items( ) ) ) )
+    hasher = sha256( )
+    hasher.update( __.version.encode( ) )
+    hasher.update( node_identity.encode( ) )
+    for input_ in inputs:
+        if callable( input_ ):
+            hasher.update( b'\0' )
+            hasher.update( str( input_( binder.arguments ) ).encode( ) )
+            continue
+        for path in _survey_input_files( input_ ):
+            _update_hasher_with_file( hasher, path )
+    from ..data import paths
+    location = paths.state.DEV.fingerprints / (
+        sha256( node_identity.encode( ) ).hexdigest( ) )
+    return location, hasher.hexdigest( )
+
+
+def probe_fingerprint( fingerprint ):
+    ''' Is recorded fingerprint identical to calculated fingerprint? '''
+    if 'ignore' == __.view_environment_entry( ( 'fingerprints', ) ):
+        return False
+    location, digest = fingerprint
+    if not location.exists( ): return False
+    return digest == location.read_text( ).strip( )
+
+
+def record_fingerprint( fingerprint ):
+    ''' Records calculated fingerprint. '''
+    from ..fs_utilities import ensure_directory
+    location, digest = fingerprint
+    ensure_directory( location.parent )
+    location.write_text( digest )
+
+
+def identify_venv_packages( arguments ):
+    ''' Identifies packages installed in virtual environment.
+
+        Intended as callable input for tasks with a 'version' argument. '''
+    from ..environments import derive_venv_path
+    venv_path = derive_venv_path( version = arguments.get( 'version' ) )
+    patterns = (
+        'lib/python*/site-packages/*.dist-info',
+        'Lib/site-packages/*.dist-info', )
+    distributions = sorted(
+        path.name
+        for pattern in patterns for path in venv_path.glob( pattern ) )
+    return '\n'.join( ( str( venv_path ), *distributions ) )
+
+
+def produce_arguments_files_identifier( *names ):
+    ''' Produces callable input which identifies files from arguments.
+
+        The arguments of the given names are iterables of paths, such as
+        lint targets which override the defaults of a task. '''
+
+    def identify_arguments_files( arguments ):
+        from hashlib import sha256
+        from pathlib import Path
+        hasher = sha256( )
+        for name in names:
+            for argument in arguments.get( name ) or ( ):
+                for path in _survey_input_files( Path( argument ) ):
+                    _update_hasher_with_file( hasher, path )
+        return hasher.hexdigest( )
+
+    return identify_arguments_files
+
+
+def _derive_invocable_fqname( invocable ):
+    return f"{invocable.__module__}.{invocable.__qualname__}"
+
+
+def _survey_input_files( input_ ):
+    ''' Surveys files which match input specification, in sorted order.
+
+        Strings are glob patterns relative to the project. Directories are
+        searched recursively. Byte code caches are ignored. '''
+    from ..data import paths
+    if isinstance( input_, str ):
+        candidates = paths.project.glob( input_ )
+    elif input_.is_dir( ): candidates = input_.rglob( '*' )
+    elif input_.exists( ): candidates = ( input_, )
+    else: candidates = ( )
+    return sorted(
+        path for path in candidates
+        if path.is_file( )
+        and '__pycache__' not in path.parts and '.pyc' != path.suffix )
+
+
+def _update_hasher_with_file( hasher, path ):
+    hasher.update( b'\0' )
+    hasher.update( str( path ).encode( ) )
+    hasher.update( b'\0' )
+    hasher.update( path.read_bytes( ) )
@@ -21,6 +21,17 @@
 ''' Task for R2C Semgrep Linter: https://r2c.dev/#semgrep '''
 
 
+def identify_rules( arguments ): # pylint: disable=unused-argument
+    ''' Identifies local copy of Semgrep Rules repository.
+
+        Intended as callable input for task fingerprints. '''
+    from ...data import locations
+    repository_location = (
+        locations.caches.DEV.repositories / 'semgrep-rules.tar.gz' )
+    if not repository_location.exists( ): return ''
+    return str( repository_location.stat( ).st_mtime_ns )
+
+
 def update_rules( ):
     ''' Update local copy of Semgrep Rules repository, if necessary. '''
     from datetime import timedelta as TimeDelta
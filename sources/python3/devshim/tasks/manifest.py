@@ -0,0 +1,103 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+''' Manifest of tasks for listing and shell completion.
+
+    The manifest captures task names, aliases, help lines, and flags of the
+    task collection. It is keyed by a digest of the sources of this package,
+    so that the entrypoint can answer requests for task listings and
+    completion candidates from it without importing the task modules. '''
+
+
+from .. import base as __
+
+
+def record_manifest( collection ):
+    ''' Records manifest for collection, unless current one already exists.
+
+        Failure to record is not fatal. '''
+    from ..__main__ import calculate_tasks_digest
+    from ..data import paths
+    location = paths.caches.DEV.tasks_manifest
+    digest = calculate_tasks_digest( )
+    if digest == _probe_manifest_digest( location ): return
+    manifest = survey_manifest( collection )
+    manifest[ 'digest' ] = digest
+    from json import dump
+    from os import replace
+    from ..fs_utilities import ensure_directory
+    temporary_location = location.with_suffix( '.partial' )
+    try:
+        ensure_directory( location.parent )
+        with temporary_location.open( 'w', encoding = 'utf-8' ) as file:
+            dump( manifest, file )
+        replace( temporary_location, location )
+    except OSError as exc:
+        __.scribe.warning( f"Could not record tasks manifest: {exc}" )
+
+
+def survey_manifest( collection ):
+    ''' Surveys task names, help lines, and flags from collection. '''
+    from .dispatcher import survey_listing, survey_task_arguments
+    contexts = { '': dict(
+        names = _core_flags,
+        known = _core_flags,
+        valued = ( '--help', '-h', '--list', '-l' ) ) }
+    task_names = collection.task_names
+    for name in task_names:
+        contexts[ name ] = _survey_context_flags(
+            survey_task_arguments( collection[ name ] ) )
+    return dict(
+        listing = survey_listing( collection ),
+        contexts = contexts,
+        names = [
+            ( name, task_names[ name ] ) for name in sorted(
+                task_names, key = _calculate_task_name_sort_key ) ] )
+
+
+def _calculate_task_name_sort_key( name ):
+    ''' Sorts top-level tasks first and then by collection, as Invoke does. '''
+    parts = name.split( '.' )
+    return parts[ : -1 ], parts[ -1 ]
+
+
+def _probe_manifest_digest( location ):
+    from json import load
+    try:
+        with location.open( encoding = 'utf-8' ) as file:
+            return load( file ).get( 'digest' )
+    except ( OSError, ValueError ): return None
+
+
+def _survey_context_flags( arguments ):
+    ''' Surveys flags of task arguments and which of them take values. '''
+    arguments = sorted( arguments, key = lambda argument: argument.name )
+    names = [
+        *( flag for argument in arguments for flag in argument.flags ),
+        *( argument.inverse for argument in arguments if argument.inverse ) ]
+    return dict(
+        names = names,
+        known = names,
+        valued = [
+            flag for argument in arguments if bool is not argument.kind
+            for flag in argument.flags ] )
+
+
+_core_flags = (
+    '--complete', '--help', '-h', '--list', '-l', '--version', '-V', )
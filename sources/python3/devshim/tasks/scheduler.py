@@ -0,0 +1,343 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+''' Scheduling of tasks with deduplication and concurrent execution.
+
+    Prerequisites and postrequisites of tasks, along with nested task
+    invocations, form a dependency graph. Each node of the graph is a task
+    with its bound arguments. Depth-first traversal of the graph yields a
+    topological order of execution and each node executes at most once per
+    session. '''
+
+
+from .. import base as __
+
+
+# Keys of graph nodes which have completed during this session.
+# Shared with worker processes upon dispatch and merged upon return.
+completions = set( )
+
+
+class CallGroup:
+    ''' Group of independent task calls, which may execute concurrently. '''
+
+    def __init__( self, *calls, jobs = None ):
+        # TODO: Validate arguments.
+        self.calls = calls
+        self.jobs = jobs
+
+    def __iter__( self ): return iter( self.calls )
+
+    def __repr__( self ):
+        return "{class_name}( {calls} )".format(
+            class_name = type( self ).__qualname__,
+            calls = ', '.join( map( repr, self.calls ) ) )
+
+
+def concurrently( *calls, jobs = None ):
+    ''' Groups task calls for concurrent execution.
+
+        Intended for use in prerequisites and postrequisites of tasks.
+        Prerequisites of the grouped tasks execute beforehand, in the current
+        process. The grouped tasks then execute in a pool of worker processes
+        and their buffered outputs are rendered in the order of the calls. '''
+    return CallGroup( *calls, jobs = jobs )
+
+
+def calculate_node_key( invocable, posargs, nomargs, level = 'invocable' ):
+    ''' Calculates graph node key from invocable and its arguments.
+
+        Arguments are bound to the signature of the invocable and defaults
+        are applied, so that equivalent invocations have identical keys.
+        The level distinguishes whole tasks from their innermost invocables,
+        which share names. Returns ``None`` if the arguments cannot be
+        bound. '''
+    from inspect import signature as scan_signature
+    try: binder = scan_signature( invocable ).bind( *posargs, **nomargs )
+    except TypeError: return None
+    binder.apply_defaults( )
+    arguments = tuple(
+        ( name, _normalize_argument( argument ) )
+        for name, argument in binder.arguments.items( )
+        # Degree of concurrency does not change the result of a task.
+        if 'jobs' != name )
+    return (
+        level,
+        f"{invocable.__module__}.{invocable.__qualname__}",
+        repr( arguments ) )
+
+
+def execute_call( call ):
+    ''' Executes task call or group of task calls. '''
+    if isinstance( call, CallGroup ):
+        return execute_calls_concurrently( call.calls, jobs = call.jobs )
+    task, posargs, nomargs = _normalize_call( call )
+    return execute_task( task, *posargs, **nomargs )
+
+
+def execute_calls_concurrently( calls, jobs = None ):
+    ''' Executes task calls in pool of worker processes.
+
+        Prerequisites of each task execute first, in the current process, so
+        that shared prerequisites are only executed once. '''
+    from os import cpu_count
+    calls_ = tuple( map( _normalize_call, calls ) )
+    for task, _, _ in calls_:
+        for call in task.pre: execute_call( call )
+    payloads = tuple(
+        ( _derive_task_specifier( task ), posargs, nomargs, None )
+        for task, posargs, nomargs in calls_ )
+    if None is jobs: jobs = min( len( payloads ), cpu_count( ) or 1 )
+    results = tuple( dispatch_to_workers( payloads, jobs ) )
+    failures = tuple(
+        ( task, exit_code )
+        for ( task, _, _ ), exit_code in zip( calls_, results )
+        if exit_code )
+    if not failures: return
+    for task, exit_code in failures:
+        __.scribe.error(
+            f"Task {task.name!r} failed with exit code {exit_code}." )
+    raise SystemExit( failures[ 0 ][ 1 ] )
+
+
+def execute_task( task, *posargs, **nomargs ):
+    ''' Executes task along with its prerequisites and postrequisites.
+
+        Skips execution if the task has already executed with equivalent
+        arguments during this session. '''
+    key = calculate_node_key( task.body, posargs, nomargs, level = 'task' )
+    if None is not key and key in completions:
+        __.scribe.debug( f"Skipping completed task {task.name!r}." )
+        return
+    for call in task.pre: execute_call( call )
+    task( *posargs, **nomargs )
+    for call in task.post: execute_call( call )
+    if None is not key: completions.add( key )
+
+
+def invoke_task_invocable(
+    invocable, posargs, nomargs, title = '', supplement = None
+):
+    ''' Invokes innermost invocable of task, unless already completed.
+
+        Also skips invocation if the fingerprint of the declared inputs of
+        the task matches the one recorded after its last successful
+        invocation. Renders title, if supplied, noting any such skip. '''
+    from subprocess import CalledProcessError as SubprocessFailure # nosec B404
+    from ..telemetry import observe_task
+    from ..user_interface import render_boxed_title
+    from .fingerprints import (
+        calculate_fingerprint,
+        probe_fingerprint,
+        record_fingerprint,
+    )
+    key = calculate_node_key( invocable, posargs, nomargs )
+    if None is not key and key in completions:
+        __.scribe.debug(
+            f"Skipping completed invocation of {invocable.__name__!r}." )
+        return
+    fingerprint = calculate_fingerprint( invocable, posargs, nomargs )
+    if None is not fingerprint and probe_fingerprint( fingerprint ):
+        if title:
+            render_boxed_title( title, supplement = ': '.join( filter(
+                None, ( supplement, 'up to date' ) ) ) )
+        if None is not key: completions.add( key )
+        return
+    if title: render_boxed_title( title, supplement = supplement )
+    try:
+        with observe_task( invocable, variant = supplement ):
+            invocable( *posargs, **nomargs )
+    except SubprocessFailure as exc:
+        excc = type( exc )
+        __.scribe.error( f"{excc.__module__}.{excc.__qualname__}: {exc}" )
+        raise SystemExit( exc.returncode ) from exc
+    if None is not fingerprint: record_fingerprint( fingerprint )
+    if None is not key: completions.add( key )
+
+
+def invoke_task_invocable_concurrently( invocable, title, invocations, jobs ):
+    ''' Invokes multiplexed invocations in pool of worker processes.
+
+        Output from each invocation is buffered and then rendered as a block
+        under its title, in the order of the invocations. '''
+    specifier = ( invocable.__module__, invocable.__name__ )
+    payloads = tuple(
+        ( specifier, re_posargs, re_nomargs,
+          dict( title = title, supplement = value ) )
+        for value, re_posargs, re_nomargs in invocations )
+    values = tuple( value for value, _, _ in invocations )
+    results = tuple( dispatch_to_workers( payloads, jobs ) )
+    failures = tuple(
+        ( value, exit_code )
+        for value, exit_code in zip( values, results ) if exit_code )
+    if not failures: return
+    for value, exit_code in failures:
+        __.scribe.error(
+            f"Task {invocable.__name__!r} failed for {value!r} "
+            f"with exit code {exit_code}." )
+    raise SystemExit( failures[ 0 ][ 1 ] )
+
+
+def dispatch_to_workers( payloads, jobs ):
+    ''' Dispatches payloads to pool of worker processes.
+
+        Each payload is a tuple of task specifier, positional arguments,
+        nominative arguments, and invocation options. If invocation options
+        are supplied, then only the innermost invocable of the task is
+        invoked with them rather than the whole task being executed.
+
+        Completed graph nodes are shared with the workers and the nodes
+        completed by the workers are merged back. Captured output from each
+        payload is rendered in order of the payloads, as soon as it and its
+        predecessors have completed. Failures are reported as soon as they
+        occur. Yields exit code for each payload. '''
+    from concurrent.futures import (
+        FIRST_COMPLETED,
+        ProcessPoolExecutor as ProcessPool,
+        wait as wait_on_futures,
+    )
+    if 1 >= jobs:
+        for payload in payloads: yield _execute_payload( payload )
+        return
+    with ProcessPool( max_workers = jobs ) as pool:
+        completions_ = frozenset( completions )
+        futures = tuple(
+            pool.submit( _execute_captured_payload, payload, completions_ )
+            for payload in payloads )
+        indices = { future: index for index, future in enumerate( futures ) }
+        pending = set( futures )
+        replay_index = 0
+        while pending:
+            done, pending = wait_on_futures(
+                pending, return_when = FIRST_COMPLETED )
+            for future in done:
+                exit_code = future.result( )[ 0 ]
+                if exit_code and pending:
+                    __.scribe.error(
+                        "Task {label} failed with exit code {exit_code}. "
+                        "Awaiting completion of other tasks.".format(
+                            label = _derive_payload_label(
+                                payloads[ indices[ future ] ] ),
+                            exit_code = exit_code ) )
+            while replay_index < len( futures ):
+                future = futures[ replay_index ]
+                if not future.done( ): break
+                exit_code, output, completions__ = future.result( )
+                __.narration_target.write( output )
+                __.narration_target.flush( )
+                completions.update( completions__ )
+                replay_index += 1
+                yield exit_code
+
+
+def _derive_payload_label( payload ):
+    ( _, task_name ), _, _, invocation = payload
+    supplement = ( invocation or { } ).get( 'supplement' )
+    if None is supplement: return repr( task_name )
+    return f"{task_name!r} ({supplement})"
+
+
+def _derive_task_specifier( task ):
+    ''' Derives module name and attribute name by which task is found. '''
+    return task.body.__module__, task.body.__name__
+
+
+def _execute_captured_payload( payload, completions_ ):
+    ''' Executes payload with standard streams captured.
+
+        Intended for execution in a worker process. Returns exit code,
+        captured output from the execution and its subprocesses, and keys of
+        completed graph nodes. '''
+    from ..telemetry import activate as activate_telemetry
+    completions.update( completions_ )
+    activate_telemetry( )
+    with _capture_standard_streams( ) as capture:
+        exit_code = _execute_payload( payload )
+    return exit_code, capture.output, frozenset( completions )
+
+
+def _execute_payload( payload ):
+    ''' Executes payload and returns exit code. '''
+    from importlib import import_module
+    from .dispatcher import extract_task_invocable
+    ( module_name, task_name ), posargs, nomargs, invocation = payload
+    # nosemgrep: python.lang.security.audit.non-literal-import
+    task = getattr( import_module( module_name ), task_name )
+    try:
+        if None is not invocation:
+            invoke_task_invocable(
+                extract_task_invocable( task ), posargs, nomargs,
+                **invocation )
+        else: execute_task( task, *posargs, **nomargs )
+    except SystemExit as exc: return _normalize_exit_code( exc.code )
+    except Exception: # pylint: disable=broad-except
+        __.scribe.exception( f"Task {task_name!r} failed." )
+        return 1
+    return 0
+
+
+@__.context_manager
+def _capture_standard_streams( ):
+    ''' Redirects standard output and error streams to temporary file.
+
+        Redirection is by file descriptor, so that output from subprocesses
+        is also captured. Only safe to use in a process which has no other
+        threads writing to the standard streams.
+
+        Captured output is available from the ``output`` attribute of the
+        context object after the context exits. '''
+    from os import close, dup, dup2
+    from sys import stderr, stdout
+    from tempfile import TemporaryFile
+    capture = __.SimpleNamespace( output = '' )
+    with TemporaryFile( mode = 'w+' ) as file:
+        stdout.flush( ); stderr.flush( )
+        descriptors = { fd: dup( fd ) for fd in ( 1, 2 ) }
+        for fd in descriptors: dup2( file.fileno( ), fd )
+        try: yield capture
+        finally:
+            stdout.flush( ); stderr.flush( )
+            for fd, descriptor in descriptors.items( ):
+                dup2( descriptor, fd )
+                close( descriptor )
+            file.seek( 0 )
+            capture.output = file.read( )
+
+
+def _normalize_argument( argument ):
+    ''' Normalizes argument for comparison across invocations. '''
+    if isinstance( argument, ( list, tuple ) ):
+        return tuple( map( _normalize_argument, argument ) )
+    return argument
+
+
+def _normalize_call( call ):
+    ''' Normalizes task or call into task and its arguments. '''
+    if hasattr( call, 'task' ):
+        return call.task, tuple( call.args ), dict( call.kwargs )
+    return call, ( ), { }
+
+
+def _normalize_exit_code( code ):
+    ''' Normalizes exit code, as would the interpreter upon exit. '''
+    if None is code: return 0
+    if isinstance( code, int ): return code
+    __.eprint( code )
+    return 1
+
@@ -0,0 +1,202 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+''' Timing telemetry for tasks and subprocesses.
+
+    Wall time, CPU time, and exit code of each task invocation and each
+    subprocess are recorded as JSON lines in an event log for the session.
+    When the session concludes, the event log is converted into a trace,
+    which can be loaded into Perfetto (https://ui.perfetto.dev) or the Chrome
+    trace viewer (chrome://tracing).
+
+    Worker processes join the session of their parent via an environment
+    variable and record into the same event log.
+
+    Set the ``DEVSHIM_TELEMETRY`` environment variable to ``off`` to disable
+    recording. '''
+
+
+from . import base as __
+
+
+# Number of most recent sessions to retain.
+sessions_maximum = 20
+
+
+def activate( ):
+    ''' Activates telemetry for current session, if enabled.
+
+        Joins session inherited from parent process, if there is one. Else,
+        creates new session. Returns identifier of session or ``None``, if
+        telemetry is disabled. '''
+    if 'off' == __.view_environment_entry( ( 'telemetry', ) ): return None
+    name = __.derive_environment_entry_name( 'telemetry', 'session' )
+    session = __.current_process_environment.get( name )
+    if None is session:
+        from datetime import datetime as DateTime
+        from os import getpid
+        session = f"{DateTime.now( ):%Y%m%dT%H%M%S}-{getpid( )}"
+        __.current_process_environment[ name ] = session
+    if observe_subprocess not in __.subprocess_observers:
+        __.subprocess_observers.append( observe_subprocess )
+    return session
+
+
+@__.context_manager
+def establish_session( ):
+    ''' Establishes telemetry session for duration of context.
+
+        If the session is created, rather than inherited, then it is
+        concluded upon exit from the context. This includes export of the
+        trace and pruning of old sessions. '''
+    inherited = None is not _view_session( )
+    session = activate( )
+    try: yield session
+    finally:
+        if None is not session and not inherited:
+            export_trace( session )
+            _prune_sessions( )
+
+
+def export_trace( session ):
+    ''' Exports event log of session as trace in Chrome JSON format. '''
+    from json import dump, loads
+    from os import replace
+    from .data import paths
+    log_location = _derive_log_location( paths, session )
+    if not log_location.exists( ): return None
+    with log_location.open( encoding = 'utf-8' ) as file:
+        events = tuple( map( loads, filter( None, file ) ) )
+    trace_events = [ ]
+    for event in events:
+        trace_events.append( dict(
+            name = event[ 'name' ], cat = event[ 'category' ], ph = 'X',
+            ts = event[ 'start' ], dur = event[ 'duration' ],
+            pid = event[ 'pid' ], tid = event[ 'tid' ],
+            args = dict(
+                cpu_time = event[ 'cpu_time' ],
+                exit_code = event[ 'exit_code' ],
+                **event[ 'details' ] ) ) )
+    trace_location = log_location.with_suffix( '.trace.json' )
+    temporary_location = trace_location.with_suffix( '.partial' )
+    with temporary_location.open( 'w', encoding = 'utf-8' ) as file:
+        dump(
+            dict( traceEvents = trace_events, displayTimeUnit = 'ms' ), file )
+    replace( temporary_location, trace_location )
+    return trace_location
+
+
+@__.context_manager
+def observe_subprocess( command_specification ):
+    ''' Records telemetry for execution of subprocess. '''
+    from pathlib import Path
+    with _observe(
+        'subprocess', Path( command_specification[ 0 ] ).name,
+        dict( command = ' '.join( command_specification ) ),
+    ): yield
+
+
+@__.context_manager
+def observe_task( invocable, variant = None ):
+    ''' Records telemetry for invocation of task.
+
+        Variant is the value supplied by the multiplexer, if any, such as a
+        Python version. '''
+    details = { } if None is variant else dict( variant = str( variant ) )
+    with _observe( 'task', invocable.__name__, details ): yield
+
+
+def _derive_log_location( paths, session ):
+    return paths.state.DEV.telemetry / f"{session}.jsonl"
+
+
+def _measure_cpu_time( ):
+    ''' Measures CPU time of current process and its reaped children. '''
+    from os import times
+    times_ = times( )
+    return dict(
+        self = times_.user + times_.system,
+        children = times_.children_user + times_.children_system )
+
+
+@__.context_manager
+def _observe( category, name, details ):
+    ''' Records wall time, CPU time, and exit code of context. '''
+    session = _view_session( )
+    if None is session:
+        yield
+        return
+    from subprocess import CalledProcessError as SubprocessFailure # nosec B404
+    from time import perf_counter_ns, time_ns
+    started = time_ns( ) // 1000
+    started_counter = perf_counter_ns( )
+    cpu_time = _measure_cpu_time( )
+    exit_code = 0
+    try: yield
+    except SubprocessFailure as exc:
+        exit_code = exc.returncode
+        raise
+    except SystemExit as exc:
+        exit_code = exc.code if isinstance( exc.code, int ) else 1
+        raise
+    except BaseException:
+        exit_code = 1
+        raise
+    finally:
+        duration = ( perf_counter_ns( ) - started_counter ) // 1000
+        cpu_time_ = _measure_cpu_time( )
+        _record_event( session, dict(
+            category = category, name = name,
+            start = started, duration = duration,
+            cpu_time = {
+                key: round( cpu_time_[ key ] - cpu_time[ key ], 6 )
+                for key in cpu_time },
+            exit_code = exit_code,
+            details = details ) )
+
+
+def _prune_sessions( ):
+    ''' Removes files for all but the most recent sessions. '''
+    from .data import paths
+    location = paths.state.DEV.telemetry
+    if not location.exists( ): return
+    sessions = sorted( path.stem for path in location.glob( '*.jsonl' ) )
+    for session in sessions[ : -sessions_maximum ]:
+        for path in location.glob( f"{session}.*" ): path.unlink( )
+
+
+def _record_event( session, event ):
+    ''' Appends event to log of session. '''
+    from json import dumps
+    from os import getpid
+    from threading import get_ident
+    from .data import paths
+    from .fs_utilities import ensure_directory
+    location = _derive_log_location( paths, session )
+    ensure_directory( location.parent )
+    event.update( pid = getpid( ), tid = get_ident( ) )
+    # Single write of whole line in append mode,
+    # so that concurrent processes do not interleave records.
+    with location.open( 'a', encoding = 'utf-8' ) as file:
+        file.write( dumps( event ) + '\n' )
+
+
+def _view_session( ):
+    if 'off' == __.view_environment_entry( ( 'telemetry', ) ): return None
+    return __.view_environment_entry( ( 'telemetry', 'session' ) )
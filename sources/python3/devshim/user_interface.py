@@ -191,8 +191,28 @@ invocation_code_table = __.DictionaryProxy( {
         }}''',
 } )
 
+# Candidates are answered from the tasks manifest, when it is current.
 completion_code_table = __.DictionaryProxy( {
-    # TODO: Implement.
+    'bash': '''
+        function _complete_{function_name} {{
+            local candidates
+            candidates="$({function_name} --complete -- ${{COMP_WORDS[*]}})"
+            COMPREPLY=( $(compgen -W "${{candidates}}" -- "$2") )
+        }}
+        complete -F _complete_{function_name} -o default {function_name}''',
+    'fish': '''
+        function __complete_{function_name}
+            {function_name} --complete -- (commandline --tokenize)
+        end
+        complete --command {function_name} --no-files \\
+            --arguments "(__complete_{function_name})"''',
+    'zsh': '''
+        function _complete_{function_name} {{
+            local -a words
+            read -cA words
+            reply=( $({function_name} --complete -- ${{words}}) )
+        }}
+        compctl -K _complete_{function_name} + -f {function_name}''',
 } )
 
 # TODO? direnv configuration snippets to allow devshim to operate
@@ -0,0 +1,154 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+
+
+''' Assert behaviors of HTTP retrievals against local server. '''
+
+
+from contextlib import contextmanager as _context_manager
+from hashlib import sha256 as _sha256
+from importlib import import_module as _import_module
+http_utilities = _import_module( 'devshim.http_utilities' )
+
+
+_content = bytes( range( 256 ) ) * 1024
+_digest = f"sha256:{_sha256( _content ).hexdigest( )}"
+_etag = '"v1"'
+
+
+@_context_manager
+def _serve( drop_first = False ):
+    ''' Serves content with entity tag and ranges. Yields URL and log.
+
+        Log entries are conditional headers of requests and statuses of
+        responses. First response may be dropped midway. '''
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    from threading import Thread
+    log = [ ]
+    state = dict( drop = drop_first )
+
+    class Handler( BaseHTTPRequestHandler ):
+        ''' Responds with content, honoring conditions and ranges. '''
+
+        protocol_version = 'HTTP/1.1'
+
+        def do_GET( self ): # pylint: disable=invalid-name
+            ''' Responds to GET request. '''
+            headers = self.headers
+            offset = 0
+            if _etag == headers.get( 'If-None-Match' ): status = 304
+            elif headers.get( 'Range' ) and _etag == headers.get( 'If-Range' ):
+                status = 206
+                offset = int( headers[ 'Range' ][ 6 : ].rstrip( '-' ) )
+            else: status = 200
+            log.append( (
+                headers.get( 'If-None-Match' ), headers.get( 'Range' ),
+                status ) )
+            body = b'' if 304 == status else _content[ offset : ]
+            self.send_response( status )
+            self.send_header( 'ETag', _etag )
+            if 206 == status:
+                self.send_header( 'Content-Range', "bytes {}-{}/{}".format(
+                    offset, len( _content ) - 1, len( _content ) ) )
+            self.send_header( 'Content-Length', str( len( body ) ) )
+            self.end_headers( )
+            if state[ 'drop' ]:
+                state[ 'drop' ] = False
+                self.wfile.write( body[ : len( body ) // 3 ] )
+                self.close_connection = True
+                return
+            self.wfile.write( body )
+
+        def log_message( self, format, *args ): # pylint: disable=redefined-builtin
+            pass
+
+    with ThreadingHTTPServer( ( '127.0.0.1', 0 ), Handler ) as server:
+        Thread( target = server.serve_forever, daemon = True ).start( )
+        try:
+            yield f"http://127.0.0.1:{server.server_address[ 1 ]}/x", log
+        finally: server.shutdown( )
+
+
+def test_010_not_modified( tmp_path ):
+    ''' Repeated retrieval is conditioned upon recorded entity tag. '''
+    location = tmp_path / 'content'
+    with _serve( ) as ( url, log ):
+        http_utilities.retrieve_url( url, location )
+        assert _content == location.read_bytes( )
+        inode = location.stat( ).st_ino
+        http_utilities.retrieve_url( url, location )
+    assert [ ( None, None, 200 ), ( _etag, None, 304 ) ] == log
+    assert _content == location.read_bytes( )
+    assert inode == location.stat( ).st_ino
+
+
+def test_020_resumption( tmp_path ):
+    ''' Dropped retrieval resumes from end of partial file. '''
+    location = tmp_path / 'content'
+    with _serve( drop_first = True ) as ( url, log ):
+        http_utilities.retrieve_url( url, location, digest = _digest )
+    assert 2 == len( log )
+    assert 200 == log[ 0 ][ 2 ]
+    assert 206 == log[ 1 ][ 2 ]
+    assert 'bytes=0-' != log[ 1 ][ 1 ]
+    assert _content == location.read_bytes( )
+    assert [ location.name, f"{location.name}.validators" ] == sorted(
+        path.name for path in tmp_path.iterdir( ) )
+
+
+def test_030_digest( tmp_path ):
+    ''' Files with expected digests are kept. Others are retrieved anew. '''
+    location = tmp_path / 'content'
+    with _serve( ) as ( url, log ):
+        http_utilities.retrieve_url( url, location, digest = _digest )
+        http_utilities.retrieve_url( url, location, digest = _digest )
+        assert 1 == len( log )
+        location.write_bytes( b'tampered' )
+        http_utilities.retrieve_url( url, location, digest = _digest )
+        # Tampered file must not be validated by recorded entity tag.
+        assert ( None, None, 200 ) == log[ -1 ]
+        assert _content == location.read_bytes( )
+        location_ = tmp_path / 'mismatch'
+        try:
+            http_utilities.retrieve_url(
+                url, location_, digest = f"sha256:{'0' * 64}" )
+        except ValueError: pass
+        else: assert False, 'Expected digest mismatch.'
+        assert not location_.exists( )
+
+
+def test_040_connections_forgotten_after_fork( tmp_path ):
+    ''' Forked processes do not inherit idle connections. '''
+    # pylint: disable=protected-access
+    import os
+    from pytest import skip
+    if not hasattr( os, 'register_at_fork' ): skip( 'Platform cannot fork.' )
+    with _serve( ) as ( url, _ ):
+        http_utilities.retrieve_url( url, tmp_path / 'content' )
+        assert http_utilities._connections
+        reader, writer = os.pipe( )
+        pid = os.fork( )
+        if not pid:
+            count = len( http_utilities._connections )
+            os.write( writer, str( count ).encode( ) )
+            os._exit( 0 )
+        os.waitpid( pid, 0 )
+        assert b'0' == os.read( reader, 16 )
+        assert http_utilities._connections
@@ -0,0 +1,159 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+
+''' Assert behaviors of Python packages management. '''
+
+
+from importlib import import_module as _import_module
+packages = _import_module( 'devshim.packages' )
+
+
+def test_010_recorded_fixtures_complete( ):
+    ''' Recorded fixtures cover raw requirements for every identifier. '''
+    # pylint: disable=protected-access
+    identifiers = packages._summon_python_packages_fixtures_index( )
+    assert identifiers
+    for identifier in identifiers:
+        raw, frozen, unpublished = packages._generate_pip_requirements(
+            identifier = identifier )
+        assert frozen
+        assert packages._are_fixtures_complete( raw, frozen, unpublished )
+
+
+_legacy_fixtures = '''
+[["cpython-3.11.11--linux-64bit--x86_64"]]
+name = "alpha"
+version = "1.0"
+digests = [ "sha256:00" ]
+
+[["cpython-3.11.11--linux-64bit--x86_64"]]
+name = "beta"
+url = "git+https://example.com/beta.git@main"
+
+[["pypy-3.10.14-7.3.17--linux-64bit--x86_64"]]
+name = "alpha"
+version = "1.1"
+digests = [ "sha256:11", "sha256:22" ]
+'''
+
+_migration_script = '''
+from json import dumps
+from devshim import packages
+from devshim.data import paths
+from devshim.fs_utilities import summon_toml
+packages._migrate_python_packages_fixtures( )
+print( dumps( dict(
+    index = packages._summon_python_packages_fixtures_index( ),
+    legacy = paths.configuration.pypackages_fixtures_legacy.exists( ),
+    shards = {
+        location.name: summon_toml( location )
+        for location
+        in paths.configuration.pypackages_fixtures.glob( '*.toml' ) } ) ) )
+'''
+
+
+def test_020_fixtures_shards_migration( tmp_path ):
+    ''' Legacy fixtures file is split into equivalent shards. '''
+    # Locations are immutable within this process. So, migrate synthetic
+    # fixtures of a synthetic project in another process.
+    from json import loads
+    from os import environ
+    from pathlib import Path
+    from subprocess import run # nosec B404
+    from sys import executable
+    from tomli import loads as load_toml
+    from devshim.base import derive_environment_entry_name
+    ( tmp_path / 'pyproject.toml' ).write_text(
+        "[project]\nname = 'sample'\nversion = '1.0'\n"
+        "[tool.setuptools]\n[tool.SELF]\n" )
+    configuration_location = tmp_path / '.local/configuration'
+    configuration_location.mkdir( parents = True )
+    ( configuration_location / 'pypackages.fixtures.toml' ).write_text(
+        _legacy_fixtures )
+    environment = dict( environ )
+    environment[ derive_environment_entry_name( 'project', 'location' ) ] = (
+        str( tmp_path ) )
+    # Packages are importable already. Do not assemble cohort for project.
+    environment.pop(
+        derive_environment_entry_name( 'packages', 'cohort' ), None )
+    environment[ 'PYTHONPATH' ] = str(
+        Path( packages.__file__ ).parent.parent )
+    result = loads( run( # nosec B603
+        ( executable, '-c', _migration_script ),
+        capture_output = True, check = True, cwd = tmp_path,
+        env = environment, text = True,
+    ).stdout )
+    assert not result[ 'legacy' ]
+    expected = load_toml( _legacy_fixtures )
+    assert {
+        identifier: f"{identifier}.toml" for identifier in expected
+    } == result[ 'index' ]
+    assert { 'index.toml', *result[ 'index' ].values( ) } == set(
+        result[ 'shards' ] )
+    for identifier, fixtures in expected.items( ):
+        assert dict( fixtures = fixtures ) == (
+            result[ 'shards' ][ f"{identifier}.toml" ] )
+
+
+def _produce_distribution_metadata( site_location, name, version, direct_url ):
+    from json import dumps
+    location = site_location / f"{name}-{version}.dist-info"
+    location.mkdir( )
+    ( location / 'METADATA' ).write_text(
+        f"Metadata-Version: 2.1\nName: {name}\nVersion: {version}\n" )
+    ( location / 'RECORD' ).write_text( '' )
+    if direct_url:
+        ( location / 'direct_url.json' ).write_text( dumps( direct_url ) )
+
+
+def test_030_survey_matches_pip_freeze( tmp_path ):
+    ''' Survey of virtual environment reports what Pip freezes. '''
+    # pylint: disable=protected-access
+    from subprocess import run # nosec B404
+    from venv import EnvBuilder
+    from pytest import importorskip
+    importorskip( 'ensurepip' )
+    from devshim.environments import generate_venv_executable_location
+    venv_location = tmp_path / 'venv'
+    EnvBuilder( with_pip = True ).create( venv_location )
+    site_location = packages._survey_venv_site_packages_locations(
+        venv_location )[ 0 ]
+    for name, version, direct_url in (
+        ( 'Foo_Bar', '1.2', None ),
+        ( 'baz', '1.0', dict(
+            url = 'file:///tmp/baz-1.0.tar.gz',
+            archive_info = dict( hash = f"sha256={'0' * 64}" ) ) ),
+        ( 'qux', '2.0', dict(
+            url = 'https://example.com/qux.git',
+            vcs_info = dict( vcs = 'git', commit_id = 'a' * 40 ) ) ),
+    ): _produce_distribution_metadata(
+        site_location, name, version, direct_url )
+    python_location = generate_venv_executable_location(
+        'python', venv_path = venv_location )
+    frozen = run( # nosec B603
+        ( str( python_location ), '-m', 'pip', 'freeze' ),
+        capture_output = True, check = True, text = True,
+    ).stdout.splitlines( )
+    surveyed = [
+        str( entry.requirement )
+        for entry in packages._survey_current_python_packages(
+            venv_location ) ]
+    assert 3 == len( surveyed )
+    assert sorted( frozen ) == sorted( surveyed )
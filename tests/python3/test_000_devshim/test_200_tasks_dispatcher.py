@@ -0,0 +1,99 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+
+
+''' Assert behaviors of parser for command-line task invocations. '''
+
+
+from importlib import import_module as _import_module
+dispatcher = _import_module( 'devshim.tasks.dispatcher' )
+tasks = _import_module( 'devshim.tasks' )
+
+
+def _parse( *arguments ):
+    return dispatcher.parse_arguments( tasks.namespace, arguments )
+
+
+def test_010_core_flags( ):
+    ''' Core flags precede tasks and may take values. '''
+    core, calls = _parse( '-V' )
+    assert core[ 'version' ]
+    assert not calls
+    core, calls = _parse( '--list', 'lint' )
+    assert 'lint' == core[ 'list' ]
+    assert not calls
+    core, calls = _parse( '--help=lint.pylint' )
+    assert 'lint.pylint' == core[ 'help' ]
+
+
+def test_020_positional_arguments( ):
+    ''' Bare tokens fill positional arguments before flags or after. '''
+    _, calls = _parse( 'run', 'echo hi', '-v', 'cpython-3.11' )
+    assert 1 == len( calls )
+    assert tasks.run is calls[ 0 ].task
+    assert dict(
+        command = 'echo hi', version = 'cpython-3.11' ) == calls[ 0 ].kwargs
+    _, calls = _parse( 'run', '--version=cpython-3.11', 'echo hi' )
+    assert 'echo hi' == calls[ 0 ].kwargs[ 'command' ]
+
+
+def test_021_missing_positional_argument( ):
+    ''' Absence of required positional argument is reported. '''
+    try: _parse( 'run' )
+    except SystemExit as exc: assert "'command'" in str( exc )
+    else: assert False, 'Expected exit.'
+
+
+def test_030_repeated_flags( ):
+    ''' Repeated flags of iterable arguments accumulate values. '''
+    _, calls = _parse( 'lint.pylint', '-t', 'a.py', '--targets=b.py' )
+    assert [ 'a.py', 'b.py' ] == calls[ 0 ].kwargs[ 'targets' ]
+    assert [ ] == calls[ 0 ].kwargs[ 'checks' ]
+
+
+def test_040_jobs( ):
+    ''' Multiplexed tasks accept number of jobs as integer. '''
+    _, calls = _parse( 'lint.pylint', '--jobs', '2' )
+    assert 2 == calls[ 0 ].kwargs[ 'jobs' ]
+    _, calls = _parse( 'test', '-j', '3' )
+    assert 3 == calls[ 0 ].kwargs[ 'jobs' ]
+    try: _parse( 'test', '--jobs=many' )
+    except SystemExit as exc: assert 'many' in str( exc )
+    else: assert False, 'Expected exit.'
+
+
+def test_050_multiple_tasks( ):
+    ''' Excess bare tokens name further tasks, which receive own flags. '''
+    _, calls = _parse(
+        'lint.pylint', '-t', 'a.py', 'lint.mypy', '--files=b.py',
+        'run', 'true' )
+    assert (
+        tasks.lint_pylint, tasks.lint_mypy, tasks.run,
+    ) == tuple( call.task for call in calls )
+    assert [ 'a.py' ] == calls[ 0 ].kwargs[ 'targets' ]
+    assert [ 'b.py' ] == calls[ 1 ].kwargs[ 'files' ]
+    assert 'true' == calls[ 2 ].kwargs[ 'command' ]
+
+
+def test_060_remainder( ):
+    ''' Tokens after double dash are remainder rather than tasks. '''
+    core, calls = _parse( 'lint', '--', 'run', '-x' )
+    assert ( 'run', '-x' ) == core[ 'remainder' ]
+    assert 1 == len( calls )
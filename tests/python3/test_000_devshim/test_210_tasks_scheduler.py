@@ -0,0 +1,109 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+
+
+''' Assert behaviors of scheduler for task graphs. '''
+
+
+from contextlib import contextmanager as _context_manager
+from functools import wraps as _wraps
+from importlib import import_module as _import_module
+dispatcher = _import_module( 'devshim.tasks.dispatcher' )
+scheduler = _import_module( 'devshim.tasks.scheduler' )
+
+
+_invocations = [ ]
+
+
+def _record( subject, flavor = 'plain', jobs = 1 ): # pylint: disable=unused-argument
+    ''' Records invocation. '''
+    _invocations.append( subject )
+
+
+@_context_manager
+def _session( ):
+    ''' Clears invocations and forgets completions from within session. '''
+    completions = frozenset( scheduler.completions )
+    _invocations.clear( )
+    try: yield
+    finally:
+        scheduler.completions.clear( )
+        scheduler.completions.update( completions )
+
+
+def _wrap( invocable ):
+    ''' Wraps invocable as task decorator does. '''
+
+    @_wraps( invocable )
+    def invoker( *posargs, **nomargs ):
+        scheduler.invoke_task_invocable( invocable, posargs, nomargs )
+
+    return invoker
+
+
+def test_010_equivalent_node_keys( ):
+    ''' Bound arguments with defaults determine node keys. '''
+    key = scheduler.calculate_node_key( _record, ( 'a', ), { } )
+    assert key == scheduler.calculate_node_key(
+        _record, ( ), dict( subject = 'a', flavor = 'plain' ) )
+    assert key == scheduler.calculate_node_key(
+        _record, ( 'a', ), dict( jobs = 4 ) )
+    assert key != scheduler.calculate_node_key( _record, ( 'b', ), { } )
+    assert key != scheduler.calculate_node_key(
+        _record, ( 'a', 'fancy' ), { } )
+    assert key != scheduler.calculate_node_key(
+        _record, ( 'a', ), { }, level = 'task' )
+    assert None is scheduler.calculate_node_key(
+        _record, ( ), dict( color = 'red' ) )
+
+
+def test_020_deduplicated_execution( ):
+    ''' Equivalent executions of task occur only once per session. '''
+    task = dispatcher.Task( _record )
+    with _session( ):
+        scheduler.execute_task( task, 'a' )
+        scheduler.execute_task( task, subject = 'a', flavor = 'plain' )
+        scheduler.execute_task( task, 'b' )
+        scheduler.execute_task( task, 'b' )
+        assert [ 'a', 'b' ] == _invocations
+
+
+def test_030_shared_prerequisite( ):
+    ''' Prerequisite shared by several tasks executes only once. '''
+    prerequisite = dispatcher.Task( _record )
+    call = dispatcher.call( prerequisite, 'shared' )
+    tasks = tuple(
+        dispatcher.Task( _record, pre = ( call, ) ) for _ in range( 2 ) )
+    with _session( ):
+        scheduler.execute_task( tasks[ 0 ], 'first' )
+        scheduler.execute_task( tasks[ 1 ], 'second' )
+        assert [ 'shared', 'first', 'second' ] == _invocations
+
+
+def test_040_task_after_invocable( ):
+    ''' Completed invocable does not complete whole task. '''
+    postrequisite = dispatcher.Task( _record )
+    task = dispatcher.Task(
+        _wrap( _record ),
+        post = ( dispatcher.call( postrequisite, 'post' ), ) )
+    with _session( ):
+        scheduler.invoke_task_invocable( _record, ( 'a', ), { } )
+        scheduler.execute_task( task, 'a' )
+        assert [ 'a', 'post' ] == _invocations
@@ -0,0 +1,81 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+
+
+''' Assert behaviors of fingerprints for skipping of up-to-date tasks. '''
+
+
+from importlib import import_module as _import_module
+fingerprints = _import_module( 'devshim.tasks.fingerprints' )
+scheduler = _import_module( 'devshim.tasks.scheduler' )
+
+
+_invocations = [ ]
+
+
+def _record( subject ):
+    ''' Records invocation. '''
+    _invocations.append( subject )
+
+
+def _invoke( subject ):
+    scheduler.invoke_task_invocable( _record, ( subject, ), { } )
+    # Forget completion, so that only the fingerprint can skip invocation.
+    scheduler.completions.discard(
+        scheduler.calculate_node_key( _record, ( subject, ), { } ) )
+
+
+def test_010_skip_and_rerun( tmp_path ):
+    ''' Invocations with unchanged inputs are skipped. Others are not. '''
+    input_location = tmp_path / 'input.txt'
+    input_location.write_text( 'alpha' )
+    fingerprints.register_inputs(
+        _record, ( input_location, lambda arguments: tmp_path.name ) )
+    # Location of fingerprint depends on invocation but not on inputs.
+    locations = tuple(
+        fingerprints.calculate_fingerprint( _record, ( subject, ), { } )[ 0 ]
+        for subject in ( 'a', 'b' ) )
+    _invocations.clear( )
+    try:
+        _invoke( 'a' )
+        _invoke( 'a' )
+        assert [ 'a' ] == _invocations
+        _invoke( 'b' )
+        assert [ 'a', 'b' ] == _invocations
+        input_location.write_text( 'beta' )
+        _invoke( 'a' )
+        _invoke( 'a' )
+        assert [ 'a', 'b', 'a' ] == _invocations
+    finally:
+        fingerprints.inputs_registry.pop(
+            fingerprints._derive_invocable_fqname( _record ), None ) # pylint: disable=protected-access
+        for location in locations:
+            if location.exists( ): location.unlink( )
+
+
+def test_020_unbindable_arguments( ):
+    ''' Fingerprint is absent for arguments which cannot be bound. '''
+    fingerprints.register_inputs( _record, ( 'README.*', ) )
+    try:
+        assert None is fingerprints.calculate_fingerprint(
+            _record, ( ), dict( color = 'red' ) )
+    finally:
+        fingerprints.inputs_registry.pop(
+            fingerprints._derive_invocable_fqname( _record ), None ) # pylint: disable=protected-access